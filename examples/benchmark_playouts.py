@@ -0,0 +1,50 @@
+"""
+Benchmark: random playouts per second on the demo Gardevoir/Mewtwo decks.
+
+Usage: python examples/benchmark_playouts.py [number of playouts]
+"""
+
+import copy
+import random
+import sys
+import time
+
+from pokepocketsim import Card, Deck, Item, Match, Player
+from pokepocketsim.engine import playout
+from pokepocketsim.utils import config
+
+
+def create_deck() -> Deck:
+    deck = Deck(energy_types=["psychic"])
+    deck.add(Card.create_card("Ralts"))
+    deck.add(Card.create_card("Kirlia"))
+    deck.add(Card.create_card("Gardevoir"))
+    deck.add(Card.create_card("Mewtwo EX"))
+    deck.add(Item.Potion)
+    deck.add(Item.Potion)
+    return deck
+
+
+def main() -> None:
+    config.gui_enabled = False
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    template = Match(Player("p1", create_deck()), Player("p2", create_deck()))
+    rng = random.Random(0)
+    wins = [0, 0]
+    turns = 0
+
+    start = time.perf_counter()
+    for _ in range(n):
+        result = playout(copy.deepcopy(template), rng=rng)
+        if result.winner is not None:
+            wins[result.winner] += 1
+        turns += result.turns
+    elapsed = time.perf_counter() - start
+
+    print(f"{n} playouts in {elapsed:.2f}s: {n / elapsed:.0f} playouts/sec")
+    print(f"Wins: p1 {wins[0]}, p2 {wins[1]}, average turns {turns / n:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,76 @@
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
 # New exports for state-based architecture
-from . import engine, state
+from . import engine, search, state
+from .bots import Bot, parse_bot
 from .core import Card, Deck, Match, Player
 from .mechanics import Ability, Action, Attack, EnergyType, Item
 
+if TYPE_CHECKING:
+    from .batch import (
+        BatchResult,
+        CandidateComparison,
+        WinRateEstimate,
+        compare_candidates,
+        estimate_winrate,
+        play_many,
+        replay_game,
+    )
+    from .env import Env, VecEnv
+    from .ladder import Ladder
+    from .matchups import MatchupCache, MatchupMatrix, matchup_matrix, play_matchup
+    from .optimizer import DeckGenome, DeckOptimizer, OptimizationResult
+    from .regression import SPRTResult, sprt
+
+# The simulation tools are loaded on first use, so importing the engine does not import them
+_LAZY_EXPORTS: Dict[str, str] = {
+    "BatchResult": "batch",
+    "CandidateComparison": "batch",
+    "WinRateEstimate": "batch",
+    "compare_candidates": "batch",
+    "estimate_winrate": "batch",
+    "play_many": "batch",
+    "replay_game": "batch",
+    "Env": "env",
+    "VecEnv": "env",
+    "Ladder": "ladder",
+    "MatchupCache": "matchups",
+    "MatchupMatrix": "matchups",
+    "matchup_matrix": "matchups",
+    "play_matchup": "matchups",
+    "DeckGenome": "optimizer",
+    "DeckOptimizer": "optimizer",
+    "OptimizationResult": "optimizer",
+    "SPRTResult": "regression",
+    "sprt": "regression",
+}
+
 __all__ = [
     "engine",
+    "search",
     "state",
+    "BatchResult",
+    "CandidateComparison",
+    "compare_candidates",
+    "WinRateEstimate",
+    "estimate_winrate",
+    "play_many",
+    "replay_game",
+    "Ladder",
+    "MatchupCache",
+    "MatchupMatrix",
+    "matchup_matrix",
+    "play_matchup",
+    "DeckGenome",
+    "DeckOptimizer",
+    "OptimizationResult",
+    "Bot",
+    "parse_bot",
+    "Env",
+    "VecEnv",
+    "SPRTResult",
+    "sprt",
     "Card",
     "Deck",
     "Match",
@@ -16,3 +81,15 @@ __all__ = [
     "EnergyType",
     "Item",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(f".{_LAZY_EXPORTS[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,795 @@
+"""
+Batch runner: play many games between two decks and aggregate the results.
+
+Games are played in playout mode, so nothing is printed or collected per game, and only running
+totals are kept, which makes the memory use independent of the number of games. Every game is
+played from its own seed, derived from the batch seed and the index of the game, so any game of
+a batch can be replayed on its own with replay_game.
+
+Paired batches reduce the variance of comparisons. Games 2k and 2k + 1 are the same game with the
+seats swapped, and each side of a game draws its deck order and its energies from its own
+random stream, so candidates evaluated with the same seed face the same draws (common random
+numbers).
+"""
+
+import pickle
+import random
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from .core.deck import Deck
+from .core.match import Match
+from .core.player import Player
+from .engine.playout import MAX_TURNS, Policy, playout
+from .stats import Z_95, CardCounter, Histogram, RunningStats, WinRate
+from .utils import config
+
+if TYPE_CHECKING:
+    from .bots import Bot
+
+# The bots of deck A and deck B, None plays both with the policy
+Bots = Optional[Tuple["Bot", "Bot"]]
+
+# Games per batch seed before the game seeds of two batch seeds could overlap
+_GAMES_PER_SEED = 1 << 40
+
+# Bins of the turn histogram, one per turn: games stop after MAX_TURNS turns without a winner
+_TURN_BINS = MAX_TURNS + 1
+
+# Bins of the points histograms, one per point: an EX knocked out at 2 points makes 4
+_POINT_BINS = 5
+
+# Chunks submitted to the pool per worker and not merged yet
+_IN_FLIGHT_PER_WORKER = 2
+
+# Random streams of a paired game: policy, engine, deck order and energies of both sides
+_PAIRED_STREAMS = 6
+
+
+def game_seed(seed: int, index: int) -> int:
+    """The seed of the game with the given index in a batch played with the given seed."""
+    return seed * _GAMES_PER_SEED + index
+
+
+@dataclass
+class BatchResult:
+    """
+    Aggregated results of a batch of games between deck A and deck B.
+
+    Deck A starts the games with an even index, deck B the games with an odd index.
+
+    Attributes:
+        seed (int): The seed of the batch, see game_seed.
+        games (int): The number of games played.
+        wins (List[int]): The wins of deck A and deck B.
+        unfinished (int): The games stopped at the turn limit without a winner.
+        seat_wins (List[int]): The wins of the starting and the second player.
+        turns (Histogram): Histogram of the number of turns of the games.
+        points (List[Histogram]): Histograms of the final points of deck A and deck B.
+        turn_stats (RunningStats): Mean and variance of the number of turns.
+        cards_in_play (List[CardCounter]): Per deck, how often every card was in play at the
+            end of a game.
+        cards_in_play_won (List[CardCounter]): The same, counting only the games the deck won.
+        pair_scores (RunningStats): In paired batches, deck A's average score over the two
+            seats of every pair of games (1 for a win, 0.5 for an unfinished game).
+    """
+
+    seed: int = 0
+    games: int = 0
+    wins: List[int] = field(default_factory=lambda: [0, 0])
+    unfinished: int = 0
+    seat_wins: List[int] = field(default_factory=lambda: [0, 0])
+    turns: Histogram = field(default_factory=lambda: Histogram(0, _TURN_BINS, _TURN_BINS))
+    points: List[Histogram] = field(
+        default_factory=lambda: [Histogram(0, _POINT_BINS, _POINT_BINS) for _ in range(2)]
+    )
+    turn_stats: RunningStats = field(default_factory=RunningStats, compare=False)
+    cards_in_play: List[CardCounter] = field(
+        default_factory=lambda: [CardCounter(), CardCounter()], compare=False
+    )
+    cards_in_play_won: List[CardCounter] = field(
+        default_factory=lambda: [CardCounter(), CardCounter()], compare=False
+    )
+    pair_scores: RunningStats = field(default_factory=RunningStats, compare=False)
+
+    @property
+    def record(self) -> WinRate:
+        """Deck A's wins, losses and draws, the unfinished games being the draws."""
+        record = WinRate()
+        record.wins, record.losses, record.draws = self.wins[0], self.wins[1], self.unfinished
+        return record
+
+    @property
+    def win_rate(self) -> float:
+        """The share of deck A's wins among the games played, unfinished games count as half."""
+        if self.games == 0:
+            return 0.0
+        return self.record.rate
+
+    def interval(self, z: float = Z_95) -> Tuple[float, float]:
+        """The Wilson interval of deck A's win rate."""
+        return self.record.interval(z)
+
+    def paired_interval(self, z: float = Z_95) -> Tuple[float, float]:
+        """
+        Interval of deck A's win rate from the scores of the pairs of a paired batch.
+
+        Swapping the seats cancels the first player advantage within each pair, which makes
+        this interval narrower than the Wilson interval of the single games.
+        """
+        if self.pair_scores.count < 2:
+            return self.interval(z)
+        margin = z * self.pair_scores.stderr
+        mean = self.pair_scores.mean
+        return max(0.0, mean - margin), min(1.0, mean + margin)
+
+    def add(
+        self,
+        winner: Optional[int],
+        starter: int,
+        points: Tuple[int, int],
+        turns: int,
+        in_play: Optional[Tuple[List[str], List[str]]] = None,
+    ) -> None:
+        """
+        Record the outcome of one game.
+
+        Args:
+            winner (Optional[int]): 0 if deck A won, 1 if deck B won, None if unfinished.
+            starter (int): 0 if deck A started, 1 if deck B started.
+            points (Tuple[int, int]): The final points of deck A and deck B.
+            turns (int): The number of turns played.
+            in_play (Optional[Tuple[List[str], List[str]]]): The names of the cards in play at
+                the end, for deck A and deck B.
+        """
+        self.games += 1
+        if winner is None:
+            self.unfinished += 1
+        else:
+            self.wins[winner] += 1
+            self.seat_wins[0 if winner == starter else 1] += 1
+        self.turns.add(turns)
+        for deck in range(2):
+            self.points[deck].add(points[deck])
+        self.turn_stats.add(turns)
+        if in_play is not None:
+            for deck in range(2):
+                self.cards_in_play[deck].add(in_play[deck])
+                if winner == deck:
+                    self.cards_in_play_won[deck].add(in_play[deck])
+
+    def merge(self, other: "BatchResult") -> None:
+        """Add the results of another batch, e.g. the part played by another worker."""
+        self.games += other.games
+        self.unfinished += other.unfinished
+        for i in range(2):
+            self.wins[i] += other.wins[i]
+            self.seat_wins[i] += other.seat_wins[i]
+            self.points[i].merge(other.points[i])
+            self.cards_in_play[i].merge(other.cards_in_play[i])
+            self.cards_in_play_won[i].merge(other.cards_in_play_won[i])
+        self.turns.merge(other.turns)
+        self.turn_stats.merge(other.turn_stats)
+        self.pair_scores.merge(other.pair_scores)
+
+    def report(self) -> str:
+        """One line summary, e.g. for live reporting while a batch runs."""
+        low, high = self.interval()
+        return (
+            f"{self.games} games: A {self.wins[0]} - B {self.wins[1]}"
+            f" ({self.unfinished} unfinished), A win rate {self.win_rate:.3f}"
+            f" [{low:.3f}, {high:.3f}], {self.turn_stats.mean:.1f} turns on average"
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "seed": self.seed,
+            "games": self.games,
+            "wins": list(self.wins),
+            "unfinished": self.unfinished,
+            "seat_wins": list(self.seat_wins),
+            "win_rate": self.win_rate,
+            "interval": list(self.interval()),
+            "turns": self.turns.to_dict(),
+            "turn_stats": self.turn_stats.to_dict(),
+            "points": [histogram.to_dict() for histogram in self.points],
+            "cards_in_play": [counter.to_dict() for counter in self.cards_in_play],
+            "cards_in_play_won": [counter.to_dict() for counter in self.cards_in_play_won],
+        }
+
+
+class DeckTemplate:
+    """
+    A deck kept pickled, so every game gets fresh cards without rebuilding them.
+
+    Templates are what the batch functions pass to their workers, and what new_match and
+    play_range set up games from.
+
+    Args:
+        deck (Deck): The deck to copy, it is not modified.
+    """
+
+    def __init__(self, deck: Deck) -> None:
+        self.energy_types: List[str] = list(deck.energy_types)
+        self.cards: bytes = pickle.dumps(deck.cards)
+
+    def new_deck(
+        self, rng: random.Random, energy_rng: Optional[random.Random] = None
+    ) -> Deck:
+        """
+        A fresh copy of the deck, shuffled with the given random number generator.
+
+        Args:
+            rng (random.Random): Shuffles the cards.
+            energy_rng (Optional[random.Random]): Draws the energies, None uses the random module.
+
+        Returns:
+            Deck: The new deck.
+        """
+        cards = pickle.loads(self.cards)
+        rng.shuffle(cards)
+        return Deck(list(self.energy_types), cards, rng=energy_rng)
+
+
+def new_match(
+    template_a: DeckTemplate,
+    template_b: DeckTemplate,
+    seed: int,
+    index: int,
+    paired: bool = False,
+    bots: Bots = None,
+) -> Tuple[Match, random.Random, int]:
+    """
+    Set up game number index of a batch: shuffled decks, players and the match.
+
+    The random module is seeded with the game, the caller restores its state afterwards.
+
+    Args:
+        template_a (DeckTemplate): Deck A, starting the games with an even index.
+        template_b (DeckTemplate): Deck B, starting the games with an odd index.
+        seed (int): The seed of the batch.
+        index (int): The index of the game in the batch.
+        paired (bool): Whether the batch plays mirrored pairs of games, see play_many.
+        bots (Optional[Tuple[Bot, Bot]]): The bots configured for deck A and deck B.
+
+    Returns:
+        Tuple[Match, random.Random, int]: The match, the random number generator of the
+            policy and the deck starting the match, 0 for deck A and 1 for deck B.
+    """
+    # The engine draws random targets (and unpaired, the energies) from the random module,
+    # the callers restore its state afterwards
+    if paired:
+        streams = game_seed(seed, index // 2) * _PAIRED_STREAMS
+        rng = random.Random(streams)
+        random.seed(streams + 1)
+        deck_a = template_a.new_deck(random.Random(streams + 2), random.Random(streams + 3))
+        deck_b = template_b.new_deck(random.Random(streams + 4), random.Random(streams + 5))
+    else:
+        game = game_seed(seed, index)
+        rng = random.Random(game)
+        random.seed(game)
+        deck_a = template_a.new_deck(rng)
+        deck_b = template_b.new_deck(rng)
+
+    player_a = Player("A", deck_a)
+    player_b = Player("B", deck_b)
+    if bots is not None:
+        bots[0].configure(player_a, rng)
+        bots[1].configure(player_b, rng)
+    starter = index % 2
+    if starter == 0:
+        match = Match(player_a, player_b)
+    else:
+        match = Match(player_b, player_a)
+    return match, rng, starter
+
+
+def _names_in_play(player: Player) -> List[str]:
+    names = [card.name for card in player.bench]
+    if player.active_card is not None:
+        names.append(player.active_card.name)
+    return names
+
+
+def play_range(
+    template_a: DeckTemplate,
+    template_b: DeckTemplate,
+    seed: int,
+    start: int,
+    stop: int,
+    policy: Optional[Policy],
+    max_turns: int,
+    paired: bool = False,
+    bots: Bots = None,
+) -> BatchResult:
+    """
+    Play the games with index start to stop - 1 of a batch, in this process.
+
+    This is the task the batch functions submit to their workers, one per chunk.
+
+    Args:
+        template_a (DeckTemplate): Deck A.
+        template_b (DeckTemplate): Deck B.
+        seed (int): The seed of the batch.
+        start (int): The index of the first game.
+        stop (int): The index after the last game.
+        policy (Optional[Policy]): The policy of both players, None plays random actions.
+        max_turns (int): The turn after which a game is stopped without a winner.
+        paired (bool): Whether the batch plays mirrored pairs of games, see play_many.
+        bots (Optional[Tuple[Bot, Bot]]): The bots playing deck A and deck B.
+
+    Returns:
+        BatchResult: The results of the games, from deck A's point of view.
+    """
+    gui_enabled = config.gui_enabled
+    config.gui_enabled = False
+    random_state = random.getstate()
+    try:
+        result = BatchResult(seed=seed)
+        first_score = 0.0
+        for index in range(start, stop):
+            match, rng, starter = new_match(template_a, template_b, seed, index, paired, bots)
+            outcome = playout(match, policy=policy, rng=rng, max_turns=max_turns)
+
+            # Translate seats to decks
+            winner = None if outcome.winner is None else outcome.winner ^ starter
+            points = outcome.points if starter == 0 else outcome.points[::-1]
+            players = (match.starting_player, match.second_player)
+            if starter == 1:
+                players = players[::-1]
+            in_play = (_names_in_play(players[0]), _names_in_play(players[1]))
+            result.add(winner, starter, (points[0], points[1]), outcome.turns, in_play)
+
+            if paired:
+                score = 0.5 if winner is None else 1.0 - winner
+                if starter == 0:
+                    first_score = score
+                elif index > start:
+                    result.pair_scores.add((first_score + score) / 2)
+        return result
+    finally:
+        config.gui_enabled = gui_enabled
+        random.setstate(random_state)
+
+
+def play_many(
+    deck_a: Deck,
+    deck_b: Deck,
+    n: int,
+    seed: int = 0,
+    workers: int = 1,
+    policy: Optional[Policy] = None,
+    max_turns: int = MAX_TURNS,
+    progress: Optional[Callable[[BatchResult], None]] = None,
+    chunk_size: int = 1000,
+    paired: bool = False,
+    bots: Bots = None,
+) -> BatchResult:
+    """
+    Play n games between two decks, alternating which deck starts.
+
+    Both players play random actions unless a policy is given. The decks are not modified,
+    every game shuffles its own copies.
+
+    The games are played in chunks, which are merged in order, so the results do not depend on
+    the number of workers.
+
+    Args:
+        deck_a (Deck): Deck A, starting the games with an even index.
+        deck_b (Deck): Deck B, starting the games with an odd index.
+        n (int): The number of games.
+        seed (int): The seed of the batch, the same seed plays the same games.
+        workers (int): The number of worker processes, 1 plays in this process.
+        policy (Optional[Policy]): The policy of both players, it must be picklable with
+            several workers. None plays uniformly random actions.
+        max_turns (int): The turn after which a game is stopped without a winner.
+        progress (Optional[Callable[[BatchResult], None]]): Called with the partial result
+            after every chunk.
+        chunk_size (int): The number of games of a chunk, rounded up to even when paired.
+        paired (bool): Whether to play mirrored pairs of games with common random numbers,
+            see the module documentation.
+        bots (Optional[Tuple[Bot, Bot]]): The bots playing deck A and deck B, None plays
+            both with the policy.
+
+    Returns:
+        BatchResult: The aggregated results.
+    """
+    template_a = DeckTemplate(deck_a)
+    template_b = DeckTemplate(deck_b)
+    chunks = chunk_ranges(0, n, chunk_size, paired)
+
+    result = BatchResult(seed=seed)
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 and len(chunks) > 1 else None
+    try:
+        play_chunks(
+            pool,
+            workers,
+            template_a,
+            template_b,
+            seed,
+            chunks,
+            policy,
+            max_turns,
+            paired,
+            bots,
+            result,
+            progress,
+        )
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return result
+
+
+def chunk_ranges(
+    start: int, stop: int, chunk_size: int, paired: bool = False
+) -> List[Tuple[int, int]]:
+    """
+    Split the game indices start to stop - 1 into (start, stop) ranges of chunk_size.
+
+    Args:
+        start (int): The index of the first game.
+        stop (int): The index after the last game.
+        chunk_size (int): The number of games of a range.
+        paired (bool): Whether to keep the two games of a pair in one range.
+
+    Returns:
+        List[Tuple[int, int]]: The ranges, in order.
+    """
+    if paired:
+        # Keep the two games of a pair in one chunk
+        chunk_size += chunk_size % 2
+    return [(i, min(i + chunk_size, stop)) for i in range(start, stop, chunk_size)]
+
+
+def play_chunks(
+    pool: Optional[ProcessPoolExecutor],
+    workers: int,
+    template_a: DeckTemplate,
+    template_b: DeckTemplate,
+    seed: int,
+    chunks: List[Tuple[int, int]],
+    policy: Optional[Policy],
+    max_turns: int,
+    paired: bool,
+    bots: Bots,
+    result: BatchResult,
+    progress: Optional[Callable[[BatchResult], None]] = None,
+) -> None:
+    """
+    Play the chunks of a batch, in the pool if given, and merge them into result in order.
+
+    Args:
+        pool (Optional[ProcessPoolExecutor]): The pool playing the chunks, None plays them in
+            this process.
+        workers (int): The number of worker processes of the pool.
+        template_a (DeckTemplate): Deck A.
+        template_b (DeckTemplate): Deck B.
+        seed (int): The seed of the batch.
+        chunks (List[Tuple[int, int]]): The ranges of games to play, see chunk_ranges.
+        policy (Optional[Policy]): The policy of both players, None plays random actions.
+        max_turns (int): The turn after which a game is stopped without a winner.
+        paired (bool): Whether the batch plays mirrored pairs of games, see play_many.
+        bots (Optional[Tuple[Bot, Bot]]): The bots playing deck A and deck B.
+        result (BatchResult): The result the chunks are merged into.
+        progress (Optional[Callable[[BatchResult], None]]): Called with result after every chunk.
+    """
+    args = (template_a, template_b, seed)
+    if pool is None:
+        for start, stop in chunks:
+            result.merge(play_range(*args, start, stop, policy, max_turns, paired, bots))
+            if progress is not None:
+                progress(result)
+        return
+
+    # Keep a bounded window of chunks in flight, so the memory does not grow with the batch
+    window = _IN_FLIGHT_PER_WORKER * workers
+    futures: Deque["Future[BatchResult]"] = deque()
+    for start, stop in chunks:
+        futures.append(pool.submit(play_range, *args, start, stop, policy, max_turns, paired, bots))
+        if len(futures) >= window:
+            _merge_next(futures, result, progress)
+    while futures:
+        _merge_next(futures, result, progress)
+
+
+def _merge_next(
+    futures: Deque["Future[BatchResult]"],
+    result: BatchResult,
+    progress: Optional[Callable[[BatchResult], None]],
+) -> None:
+    """Merge the oldest chunk in flight into result, waiting for it, and release it."""
+    result.merge(futures.popleft().result())
+    if progress is not None:
+        progress(result)
+
+
+@dataclass
+class WinRateEstimate:
+    """
+    Result of estimate_winrate.
+
+    Attributes:
+        win_rate (float): Deck A's estimated win rate, unfinished games count as half.
+        interval (Tuple[float, float]): The Wilson interval of the win rate, or the paired
+            interval for paired games.
+        games (int): The number of games played.
+        seconds (float): The wall-clock time spent.
+        reason (str): Why the estimation stopped: "precise" when the interval was narrow
+            enough, "decided" when it excluded 0.5, "budget" when max_games ran out.
+        result (BatchResult): The aggregated results of all games played.
+    """
+
+    win_rate: float
+    interval: Tuple[float, float]
+    games: int
+    seconds: float
+    reason: str
+    result: BatchResult
+
+    def __repr__(self) -> str:
+        low, high = self.interval
+        return (
+            f"WinRateEstimate({self.win_rate:.3f} [{low:.3f}, {high:.3f}], {self.games} games,"
+            f" {self.seconds:.1f}s, {self.reason})"
+        )
+
+
+def estimate_winrate(
+    deck_a: Deck,
+    deck_b: Deck,
+    target_ci: float = 0.01,
+    seed: int = 0,
+    workers: int = 1,
+    batch_size: int = 1000,
+    max_games: int = 1_000_000,
+    stop_when_decided: bool = True,
+    min_games: int = 200,
+    z: float = Z_95,
+    policy: Optional[Policy] = None,
+    max_turns: int = MAX_TURNS,
+    paired: bool = False,
+    bots: Bots = None,
+) -> WinRateEstimate:
+    """
+    Estimate deck A's win rate against deck B, playing only as many games as needed.
+
+    Games are played in rounds of batch_size games per worker. After every round the
+    estimation stops when the half width of the Wilson interval is at most target_ci, or,
+    with stop_when_decided, when the interval no longer contains 0.5. The interval is checked
+    after every round, so with early stopping its coverage is approximate.
+
+    The games played are the first games of play_many with the same seed.
+
+    Args:
+        deck_a (Deck): Deck A.
+        deck_b (Deck): Deck B.
+        target_ci (float): The half width of the interval to reach.
+        seed (int): The seed of the games.
+        workers (int): The number of worker processes, 1 plays in this process.
+        batch_size (int): The number of games per worker and round.
+        max_games (int): The most games played.
+        stop_when_decided (bool): Whether to stop as soon as one deck is clearly better.
+        min_games (int): The fewest games before stopping for a decided matchup.
+        z (float): The normal quantile of the confidence level, 1.96 for 95%.
+        policy (Optional[Policy]): The policy of both players, None plays random actions.
+        max_turns (int): The turn after which a game is stopped without a winner.
+        paired (bool): Whether to play mirrored pairs of games with common random numbers and
+            stop on the paired interval, which usually needs fewer games.
+        bots (Optional[Tuple[Bot, Bot]]): The bots playing deck A and deck B.
+
+    Returns:
+        WinRateEstimate: The estimate, the games used and the time spent.
+    """
+    start_time = time.perf_counter()
+    template_a = DeckTemplate(deck_a)
+    template_b = DeckTemplate(deck_b)
+    result = BatchResult(seed=seed)
+    if paired:
+        batch_size += batch_size % 2
+    round_size = batch_size * max(1, workers)
+    interval = result.paired_interval if paired else result.interval
+
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    reason = "budget"
+    try:
+        while result.games < max_games:
+            stop = min(result.games + round_size, max_games)
+            chunks = chunk_ranges(result.games, stop, batch_size, paired)
+            play_chunks(
+                pool,
+                workers,
+                template_a,
+                template_b,
+                seed,
+                chunks,
+                policy,
+                max_turns,
+                paired,
+                bots,
+                result,
+            )
+
+            low, high = interval(z)
+            if (high - low) / 2 <= target_ci:
+                reason = "precise"
+                break
+            if stop_when_decided and result.games >= min_games and (low > 0.5 or high < 0.5):
+                reason = "decided"
+                break
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    return WinRateEstimate(
+        win_rate=result.win_rate,
+        interval=interval(z),
+        games=result.games,
+        seconds=time.perf_counter() - start_time,
+        reason=reason,
+        result=result,
+    )
+
+
+def _compare_range(
+    template_x: DeckTemplate,
+    template_y: DeckTemplate,
+    template_opponent: DeckTemplate,
+    seed: int,
+    start: int,
+    stop: int,
+    policy: Optional[Policy],
+    max_turns: int,
+) -> Tuple[BatchResult, BatchResult, RunningStats]:
+    """Play the pairs of games start to stop - 1 of both candidates against one opponent."""
+    result_x = BatchResult(seed=seed)
+    result_y = BatchResult(seed=seed)
+    differences = RunningStats()
+    for pair_start in range(start, stop, 2):
+        pair_stop = pair_start + 2
+        pair_x = play_range(
+            template_x, template_opponent, seed, pair_start, pair_stop, policy, max_turns, True
+        )
+        pair_y = play_range(
+            template_y, template_opponent, seed, pair_start, pair_stop, policy, max_turns, True
+        )
+        differences.add(pair_x.pair_scores.mean - pair_y.pair_scores.mean)
+        result_x.merge(pair_x)
+        result_y.merge(pair_y)
+    return result_x, result_y, differences
+
+
+@dataclass
+class CandidateComparison:
+    """
+    Result of compare_candidates.
+
+    Attributes:
+        difference (float): Candidate X's win rate minus candidate Y's, over the field.
+        interval (Tuple[float, float]): The confidence interval of the difference.
+        pairs (int): The number of paired games per candidate, two games each.
+        result_x (BatchResult): Candidate X's results against the whole field.
+        result_y (BatchResult): Candidate Y's results against the whole field.
+        differences (RunningStats): The score differences of the pairs.
+    """
+
+    difference: float
+    interval: Tuple[float, float]
+    pairs: int
+    result_x: BatchResult
+    result_y: BatchResult
+    differences: RunningStats
+
+
+def compare_candidates(
+    deck_x: Deck,
+    deck_y: Deck,
+    opponents: List[Deck],
+    n: int,
+    seed: int = 0,
+    workers: int = 1,
+    policy: Optional[Policy] = None,
+    max_turns: int = MAX_TURNS,
+    chunk_size: int = 1000,
+    z: float = Z_95,
+) -> CandidateComparison:
+    """
+    Compare two candidate decks against a field with paired games.
+
+    Both candidates play the same paired batch against every opponent: the opponent's deck
+    order and energies, and the candidate's energies, come from the same random streams for
+    both candidates, and every game is also played with the seats swapped. The difference of
+    the candidates is estimated from the per pair differences, whose variance is much lower
+    than that of two independent batches.
+
+    Args:
+        deck_x (Deck): Candidate X.
+        deck_y (Deck): Candidate Y.
+        opponents (List[Deck]): The field both candidates play against.
+        n (int): The number of games per candidate and opponent, rounded up to even.
+        seed (int): The seed of the batches.
+        workers (int): The number of worker processes, 1 plays in this process.
+        policy (Optional[Policy]): The policy of all players, None plays random actions.
+        max_turns (int): The turn after which a game is stopped without a winner.
+        chunk_size (int): The number of games of a chunk.
+        z (float): The normal quantile of the confidence level, 1.96 for 95%.
+
+    Returns:
+        CandidateComparison: The estimated difference and both candidates' results.
+    """
+    template_x = DeckTemplate(deck_x)
+    template_y = DeckTemplate(deck_y)
+    n += n % 2
+    tasks = [
+        (template_x, template_y, DeckTemplate(opponent), seed, start, stop, policy, max_turns)
+        for opponent in opponents
+        for start, stop in chunk_ranges(0, n, chunk_size, paired=True)
+    ]
+
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_compare_range, *zip(*tasks)))
+    else:
+        parts = [_compare_range(*task) for task in tasks]
+
+    result_x = BatchResult(seed=seed)
+    result_y = BatchResult(seed=seed)
+    differences = RunningStats()
+    for part_x, part_y, part_differences in parts:
+        result_x.merge(part_x)
+        result_y.merge(part_y)
+        differences.merge(part_differences)
+
+    margin = z * differences.stderr
+    return CandidateComparison(
+        difference=differences.mean,
+        interval=(differences.mean - margin, differences.mean + margin),
+        pairs=differences.count,
+        result_x=result_x,
+        result_y=result_y,
+        differences=differences,
+    )
+
+
+def replay_game(
+    deck_a: Deck,
+    deck_b: Deck,
+    seed: int,
+    index: int,
+    policy: Optional[Policy] = None,
+    max_turns: int = MAX_TURNS,
+    paired: bool = False,
+    bots: Bots = None,
+) -> Match:
+    """
+    Play one game of a batch again, e.g. to inspect an unusual result.
+
+    Args:
+        deck_a (Deck): Deck A of the batch.
+        deck_b (Deck): Deck B of the batch.
+        seed (int): The seed of the batch.
+        index (int): The index of the game in the batch.
+        policy (Optional[Policy]): The policy the batch was played with.
+        max_turns (int): The turn limit the batch was played with.
+        paired (bool): Whether the batch was paired.
+        bots (Optional[Tuple[Bot, Bot]]): The bots the batch was played with.
+
+    Returns:
+        Match: The finished match.
+    """
+    gui_enabled = config.gui_enabled
+    config.gui_enabled = False
+    random_state = random.getstate()
+    try:
+        match, rng, _ = new_match(
+            DeckTemplate(deck_a), DeckTemplate(deck_b), seed, index, paired, bots
+        )
+        playout(match, policy=policy, rng=rng, max_turns=max_turns)
+    finally:
+        config.gui_enabled = gui_enabled
+        random.setstate(random_state)
+    return match
@@ -0,0 +1,132 @@
+"""
+Bot configurations for simulations.
+
+A Bot describes how a player chooses its actions, so that batches can be played between
+different bots. Bots are picklable and can be parsed from short specifications, e.g. on the
+command line:
+
+    random                          uniformly random actions
+    planner                         exhaustive single turn planner (Player.evaluate_player)
+    planner:think_ms=20             anytime single turn planner
+    mcts:iterations=100             Monte Carlo tree search
+    expectimax:depth=2              multi-turn expectimax
+    planner:weights=25/0.1/5/0/0/0/0  planner scoring leaves with a LinearEvaluator
+
+Options are comma separated key=value pairs passed to the planner, the ones of each kind in
+BOT_OPTIONS, weights are slash separated in the order of search.evaluator.FEATURE_NAMES.
+"""
+
+import random
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+from .core.player import Player
+
+BOT_KINDS = ("random", "planner", "mcts", "expectimax")
+
+# The options every kind of bot takes, all numbers
+BOT_OPTIONS: Dict[str, Tuple[str, ...]] = {
+    "random": (),
+    "planner": ("think_ms",),
+    "mcts": ("iterations", "think_ms", "exploration", "rollout_turns", "seed"),
+    "expectimax": ("depth", "sequence_depth", "beam_width"),
+}
+
+
+@dataclass
+class Bot:
+    """
+    A bot configuration.
+
+    Attributes:
+        kind (str): One of BOT_KINDS.
+        options (Dict[str, Any]): Options of the planner, e.g. think_ms or iterations.
+        weights (Optional[Tuple[float, ...]]): Weights of a LinearEvaluator scoring the
+            positions, None uses Player.evaluate_player.
+    """
+
+    kind: str = "random"
+    options: Dict[str, Any] = field(default_factory=dict)
+    weights: Optional[Tuple[float, ...]] = None
+
+    def __post_init__(self) -> None:
+        if self.kind not in BOT_KINDS:
+            raise ValueError(f"Unknown bot kind {self.kind!r}, expected one of {BOT_KINDS}")
+        for key, value in self.options.items():
+            if key not in BOT_OPTIONS[self.kind]:
+                raise ValueError(
+                    f"Unknown option {key!r} of a {self.kind} bot, "
+                    f"expected one of {BOT_OPTIONS[self.kind]}"
+                )
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise ValueError(f"Option {key!r} of a {self.kind} bot must be a number")
+
+    def configure(self, player: Player, rng: Optional[random.Random] = None) -> None:
+        """
+        Make the player play as this bot.
+
+        Args:
+            player (Player): The player to configure.
+            rng (Optional[random.Random]): Seeds randomized planners without a seed option.
+        """
+        from .search import MCTS, Expectimax, LinearEvaluator
+
+        evaluator = LinearEvaluator(self.weights) if self.weights is not None else None
+
+        if self.kind == "random":
+            return
+        if self.kind == "planner":
+            player.think_ms = self.options.get("think_ms")
+            player.evaluator = evaluator
+            player.evaluate_actions = True
+        elif self.kind == "mcts":
+            options = dict(self.options)
+            if "seed" not in options and rng is not None:
+                options["seed"] = rng.getrandbits(32)
+            player.planner = MCTS(evaluator=evaluator, **options)
+            player.evaluate_actions = True
+        elif self.kind == "expectimax":
+            player.planner = Expectimax(evaluator=evaluator, **self.options)
+            player.evaluate_actions = True
+
+    def __str__(self) -> str:
+        options = [f"{key}={value}" for key, value in self.options.items()]
+        if self.weights is not None:
+            options.append("weights=" + "/".join(f"{weight:g}" for weight in self.weights))
+        return self.kind + (":" + ",".join(options) if options else "")
+
+
+def _parse_value(value: str) -> Any:
+    for parse in (int, float):
+        try:
+            return parse(value)
+        except ValueError:
+            pass
+    return value
+
+
+def parse_bot(spec: str) -> Bot:
+    """
+    Parse a bot specification, see the module documentation.
+
+    Args:
+        spec (str): The specification, e.g. "mcts:iterations=100".
+
+    Returns:
+        Bot: The bot.
+
+    Raises:
+        ValueError: If the specification is malformed or has options the bot does not take.
+    """
+    kind, _, option_string = spec.partition(":")
+    options: Dict[str, Any] = {}
+    weights: Optional[Tuple[float, ...]] = None
+    for option in filter(None, option_string.split(",")):
+        key, separator, value = option.partition("=")
+        if not separator:
+            raise ValueError(f"Expected key=value in bot option {option!r}")
+        if key == "weights":
+            weights = tuple(float(weight) for weight in value.split("/"))
+        else:
+            options[key] = _parse_value(value)
+    return Bot(kind.strip(), options, weights)
@@ -2,10 +2,14 @@ import json
 import random
 import uuid
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 from ..mechanics.ability import Ability
 from ..mechanics.attack import Attack, EnergyType
+from ..mechanics.chance import RetreatDiscard
+from ..mechanics.condition import Condition, condition_names, expire
+from ..mechanics.effects import register_attacks
+from ..mechanics.events import Event, Handler
 
 if TYPE_CHECKING:
     from .player import Player
@@ -43,6 +47,10 @@ def _parse_card_data(card_data: List[Dict[str, Dict[str, Any]]]) -> List[Dict[st
             else:
                 pokemon["retreat_cost"] = int(rc)
 
+    # Compile the attacks once, the attack actions find them on the Attack class
+    register_attacks(
+        attack for entry in card_data for attack in entry.get("Pokemon", {}).get("attacks", [])
+    )
     return card_data
 
 
@@ -111,7 +119,7 @@ class Card:
         self.retreat_cost: int = retreat_cost
         self.modifiers: List[Any] = []
         self.ability: Optional[Any] = ability
-        self.conditions: List[Any] = []
+        self.conditions: Condition = Condition.NONE
         self.weakness: Optional[EnergyType] = weakness
         self.is_ex: bool = is_ex
         self.stage: int = stage
@@ -124,19 +132,32 @@ class Card:
         """Computed property: a card is Basic when its stage is 0."""
         return getattr(self, "stage", 0) == 0
 
-    def add_condition(self, condition: Any) -> None:
-        if any(isinstance(cond, condition.__class__) for cond in self.conditions):
-            # TODO: sometimes the conditions do not get removed off benched pokemon
-            return
-        self.conditions.append(condition)
+    def add_condition(self, condition: Condition) -> None:
+        self.conditions |= condition
 
-    def remove_condition(self, condition_name: str) -> None:
-        self.conditions = [
-            condition for condition in self.conditions if condition != condition_name
-        ]
+    def remove_condition(self, condition: Condition) -> None:
+        self.conditions &= ~condition
+
+    def has_condition(self, condition: Condition) -> bool:
+        return bool(self.conditions & condition)
 
     def update_conditions(self) -> None:
-        self.conditions = [condition for condition in self.conditions if not condition.rid()]
+        self.conditions = expire(self.conditions)
+
+    def handlers(self) -> List[Tuple[Event, Handler]]:
+        """The event handlers of the card while it is in play, see mechanics.events."""
+        if self.ability is None:
+            return []
+        handlers: List[Tuple[Event, Handler]] = [(Event.ON_TURN_START, Card.refresh_ability)]
+        for event in Event:
+            hook = getattr(self.ability, event.value, None)
+            if hook is not None:
+                handlers.append((event, hook))
+        return handlers
+
+    @staticmethod
+    def refresh_ability(player: "Player", card: "Card") -> None:
+        card.has_used_ability = False
 
     @staticmethod
     def add_energy(player: "Player", card: "Card", energy: str) -> None:
@@ -155,15 +176,18 @@ class Card:
             raise ValueError(f"Energy count for {energy_enum.value} is already 0 or less.")
         self.energies[energy_enum.value] -= 1
 
-    def remove_retreat_cost_energy(self) -> None:
-        total_energy_needed = self.retreat_cost
-        while total_energy_needed > 0:
-            available_energies = [energy for energy, count in self.energies.items() if count > 0]
-            if not available_energies:
-                raise ValueError("Not enough energy to cover the retreat cost.")
-            selected_energy = random.choice(available_energies)
-            self.remove_energy(EnergyType(selected_energy))
-            total_energy_needed -= 1
+    def remove_retreat_cost_energy(self, discarded: Optional[Sequence[str]] = None) -> None:
+        """
+        Discard the energies paying for the retreat cost.
+
+        Args:
+            discarded (Optional[Sequence[str]]): The energy types to discard, an outcome of
+                RetreatDiscard. None discards random ones, one type at a time.
+        """
+        if discarded is None:
+            discarded = RetreatDiscard(self).sample()
+        for energy in discarded:
+            self.remove_energy(EnergyType(energy))
 
     def get_total_energy(self) -> int:
         return sum(self.energies.values())
@@ -242,7 +266,7 @@ class Card:
             "stage": self.stage,
             "evolves_from": evolves_from_name,
             "can_evolve": self.can_evolve,
-            "conditions": [cond.serialize() for cond in self.conditions],
+            "conditions": condition_names(self.conditions),
         }
 
     @staticmethod
@@ -1,15 +1,66 @@
+import hashlib
+import json
 import random
 import uuid
-from typing import Any, List, Optional, Type
+from collections import Counter
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type
 
 from .card import Card
 
+if TYPE_CHECKING:
+    from .odds import DeckOdds
+
+
+def card_name(card: Any) -> str:
+    """Name identifying a card in a deck: the card name, or the class name for items."""
+    if isinstance(card, Card):
+        return card.name
+    return getattr(card, "__name__", card.__class__.__name__)
+
 
 class Deck:
-    def __init__(self, energy_types: List[str], cards: Optional[List[Any]] = None) -> None:
+    def __init__(
+        self,
+        energy_types: List[str],
+        cards: Optional[List[Any]] = None,
+        rng: Optional[random.Random] = None,
+    ) -> None:
         self.uid: uuid.UUID = uuid.uuid4()
         self.energy_types: List[str] = energy_types
         self.cards: List[Any] = cards if cards is not None else []
+        # Own stream for the energy draws, e.g. to replay them in paired simulations
+        self.rng: Optional[random.Random] = rng
+
+    @classmethod
+    def from_names(cls, names: List[str], energy_types: List[str]) -> "Deck":
+        """
+        Build a deck from card names, items and supporters given by their class name.
+
+        Items and supporters are added as instances, which is how the engine finds them in the
+        hand.
+
+        Args:
+            names (List[str]): The names, e.g. ["Ralts", "Kirlia", "Potion"].
+            energy_types (List[str]): The energy types of the deck.
+
+        Returns:
+            Deck: The new deck.
+
+        Raises:
+            ValueError: If a name is neither an item or supporter nor in the card database.
+        """
+        from ..mechanics.item import Item
+        from ..mechanics.supporter import Supporter
+
+        deck = cls(energy_types=list(energy_types))
+        for name in names:
+            if hasattr(Item, name):
+                deck.add(getattr(Item, name)())
+            elif hasattr(Supporter, name):
+                deck.add(getattr(Supporter, name)())
+            else:
+                deck.add(Card.create_card(name))
+        return deck
 
     def _add_card(self, card: Card) -> None:
         """Internal method to add a Card object to the deck."""
@@ -55,7 +106,70 @@ class Deck:
             return None
 
     def draw_energy(self) -> str:
-        return random.choice(self.energy_types)
+        return (self.rng or random).choice(self.energy_types)
+
+    def draw_card_at(self, index: int) -> Any:
+        """Draw the card at the given position, used to play out a known draw outcome."""
+        return self.cards.pop(index)
+
+    def draw_outcomes(self) -> List[Tuple[int, float]]:
+        """
+        Every distinct card a draw from the shuffled deck can give, with its probability.
+
+        Cards with the same name are one outcome, represented by the index of the first of them.
+
+        Returns:
+            List[Tuple[int, float]]: (index in cards, probability) pairs, empty for an empty deck.
+        """
+        first_index: Dict[str, int] = {}
+        counts: Counter = Counter()
+        for index, card in enumerate(self.cards):
+            name = card_name(card)
+            first_index.setdefault(name, index)
+            counts[name] += 1
+
+        total = len(self.cards)
+        return [(first_index[name], count / total) for name, count in counts.items()]
+
+    def energy_outcomes(self) -> List[Tuple[str, float]]:
+        """Every energy draw_energy can return, with its probability."""
+        counts = Counter(self.energy_types)
+        total = len(self.energy_types)
+        return [(energy, count / total) for energy, count in counts.items()]
+
+    def fingerprint(self, version: Optional[int] = None) -> str:
+        """
+        Canonical hash of the deck, the same for every deck with the same cards and energies.
+
+        The order of the cards does not matter. The hash covers the sorted card ids, the sorted
+        names of the items and supporters, the energy types and the version of the rules, so
+        results keyed by it become stale when the rules change.
+
+        Args:
+            version (Optional[int]): The version of the rules, None uses ENGINE_VERSION.
+
+        Returns:
+            str: The hexadecimal SHA-256 hash.
+        """
+        if version is None:
+            from ..engine import ENGINE_VERSION
+
+            version = ENGINE_VERSION
+
+        canonical = {
+            "cards": sorted(card.id for card in self.cards if isinstance(card, Card)),
+            "items": sorted(card_name(card) for card in self.cards if not isinstance(card, Card)),
+            "energy_types": sorted(self.energy_types),
+            "version": version,
+        }
+        encoded = json.dumps(canonical, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def odds(self) -> "DeckOdds":
+        """Exact draw probabilities of the deck, see core.odds. Cached per fingerprint."""
+        from .odds import deck_odds
+
+        return deck_odds(self)
 
     def __repr__(self) -> str:
         return "Deck:\n" + "\n".join(str(card) for card in self.cards)
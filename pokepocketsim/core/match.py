@@ -1,15 +1,23 @@
 import copy
+import heapq
 import os
+import pickle
 import random
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Iterator, List, Optional, Set, Tuple
 
 from ..data_collector import DataCollector
 from ..mechanics.action import Action
+from ..mechanics.chance import CardDraw
+from ..mechanics.events import Event
 from ..utils import config
 from .player import Player
 
 # Import GUI only when needed to avoid tkinter dependency
 if TYPE_CHECKING:
+    from ..search.evaluator import Evaluator
     from ..state.match_state import MatchState
     from ..ui.gui import GUI  # type: ignore
 
@@ -19,6 +27,27 @@ except ImportError:
     GUI = None
     tk = None
 
+# Longest action sequence the turn planner explores before evaluating
+MAX_SEARCH_DEPTH = 11
+
+
+class _SearchBudget:
+    """Deadline bookkeeping shared by one iteration of the anytime search."""
+
+    def __init__(self, deadline: Optional[float]) -> None:
+        self.deadline: Optional[float] = deadline
+        self.expired: bool = False
+        self.truncated: bool = False
+
+    def check_expired(self) -> bool:
+        if self.deadline is not None and time.perf_counter() >= self.deadline:
+            self.expired = True
+        return self.expired
+
+
+# Turns played at most, after which the match stops without a winner
+MAX_TURNS = 100
+
 
 class Match:
     """
@@ -29,6 +58,7 @@ class Match:
         second_player (Player): The player who will play second.
         turn (int): The current turn number, starting at 0.
         game_over (bool): A flag indicating whether the game is over.
+        winner (Optional[Player]): The winner once the game is over, None without one.
 
     Methods:
     -------
@@ -62,6 +92,7 @@ class Match:
 
         self.turn: int = 0  # The current turn number
         self.game_over: bool = False
+        self.winner: Optional[Player] = None
 
         # GUI setup
         if config.gui_enabled:
@@ -121,14 +152,20 @@ class Match:
             self.data_collector.add_data_from_properties()
 
         if self.game_over:
+            # The active player won with its points, or lost without pokemon to play with
+            if active_player.points >= 3:
+                self.winner = active_player
+            else:
+                self.winner = non_active_player
             print()
             print("------ GAME OVER -------")
-            print(f"{active_player.name} won {active_player.points}-{non_active_player.points}")
+            loser = non_active_player if self.winner is active_player else active_player
+            print(f"{self.winner.name} won {self.winner.points}-{loser.points}")
             print(f"after {self.turn} turns")
 
-        if self.turn > 100:
+        if self.turn >= MAX_TURNS and not self.game_over:
             print()
-            print("Game terminated at turn 1000 due to infinite loop")
+            print(f"Game stopped without a winner after {MAX_TURNS} turns")
             self.game_over = True
 
         return self.game_over
@@ -141,6 +178,10 @@ class Match:
             self.start_turn()
 
         if self.data_collector:
+            self.data_collector.add_game(
+                [self.starting_player.name, self.second_player.name],
+                self.winner.name if self.winner is not None else None,
+            )
             self.data_collector.save_to_csv()
 
     def serialize(self) -> Dict[str, Any]:
@@ -163,55 +204,291 @@ class Match:
 
         return MatchState.from_match(self)
 
-    def get_best_actions_for_player(self, player: Player) -> List[Action]:
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle without the GUI, so matches can be sent to worker processes."""
+        state = self.__dict__.copy()
+        state.pop("root", None)
+        state.pop("gui", None)
+        return state
+
+    def get_best_actions_for_player(
+        self,
+        player: Player,
+        think_ms: Optional[int] = None,
+        setup_turn: bool = True,
+        evaluator: Optional["Evaluator"] = None,
+        workers: int = 1,
+        check_lethal: bool = True,
+    ) -> List[Action]:
         """
         Determines the best sequence of actions for a given player by simulating all possible turn actions
         and evaluating their outcomes.
 
+        When ``think_ms`` is given the search becomes an anytime search: sequences are explored with
+        iterative deepening and the best sequence found when the time budget runs out is returned.
+        The first (one action deep) iteration always completes, so a move is always available.
+
         Args:
             player (Player): The player for whom the best actions are being determined.
+            think_ms (Optional[int]): Wall-clock budget for the decision in milliseconds.
+                None searches exhaustively.
+            setup_turn (bool): Whether the turn still has to be set up (card draw, conditions).
+                Pass False when planning from inside an already started turn.
+            evaluator (Optional[Evaluator]): Scores the end states in batches instead of
+                Player.evaluate_player scoring them one at a time.
+            workers (int): Number of processes searching the subtrees of the first actions.
+            check_lethal (bool): Whether to play the cheapest winning line without searching
+                when an attack wins the game this turn.
 
         Returns:
             List[Action]: The sequence of actions that has the highest evaluation score.
         """
-        all_actions = self.simulate_turn_actions(player)
-        best_evaluation = float("-inf")
-        best_sequence = []
+        best = self.top_k(
+            player,
+            1,
+            setup_turn=setup_turn,
+            evaluator=evaluator,
+            think_ms=think_ms,
+            workers=workers,
+            check_lethal=check_lethal,
+        )
+        return best[0][1] if best else []
+
+    def top_k(
+        self,
+        player: Player,
+        k: int,
+        setup_turn: bool = True,
+        evaluator: Optional["Evaluator"] = None,
+        think_ms: Optional[int] = None,
+        workers: int = 1,
+        check_lethal: bool = False,
+    ) -> List[Tuple[float, List[Action]]]:
+        """
+        Finds the k best sequences of actions for this turn while holding only k of them.
 
-        for evaluation, sequence in all_actions:
-            if evaluation > best_evaluation:
-                best_evaluation = evaluation
-                best_sequence = sequence
+        Ties keep the sequence found first. With several workers every worker only sends back
+        the k best sequences of its subtree.
+
+        Args:
+            player (Player): The player to simulate for.
+            k (int): The number of sequences to return.
+            setup_turn (bool): Whether to set up the turn on the copies before simulating.
+            evaluator (Optional[Evaluator]): Scores the end states in batches.
+            think_ms (Optional[int]): Wall-clock budget in milliseconds, None searches exhaustively.
+            workers (int): Number of processes searching the subtrees of the first actions.
+            check_lethal (bool): Whether to look for a winning attack before searching. When
+                there is one, its cheapest line is the only sequence returned, scored infinite.
 
-        return best_sequence
+        Returns:
+            List[Tuple[float, List[Action]]]: Up to k (evaluation, sequence) pairs, best first.
+        """
+        match_copy, player_copy = self._copy_for_simulation(player, setup_turn)
+        if check_lethal:
+            from ..search.lethal import find_lethal
+
+            lethal = find_lethal(player_copy)
+            if lethal is not None:
+                return [(float("inf"), lethal)]
+        if workers > 1:
+            sequences = self._iter_search_parallel(
+                match_copy, player_copy, evaluator, think_ms, workers, k
+            )
+        else:
+            sequences = self._iter_search(match_copy, player_copy, evaluator, think_ms)
+        return heapq.nlargest(k, sequences, key=itemgetter(0))
 
-    def simulate_turn_actions(self, player: Player) -> List[Tuple[int, List[Action]]]:
+    def simulate_turn_actions(
+        self,
+        player: Player,
+        setup_turn: bool = True,
+        evaluator: Optional["Evaluator"] = None,
+        workers: int = 1,
+    ) -> List[Tuple[float, List[Action]]]:
         """
         Simulates all possible combinations of actions for this turn.
 
+        Prefer iter_turn_actions or top_k when not every sequence is needed at once.
+
         Args:
             player (Player): The player to simulate for.
+            setup_turn (bool): Whether to set up the turn on the copies before simulating.
+            evaluator (Optional[Evaluator]): Scores the end states in batches.
+            workers (int): Number of processes searching the subtrees of the first actions.
 
         Returns:
-            List[Tuple[int, List[Action]]]: A list of all possible sequences of actions.
+            List[Tuple[float, List[Action]]]: A list of all possible sequences of actions.
         """
-        match_copy = copy.deepcopy(self)
-        match_copy.turn += 1
+        return list(
+            self.iter_turn_actions(
+                player, setup_turn=setup_turn, evaluator=evaluator, workers=workers
+            )
+        )
+
+    def iter_turn_actions(
+        self,
+        player: Player,
+        setup_turn: bool = True,
+        evaluator: Optional["Evaluator"] = None,
+        think_ms: Optional[int] = None,
+        workers: int = 1,
+    ) -> Iterator[Tuple[float, List[Action]]]:
+        """
+        Lazily simulates the possible combinations of actions for this turn.
+
+        Sequences are yielded with their evaluation as soon as they are found (with an evaluator,
+        as soon as their batch is scored), so the caller can stop early. Every sequence is
+        yielded once.
+
+        With ``think_ms`` the sequences are explored with iterative deepening until the time budget
+        runs out, sequences cut off by the depth limit are evaluated as if the turn ended there.
+
+        With several ``workers`` the subtree of every first action is searched in a separate
+        process from a pickled snapshot of the state, and the sequences of a subtree are yielded
+        when its worker finishes.
+
+        Args:
+            player (Player): The player to simulate for.
+            setup_turn (bool): Whether to set up the turn on the copies before simulating.
+            evaluator (Optional[Evaluator]): Scores the end states in batches.
+            think_ms (Optional[int]): Wall-clock budget in milliseconds, None searches exhaustively.
+            workers (int): Number of processes searching the subtrees of the first actions.
+
+        Yields:
+            Tuple[float, List[Action]]: The evaluation and the sequence of actions.
+        """
+        match_copy, player_copy = self._copy_for_simulation(player, setup_turn)
+        if workers > 1:
+            yield from self._iter_search_parallel(
+                match_copy, player_copy, evaluator, think_ms, workers
+            )
+        else:
+            yield from self._iter_search(match_copy, player_copy, evaluator, think_ms)
+
+    @staticmethod
+    def _iter_search(
+        match: "Match",
+        player: Player,
+        evaluator: Optional["Evaluator"] = None,
+        think_ms: Optional[int] = None,
+        first_action: Optional[str] = None,
+    ) -> Iterator[Tuple[float, List[Action]]]:
+        """
+        Searches the turn of the given (already copied) player, see iter_turn_actions.
+
+        Args:
+            match (Match): The match copy.
+            player (Player): The player copy.
+            evaluator (Optional[Evaluator]): Scores the end states in batches.
+            think_ms (Optional[int]): Wall-clock budget in milliseconds, None searches exhaustively.
+            first_action (Optional[str]): Only search sequences starting with this action.
+
+        Yields:
+            Tuple[float, List[Action]]: The evaluation and the sequence of actions.
+        """
+        if think_ms is None:
+            yield from Match._iter_evaluated(
+                match, player, [], 0, evaluator=evaluator, first_action=first_action
+            )
+            return
 
-        player_copy = copy.deepcopy(player)
+        deadline = time.perf_counter() + think_ms / 1000
+        for max_depth in range(1, MAX_SEARCH_DEPTH + 1):
+            budget = _SearchBudget(deadline if max_depth > 1 else None)
+            for evaluation, sequence in Match._iter_evaluated(
+                match, player, [], 0, max_depth, budget, evaluator, first_action
+            ):
+                # Shorter sequences ended the turn by themselves and came up in an earlier iteration
+                if len(sequence) == max_depth:
+                    yield evaluation, sequence
+
+            # Stop when out of time or when nothing was cut off, a deeper iteration would repeat it
+            if budget.expired or not budget.truncated:
+                return
+
+    @staticmethod
+    def _iter_search_parallel(
+        match: "Match",
+        player: Player,
+        evaluator: Optional["Evaluator"],
+        think_ms: Optional[int],
+        workers: int,
+        k: Optional[int] = None,
+    ) -> Iterator[Tuple[float, List[Action]]]:
+        """
+        Searches the subtree of every first action of the turn in a process pool.
+
+        Args:
+            match (Match): The match copy.
+            player (Player): The player copy.
+            evaluator (Optional[Evaluator]): Scores the end states in batches.
+            think_ms (Optional[int]): Wall-clock budget of the whole search in milliseconds,
+                every subtree gets the time left when it starts.
+            workers (int): Number of worker processes.
+            k (Optional[int]): When given, every worker only returns its k best sequences.
+
+        Yields:
+            Tuple[float, List[Action]]: The evaluation and the sequence of actions.
+        """
+        first_actions = list(dict.fromkeys(action.name for action in player.gather_actions()))
+        if not first_actions:
+            return
+
+        # One deadline for all the subtrees, as wall-clock time to compare it across processes
+        deadline = None if think_ms is None else time.time() + think_ms / 1000
+        snapshot = pickle.dumps((match, player))
+        with ProcessPoolExecutor(max_workers=min(workers, len(first_actions))) as pool:
+            futures = [
+                pool.submit(_search_subtree, snapshot, name, evaluator, deadline, k)
+                for name in first_actions
+            ]
+            for future in as_completed(futures):
+                yield from future.result()
+
+    def _copy_for_simulation(
+        self, player: Player, setup_turn: bool = True
+    ) -> Tuple["Match", Player]:
+        """
+        Copies the match and the player for simulation, optionally setting up the player's turn.
+
+        Args:
+            player (Player): The player to simulate for.
+            setup_turn (bool): Whether to set up the turn on the copies.
+
+        Returns:
+            Tuple[Match, Player]: The match copy and the player copy.
+        """
+        # Copy both at once so the player copy stays one of the match copy's players,
+        # the copies get no data collector or GUI
+        memo: Dict[int, Any] = {id(self.data_collector): None}
+        if hasattr(self, "gui"):
+            memo[id(self.gui)] = None
+            memo[id(self.root)] = None
+        match_copy, player_copy = copy.deepcopy((self, player), memo)
         player_copy.print_actions = False
         player_copy.evaluate_actions = False
+        if player_copy.opponent is not None:
+            player_copy.opponent.print_actions = False
+            player_copy.opponent.evaluate_actions = False
+
+        if not setup_turn:
+            return match_copy, player_copy
+
+        match_copy.turn += 1
 
         # Manually setting up the player's turn since we can't use setup_turn with an int
         player_copy.has_added_energy = False
         player_copy.has_used_trainer = False
 
-        # Update conditions
+        # Update conditions and let the cards in play start their turn
         if player_copy.active_card:
-            player_copy.active_card.update_conditions()
+            player_copy.events.emit(Event.ON_TURN_START, player_copy)
             if match_copy.turn > 2:
-                player_copy.active_card.can_evolve = True
-        elif match_copy.turn > 2:
+                for card in player_copy.active_card_and_bench:
+                    card.can_evolve = True
+        for card in player_copy.active_card_and_bench:
+            card.update_conditions()
+        if not player_copy.active_card and match_copy.turn > 2:
             # If active card is knocked out and there are no cards on the bench
             # Game over
             if len(player_copy.bench) == 0:
@@ -220,72 +497,159 @@ class Match:
                 player_copy.set_active_card_from_bench(random.choice(player_copy.bench))
 
         # Draw card
-        drawn_card = player_copy.deck.draw_card()
-        if drawn_card is not None:
-            player_copy.hand.append(drawn_card)
-
-        all_sequences: List[Tuple[int, List[Action]]] = []
-        self._simulate_recursive(
-            match_copy,
-            player_copy,
-            current_sequence=[],
-            all_sequences=all_sequences,
-            depth=0,
-        )
+        CardDraw(player_copy).resolve()
 
-        # Print all possible sequences of actions
-        unique_sequences = []
-        seen_sequences = set()
-
-        for sequence in all_sequences:
-            sequence_tuple = tuple(action.name for action in sequence[1])
-            if sequence_tuple not in seen_sequences:
-                seen_sequences.add(sequence_tuple)
-                unique_sequences.append(sequence)
-
-        return unique_sequences
+        return match_copy, player_copy
 
     @staticmethod
-    def _simulate_recursive(
+    def _iter_evaluated(
         match: "Match",
         player: "Player",
         current_sequence: List[Action],
-        all_sequences: List[Tuple[int, List[Action]]],
         depth: int,
-    ) -> None:
+        max_depth: int = MAX_SEARCH_DEPTH,
+        budget: Optional["_SearchBudget"] = None,
+        evaluator: Optional["Evaluator"] = None,
+        first_action: Optional[str] = None,
+    ) -> Iterator[Tuple[float, List[Action]]]:
         """
-        Recursively simulates actions and collects all possible sequences.
+        Yields every finished sequence with the evaluation of its end state.
 
         Args:
             match (Match): The current match.
             player (Player): The player whose actions are being simulated.
             current_sequence (List[Action]): The current sequence of actions taken.
-            all_sequences (List[Tuple[int, List[Action]]]): The list to store all possible sequences of actions.
             depth (int): The current recursion depth.
+            max_depth (int): Sequences reaching this many actions are evaluated as leaves.
+            budget (Optional[_SearchBudget]): Deadline bookkeeping for anytime search.
+            evaluator (Optional[Evaluator]): When given, end states are buffered and scored in
+                batches by it instead of one at a time by Player.evaluate_player.
+            first_action (Optional[str]): When given, only the action with this name is taken
+                at this node, see _iter_sequences.
+
+        Yields:
+            Tuple[float, List[Action]]: The evaluation and the sequence.
         """
+        sequences = Match._iter_sequences(
+            match, player, current_sequence, depth, max_depth, budget, first_action=first_action
+        )
 
-        if depth > 10:
+        if evaluator is None:
+            for new_sequence, _, player_copy in sequences:
+                yield Player.evaluate_player(player_copy), new_sequence
             return
 
+        from ..search.evaluator import LeafBuffer
+
+        buffer = LeafBuffer(evaluator)
+        for new_sequence, _, player_copy in sequences:
+            buffer.add(player_copy, new_sequence)
+            if buffer.full:
+                yield from buffer.flush()
+        yield from buffer.flush()
+
+    @staticmethod
+    def _iter_sequences(
+        match: "Match",
+        player: "Player",
+        current_sequence: List[Action],
+        depth: int,
+        max_depth: int = MAX_SEARCH_DEPTH,
+        budget: Optional["_SearchBudget"] = None,
+        seen: Optional[Set[Hashable]] = None,
+        first_action: Optional[str] = None,
+    ) -> Iterator[Tuple[List[Action], "Match", "Player"]]:
+        """
+        Recursively simulates actions and yields every finished sequence with its end state.
+
+        The match and the player are copied together so that the yielded player is one of the
+        yielded match's players, which lets the caller keep simulating from the end state.
+
+        Args:
+            match (Match): The current match.
+            player (Player): The player whose actions are being simulated.
+            current_sequence (List[Action]): The current sequence of actions taken.
+            depth (int): The current recursion depth.
+            max_depth (int): Sequences reaching this many actions are treated as finished.
+            budget (Optional[_SearchBudget]): Deadline bookkeeping for anytime search.
+            seen (Optional[Set[Hashable]]): State keys already reached. When given, an action
+                reaching a state that another order of actions already reached is skipped.
+            first_action (Optional[str]): When given, only the action with this name is taken
+                at this node.
+
+        Yields:
+            Tuple[List[Action], Match, Player]: The sequence, the match copy and the player copy.
+        """
         actions = player.gather_actions()
+        names_seen: Set[str] = set()
 
         for action in actions:
-            player_copy = copy.deepcopy(player)
-            match_copy = copy.deepcopy(match)
+            if budget is not None and budget.check_expired():
+                return
+
+            # Actions with the same name are interchangeable, find_action replays the first one
+            if action.name in names_seen:
+                continue
+            names_seen.add(action.name)
+            if first_action is not None and action.name != first_action:
+                continue
+
+            match_copy, player_copy = copy.deepcopy((match, player))
             new_actions = player_copy.act_and_regather_actions(match_copy, action)
             new_sequence = current_sequence + [action]
-            if new_actions and player_copy.can_continue:
-                Match._simulate_recursive(
+
+            if seen is not None:
+                from ..search.transposition import state_key
+
+                key = (player_copy.can_continue, state_key(match_copy, player_copy))
+                if key in seen:
+                    continue
+                seen.add(key)
+
+            if new_actions and player_copy.can_continue and depth + 1 < max_depth:
+                yield from Match._iter_sequences(
                     match_copy,
                     player_copy,
                     new_sequence,
-                    all_sequences,
                     depth=depth + 1,
+                    max_depth=max_depth,
+                    budget=budget,
+                    seen=seen,
                 )
             else:
-                # If no new actions, add the current sequence to all_sequences
-                evaluation = Player.evaluate_player(player_copy)
-                all_sequences.append((evaluation, new_sequence))
+                if budget is not None and new_actions and player_copy.can_continue:
+                    budget.truncated = True
+                # If no new actions, the sequence is finished
+                yield new_sequence, match_copy, player_copy
 
     def __repr__(self) -> str:
         return f"Match(starting_player={self.starting_player.name}, second_player={self.second_player.name}, turn={self.turn})"
+
+
+def _search_subtree(
+    snapshot: bytes,
+    first_action: str,
+    evaluator: Optional["Evaluator"],
+    deadline: Optional[float],
+    k: Optional[int],
+) -> List[Tuple[float, List[Action]]]:
+    """
+    Worker of the parallel turn search: searches the sequences starting with one action.
+
+    Args:
+        snapshot (bytes): The pickled (match, player) copies.
+        first_action (str): The name of the first action of the subtree.
+        evaluator (Optional[Evaluator]): Scores the end states in batches.
+        deadline (Optional[float]): The time.time() the search ends at, None searches
+            exhaustively. Past it, only the shortest sequences are searched.
+        k (Optional[int]): When given, only the k best sequences are returned.
+
+    Returns:
+        List[Tuple[float, List[Action]]]: The evaluated sequences of the subtree.
+    """
+    think_ms = None if deadline is None else max(0, int((deadline - time.time()) * 1000))
+    match, player = pickle.loads(snapshot)
+    sequences = Match._iter_search(match, player, evaluator, think_ms, first_action)
+    if k is None:
+        return list(sequences)
+    return heapq.nlargest(k, sequences, key=itemgetter(0))
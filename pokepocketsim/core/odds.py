@@ -0,0 +1,304 @@
+"""
+Exact draw probabilities of a deck.
+
+Answers questions like "how likely is a basic pokemon in the opening hand", "how likely is
+Kirlia in hand by my third turn" or "how likely are two psychic energies in the first three
+turns" with hypergeometric, binomial and dynamic programming arithmetic instead of simulation.
+
+The model follows the engine: the deck is shuffled once, the opening hand is its top
+OPENING_HAND cards, and a player draws one card and one energy at the start of each of its
+turns. Cards are drawn without replacement, energies are drawn independently and uniformly
+from the deck's energy types. Nothing is mulliganed and nothing is searched out of the deck.
+
+DeckOdds are cached per deck fingerprint, so asking the same deck again is a dictionary lookup
+and every answer after the first is a few microseconds.
+"""
+
+from collections import Counter
+from fractions import Fraction
+from functools import lru_cache
+from math import comb
+from typing import TYPE_CHECKING, Dict, Iterable, List, Mapping, Tuple, Union
+
+from .card import Card
+
+if TYPE_CHECKING:
+    from .deck import Deck
+
+# Cards dealt to each player before the first turn, see Player.__init__
+OPENING_HAND = 5
+
+# Energy cost entries any energy type pays for
+COLORLESS = "colorless"
+
+Cards = Union[str, Iterable[str]]
+
+
+@lru_cache(maxsize=4096)
+def hypergeometric_at_least(population: int, successes: int, draws: int, k: int) -> float:
+    """
+    Probability of at least k successes in draws draws without replacement.
+
+    Args:
+        population (int): The number of cards.
+        successes (int): The number of them that count as a success.
+        draws (int): The number of cards drawn, clamped to the population.
+        k (int): The fewest successes asked for.
+
+    Returns:
+        float: The probability.
+    """
+    draws = min(draws, population)
+    if k <= 0:
+        return 1.0
+    if draws <= 0 or k > min(draws, successes):
+        return 0.0
+    favourable = sum(
+        comb(successes, i) * comb(population - successes, draws - i)
+        for i in range(k, min(draws, successes) + 1)
+    )
+    return favourable / comb(population, draws)
+
+
+@lru_cache(maxsize=4096)
+def binomial_at_least(trials: int, p: float, k: int, exactly: bool = False) -> float:
+    """
+    Probability of at least (or exactly) k successes in independent trials.
+
+    Args:
+        trials (int): The number of trials.
+        p (float): The probability of success of a trial.
+        k (int): The number of successes asked for.
+        exactly (bool): Whether to ask for exactly k successes.
+
+    Returns:
+        float: The probability.
+    """
+    if exactly:
+        if k < 0 or k > trials:
+            return 0.0
+        return comb(trials, k) * p**k * (1 - p) ** (trials - k)
+    return sum(
+        comb(trials, i) * p**i * (1 - p) ** (trials - i) for i in range(max(k, 0), trials + 1)
+    )
+
+
+@lru_cache(maxsize=4096)
+def _multivariate_at_least(
+    population: int, groups: Tuple[Tuple[int, int], ...], draws: int
+) -> float:
+    """
+    Probability that a draw without replacement has at least need cards of every group.
+
+    Dynamic programming over the groups: ways[j] counts the ways to choose j cards of the
+    groups seen so far that meet their needs, the other cards fill the rest of the draw.
+
+    Args:
+        population (int): The number of cards.
+        groups (Tuple[Tuple[int, int], ...]): (size, need) of disjoint groups of cards.
+        draws (int): The number of cards drawn, clamped to the population.
+    """
+    draws = min(draws, population)
+    ways = [1] + [0] * draws
+    for size, need in groups:
+        next_ways = [0] * (draws + 1)
+        for chosen, count in enumerate(ways):
+            if count == 0:
+                continue
+            for taken in range(need, min(size, draws - chosen) + 1):
+                next_ways[chosen + taken] += count * comb(size, taken)
+        ways = next_ways
+
+    others = population - sum(size for size, _ in groups)
+    favourable = sum(count * comb(others, draws - chosen) for chosen, count in enumerate(ways))
+    return favourable / comb(population, draws)
+
+
+@lru_cache(maxsize=4096)
+def _energy_at_least(
+    weights: Tuple[float, ...], needs: Tuple[int, ...], colorless: int, draws: int
+) -> float:
+    """
+    Probability that draws independent energy draws pay for a cost.
+
+    Dynamic programming over the draws, with the count of every energy type capped at its need
+    and the count of the other energies capped at what colorless still needs.
+
+    Args:
+        weights (Tuple[float, ...]): The probability of every needed energy type per draw.
+        needs (Tuple[int, ...]): The energies of every type the cost needs.
+        colorless (int): The energies of any type the cost needs on top.
+        draws (int): The number of energy draws.
+    """
+    other = 1.0 - sum(weights)
+    states: Dict[Tuple[int, ...], float] = {(0,) * (len(needs) + 1): 1.0}
+    for _ in range(draws):
+        next_states: Dict[Tuple[int, ...], float] = {}
+        for state, probability in states.items():
+            outcomes = [(i, weight) for i, weight in enumerate(weights)] + [(len(needs), other)]
+            for i, weight in outcomes:
+                if weight <= 0:
+                    continue
+                counts = list(state)
+                if i < len(needs) and counts[i] < needs[i]:
+                    counts[i] += 1
+                else:
+                    # A surplus energy of a needed type or another type pays for colorless
+                    counts[-1] = min(counts[-1] + 1, colorless)
+                key = tuple(counts)
+                next_states[key] = next_states.get(key, 0.0) + probability * weight
+        states = next_states
+
+    return sum(
+        probability
+        for state, probability in states.items()
+        if all(count >= need for count, need in zip(state, needs)) and state[-1] >= colorless
+    )
+
+
+class DeckOdds:
+    """
+    Exact draw probabilities of one deck, see the module documentation.
+
+    Turns are counted per player: turn 1 is the player's first turn, after the opening hand
+    and one draw, so by turn t the player has seen OPENING_HAND + t cards.
+
+    Attributes:
+        size (int): The number of cards in the deck.
+        counts (Dict[str, int]): The number of copies of every card, item and supporter name.
+        basics (List[str]): The names of the basic pokemon.
+        energy_types (Dict[str, Fraction]): The probability of every energy type per draw.
+    """
+
+    def __init__(
+        self, counts: Mapping[str, int], basics: Iterable[str], energy_types: List[str]
+    ) -> None:
+        self.counts: Dict[str, int] = dict(counts)
+        self.size: int = sum(self.counts.values())
+        self.basics: List[str] = sorted(set(basics))
+        total = len(energy_types)
+        self.energy_types: Dict[str, Fraction] = {
+            energy: Fraction(count, total) for energy, count in Counter(energy_types).items()
+        }
+
+    @staticmethod
+    def cards_seen(turn: int) -> int:
+        """The number of cards a player has drawn by its turn, 0 for the opening hand."""
+        return OPENING_HAND + max(turn, 0)
+
+    def _copies(self, cards: Cards) -> int:
+        names = {cards} if isinstance(cards, str) else set(cards)
+        return sum(self.counts.get(name, 0) for name in names)
+
+    def probability(self, cards: Cards, turn: int = 0, at_least: int = 1) -> float:
+        """
+        Probability of having drawn at least at_least of the cards by the player's turn.
+
+        Args:
+            cards (Union[str, Iterable[str]]): A name, or several names counted together.
+            turn (int): The player's turn, 0 for the opening hand.
+            at_least (int): The fewest copies asked for.
+
+        Returns:
+            float: The probability.
+        """
+        return hypergeometric_at_least(
+            self.size, self._copies(cards), self.cards_seen(turn), at_least
+        )
+
+    def probability_all(self, needs: Mapping[str, int], turn: int = 0) -> float:
+        """
+        Probability of having drawn every card in the asked numbers by the player's turn.
+
+        Args:
+            needs (Mapping[str, int]): The fewest copies asked for per name,
+                e.g. {"Ralts": 1, "Kirlia": 1}.
+            turn (int): The player's turn, 0 for the opening hand.
+
+        Returns:
+            float: The probability.
+        """
+        groups = tuple(
+            sorted((self.counts.get(name, 0), need) for name, need in needs.items() if need > 0)
+        )
+        if any(need > size for size, need in groups):
+            return 0.0
+        return _multivariate_at_least(self.size, groups, self.cards_seen(turn))
+
+    def basic_in_opening_hand(self) -> float:
+        """Probability of at least one basic pokemon in the opening hand."""
+        return self.probability(self.basics)
+
+    def first_drawn(self, cards: Cards, turns: int) -> List[float]:
+        """
+        Distribution of the turn the first of the cards is drawn.
+
+        Args:
+            cards (Union[str, Iterable[str]]): A name, or several names counted together.
+            turns (int): The last turn to report.
+
+        Returns:
+            List[float]: Element t is the probability that the first copy arrives on turn t,
+                element 0 for the opening hand. The rest of the probability is later.
+        """
+        by_turn = [self.probability(cards, turn) for turn in range(turns + 1)]
+        return [by_turn[0]] + [by_turn[t] - by_turn[t - 1] for t in range(1, turns + 1)]
+
+    def energy_probability(
+        self, energy: str, count: int, draws: int, exactly: bool = False
+    ) -> float:
+        """
+        Probability that count of the first draws energy draws are of the energy type.
+
+        Args:
+            energy (str): The energy type, e.g. "psychic".
+            count (int): The number of energies of the type asked for.
+            draws (int): The number of energy draws, one per turn of the player.
+            exactly (bool): Whether to ask for exactly count energies instead of at least.
+
+        Returns:
+            float: The probability.
+        """
+        p = float(self.energy_types.get(energy, 0))
+        return binomial_at_least(draws, p, count, exactly)
+
+    def energy_for_cost(self, cost: Mapping[str, int], draws: int) -> float:
+        """
+        Probability that the first draws energy draws pay for an energy cost.
+
+        Args:
+            cost (Mapping[str, int]): The energies needed per type, "colorless" is paid by any.
+            draws (int): The number of energy draws.
+
+        Returns:
+            float: The probability.
+        """
+        typed = sorted((energy, need) for energy, need in cost.items() if energy != COLORLESS)
+        weights = tuple(float(self.energy_types.get(energy, 0)) for energy, _ in typed)
+        needs = tuple(need for _, need in typed)
+        return _energy_at_least(weights, needs, cost.get(COLORLESS, 0), draws)
+
+
+# DeckOdds by deck fingerprint
+_ODDS: Dict[str, DeckOdds] = {}
+
+
+def deck_odds(deck: "Deck") -> DeckOdds:
+    """
+    The DeckOdds of the deck, cached by its fingerprint.
+
+    Args:
+        deck (Deck): The deck, its order does not matter.
+
+    Returns:
+        DeckOdds: The calculator for the deck's cards and energy types.
+    """
+    from .deck import card_name
+
+    fingerprint = deck.fingerprint()
+    odds = _ODDS.get(fingerprint)
+    if odds is None:
+        counts = Counter(card_name(card) for card in deck.cards)
+        basics = [card.name for card in deck.cards if isinstance(card, Card) and card.is_basic]
+        odds = _ODDS[fingerprint] = DeckOdds(counts, basics, list(deck.energy_types))
+    return odds
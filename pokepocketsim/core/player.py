@@ -10,12 +10,16 @@ from typing import (
     cast,
 )
 
-from ..mechanics.action import Action, ActionType
+from ..mechanics.action import Action, ActionNotFoundError, ActionType
+from ..mechanics.chance import CardDraw, EnergyDraw, RetreatTarget
+from ..mechanics.events import Event, EventBus
 from ..utils import color_print as cprint
 from ..utils import config
 from .card import Card
 
 if TYPE_CHECKING:
+    from ..protocols import IPlanner
+    from ..search.evaluator import Evaluator
     from ..state.player_state import PlayerState
     from .deck import Deck
     from .match import Match
@@ -46,9 +50,24 @@ class Player:
         current_energy (Optional[str]): The current energy available to the player.
         has_used_trainer (bool): Indicates if the player has used a trainer card this turn.
         has_added_energy (bool): Indicates if the player has added energy this turn.
+        evaluate_actions (bool): Whether the player plans its turn with the turn planner.
+        think_ms (Optional[int]): Per-decision time budget for the planner in milliseconds.
+            Setting it enables the planner, None plans exhaustively.
+        planner (Optional[IPlanner]): A search planner (e.g. search.Expectimax) used instead
+            of the single turn planner. Setting it enables planning.
+        evaluator (Optional[Evaluator]): Batch evaluator (e.g. search.LinearEvaluator) the turn
+            planner scores end states with, None uses evaluate_player.
+        events (EventBus): The event handlers of the player's cards in play.
     """
 
-    def __init__(self, name: str, deck: "Deck", is_bot: bool = True) -> None:
+    def __init__(
+        self,
+        name: str,
+        deck: "Deck",
+        is_bot: bool = True,
+        think_ms: Optional[int] = None,
+        planner: Optional["IPlanner"] = None,
+    ) -> None:
         self.name: str = name
         self.deck: Deck = deck
         self.is_bot: bool = is_bot
@@ -67,7 +86,11 @@ class Player:
         self.has_added_energy: bool = False
         self.can_continue: bool = True
         self.id: uuid.UUID = uuid.uuid4()
-        self.evaluate_actions: bool = False
+        self.events: EventBus = EventBus()
+        self.think_ms: Optional[int] = think_ms
+        self.planner: Optional[IPlanner] = planner
+        self.evaluator: Optional[Evaluator] = None
+        self.evaluate_actions: bool = think_ms is not None or planner is not None
         self.print_actions: bool = True
 
         self.cname = (
@@ -84,7 +107,15 @@ class Player:
         self.opponent = opponent
 
     def start_turn(self, match: "Match") -> bool:
-        self.setup_turn(match)
+        """
+        Play the player's turn.
+
+        Returns:
+            bool: True if the game is over: the player won, or had no pokemon left to play
+                with and lost.
+        """
+        if not self.setup_turn(match):
+            return True
         return self.process_action_loop(match)
 
     def choose_action(self, actions: List[Action], print_actions: bool = True) -> int:
@@ -105,8 +136,12 @@ class Player:
                 print("Invalid input. Please enter a number.")
 
     def process_action_loop(self, match: "Match") -> bool:
-        # Gather actions
-        actions: List[Action] = self.gather_actions()
+        # Gather actions, or plan the whole turn when evaluating actions
+        actions: List[Action]
+        if self.evaluate_actions:
+            actions = self.plan_turn(match)
+        else:
+            actions = self.gather_actions()
 
         self.can_continue = True
 
@@ -135,13 +170,11 @@ class Player:
             else:
                 self.points += 1
 
+            self.opponent.events.leave(self.opponent.active_card)
             self.opponent.active_card = None
 
-            if self.points >= 3:
-                return True
-            else:
-                return False
-        return False
+        # Bench knockouts score without knocking out the active card, recheck the points
+        return self.points >= 3
 
     def print_possible_actions(self, actions: List[Action]) -> None:
         if self.print_actions:
@@ -153,10 +186,26 @@ class Player:
                     action_str = str(action)
                 print(f"\t{i}: {action_str}")
 
+    def plan_turn(self, match: "Match") -> List[Action]:
+        """Plan the rest of the current turn with the player's planner or the turn planner."""
+        if self.planner is not None:
+            return self.planner.plan(match, self)
+        return match.get_best_actions_for_player(
+            self, think_ms=self.think_ms, setup_turn=False, evaluator=self.evaluator
+        )
+
     def process_best_actions(self, match: "Match", best_actions: List[Action]) -> List[Action]:
         if best_actions:
             actions = self.gather_actions()
-            best_action = Action.find_action(actions, best_actions[0])
+            try:
+                best_action = Action.find_action(actions, best_actions[0])
+            except ActionNotFoundError:
+                # A random outcome (e.g. the retreat target) left the plan, plan again from here
+                best_actions = self.plan_turn(match)
+                if not best_actions:
+                    self.can_continue = False
+                    return []
+                best_action = Action.find_action(actions, best_actions[0])
             self.act_and_regather_actions(match, best_action)
             best_actions.pop(0)
             return best_actions
@@ -282,6 +331,7 @@ class Player:
             try:
                 card_to_evolve.evolve(evolution_card.name)
                 Player.remove_card_from_hand(player, evolution_card.uuid)
+                player.events.refresh(card_to_evolve)
             except Exception as e:
                 raise ValueError(
                     f"Failed to evolve {card_to_evolve.name} to {evolution_card.name}: {e}"
@@ -300,24 +350,26 @@ class Player:
         player.active_card.remove_retreat_cost_energy()
         player.move_active_card_to_bench()
 
-    def move_active_card_to_bench(self) -> None:
+    def move_active_card_to_bench(self, target: Optional[int] = None) -> None:
+        """
+        Swap the active card with a card of the bench.
+
+        Args:
+            target (Optional[int]): Index in the bench of the new active card, an outcome of
+                RetreatTarget. None picks a random one.
+        """
         if self.active_card is None:
             raise ValueError("No active card to move to bench")
         if not self.bench:
             raise ValueError("No cards in the bench to switch with")
+        if target is None:
+            target = RetreatTarget(self).sample()
 
         old_active_card = self.active_card
-        self.bench.append(self.active_card)
-
-        # Ensure the new active card is different from the old one
-        eligible_cards = [card for card in self.bench if card != old_active_card]
-        if eligible_cards:
-            self.active_card = random.choice(eligible_cards)
-            self.bench.remove(self.active_card)
-            if self.print_actions:
-                print(f"{old_active_card.name} retreated, {self.active_card.name} set as active")
-        else:
-            raise ValueError("No eligible cards in bench to set as active")
+        self.active_card = self.bench.pop(target)
+        self.bench.append(old_active_card)
+        if self.print_actions:
+            print(f"{old_active_card.name} retreated, {self.active_card.name} set as active")
 
     @staticmethod
     def set_active_card_from_hand(player: "Player", card_id: uuid.UUID) -> None:
@@ -327,6 +379,7 @@ class Player:
                 print(f"Setting active card from hand to {card.name}")
             player.active_card = card
             player.hand.remove(card)
+            player.events.enter(card)
         else:
             raise ValueError("Card not found in hand or invalid")
 
@@ -347,42 +400,24 @@ class Player:
         if len(player.bench) < 3:
             player.bench.append(card)
             player.hand.remove(card)
+            player.events.enter(card)
         else:
             raise ValueError("Bench is full, cannot add more cards")
 
-    def setup_turn(self, match: "Match") -> None:
-        self.has_added_energy = False
-        self.has_used_trainer = False
-
-        # For all cards in play, reset ability usage and enable evolution
-        if self.active_card:
-            for card in self.active_card_and_bench:
-                # Reset the ability property for each card
-                card.has_used_ability = False
-                if match.turn > 2:
-                    # Set this property to true, so the turn after placing the card they can be evolved
-                    card.can_evolve = True
-
-        # Update conditions
-        if self.active_card:
-            self.active_card.update_conditions()
-        elif match.turn > 2:
-            # If active card is knocked out and there are no cards on the bench
-            # Game over
-            if len(self.bench) == 0:
-                return
-            else:
-                self.set_active_card_from_bench(random.choice(self.bench))
+    def setup_turn(self, match: "Match") -> bool:
+        """
+        Reset the turn state and draw, at the start of the player's turn.
 
-        # Draw card
-        drawn_card = self.deck.draw_card()
-        if drawn_card is not None:
-            self.hand.append(drawn_card)
+        Returns:
+            bool: False if the player has no pokemon left to play with, which loses the game,
+                True otherwise.
+        """
+        if not self.reset_turn_state(match):
+            return False
 
-        # Draw energy
-        energy_type = self.deck.draw_energy()
-        if energy_type is not None:
-            self.current_energy = energy_type
+        # Draw card and energy
+        CardDraw(self).resolve()
+        EnergyDraw(self).resolve()
 
         # DATA COLLECTION: turn number, player name, state before turn
         if match.data_collector:
@@ -400,6 +435,38 @@ class Player:
             print(f"{self.cname} bench: ")
             for c in self.bench:
                 print("\t", c)
+        return True
+
+    def reset_turn_state(self, match: "Match") -> bool:
+        """
+        Reset the per-turn state at the start of the player's turn, before drawing.
+
+        Returns:
+            bool: False if the player has no pokemon left to play with, True otherwise.
+        """
+        self.has_added_energy = False
+        self.has_used_trainer = False
+
+        # For all cards in play, enable evolution, the cards with abilities reset them
+        if self.active_card:
+            self.events.emit(Event.ON_TURN_START, self)
+            if match.turn > 2:
+                for card in self.active_card_and_bench:
+                    # Set this property to true, so the turn after placing the card they can
+                    # be evolved
+                    card.can_evolve = True
+
+        # Update the conditions of every card in play, e.g. Giovanni's also stick to the bench
+        for card in self.active_card_and_bench:
+            card.update_conditions()
+        if not self.active_card and match.turn > 2:
+            # If active card is knocked out and there are no cards on the bench
+            # Game over
+            if len(self.bench) == 0:
+                return False
+            else:
+                self.set_active_card_from_bench(random.choice(self.bench))
+        return True
 
     @staticmethod
     def find_by_id(objects: List[Any], target_id: uuid.UUID) -> Optional[Any]:
@@ -422,18 +489,20 @@ class Player:
 
     @staticmethod
     def get_damage_dealt_to_cards(player: "Player") -> int:
-        damage_dealt = 0
         if player.active_card is None:
             return 0
 
-        for card in player.active_card_and_bench:
+        damage_dealt = player.active_card.max_hp - player.active_card.hp
+        for card in player.bench:
             damage_dealt += card.max_hp - card.hp
         return damage_dealt
 
     @staticmethod
     def get_number_of_evolved_cards(player: "Player") -> int:
         evolved_cards = 0
-        for card in player.active_card_and_bench:
+        if player.active_card is not None and not player.active_card.is_basic:
+            evolved_cards += 1
+        for card in player.bench:
             if not card.is_basic:
                 evolved_cards += 1
         return evolved_cards
@@ -2,14 +2,33 @@ import csv
 import json
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
+from .stats import CardCounter, Histogram, RunningStats, WinRate
+
 if TYPE_CHECKING:
     pass
 
+# Bins of the actions per turn histogram, one per number of actions
+ACTION_BINS = 20
+
 
 class DataCollector:
-    def __init__(self, file_path: str) -> None:
+    """
+    Collects the state before and after every turn and the actions taken in it.
+
+    Besides the rows, it keeps constant-memory statistics of the turns: the number of actions
+    per turn, its histogram and how often every action (named after the cards involved) was
+    taken, and the win rate of every player over the games collected. With keep_rows False
+    only the statistics are kept.
+    """
+
+    def __init__(self, file_path: str, keep_rows: bool = True) -> None:
         self.file_path: str = file_path
+        self.keep_rows: bool = keep_rows
         self.data: List[Dict[str, Any]] = []
+        self.actions_per_turn: RunningStats = RunningStats()
+        self.actions_histogram: Histogram = Histogram(0, ACTION_BINS, ACTION_BINS)
+        self.action_counts: CardCounter = CardCounter()
+        self.win_rates: Dict[str, WinRate] = {}
         self.turn: Optional[int] = None
         self.active_player: Optional[str] = None
         self.match_state_before: Optional[Dict[str, Any]] = None
@@ -24,6 +43,9 @@ class DataCollector:
         actions_taken: List[Dict[str, Any]],
         match_state_after: Dict[str, Any],
     ) -> None:
+        self.add_statistics(actions_taken)
+        if not self.keep_rows:
+            return
         self.data.append(
             {
                 "turn": turn,
@@ -43,21 +65,41 @@ class DataCollector:
         ):
             return
 
-        self.data.append(
-            {
-                "turn": self.turn,
-                "active_player": self.active_player,
-                "match_state_before": json.dumps(self.match_state_before),
-                "actions_taken": json.dumps(self.actions_taken),
-                "match_state_after": json.dumps(self.match_state_after),
-            }
-        )
+        self.add_statistics(self.actions_taken)
+        if self.keep_rows:
+            self.data.append(
+                {
+                    "turn": self.turn,
+                    "active_player": self.active_player,
+                    "match_state_before": json.dumps(self.match_state_before),
+                    "actions_taken": json.dumps(self.actions_taken),
+                    "match_state_after": json.dumps(self.match_state_after),
+                }
+            )
         self.turn = None
         self.active_player = None
         self.match_state_before = None
         self.actions_taken = []
         self.match_state_after = None
 
+    def add_statistics(self, actions_taken: List[Dict[str, Any]]) -> None:
+        """Update the turn statistics with the actions taken in a turn."""
+        self.actions_per_turn.add(len(actions_taken))
+        self.actions_histogram.add(len(actions_taken))
+        self.action_counts.add(action["name"] for action in actions_taken)
+
+    def add_game(self, names: List[str], winner: Optional[str]) -> None:
+        """
+        Update the win rates of the players with the outcome of a game.
+
+        Args:
+            names (List[str]): The names of the players of the game.
+            winner (Optional[str]): The name of the winner, None if the game has none.
+        """
+        for name in names:
+            win_rate = self.win_rates.setdefault(name, WinRate())
+            win_rate.add(None if winner is None else name == winner)
+
     def save_to_csv(self) -> None:
         with open(self.file_path, mode="w", newline="") as file:
             writer = csv.DictWriter(
@@ -3,9 +3,32 @@ Game engine module for Pokemon Pocket Simulator.
 Provides decoupled game logic for UI-independent operation.
 """
 
-from .action_engine import execute_action, get_available_actions
+from .action_engine import execute_action, get_available_actions, sample_action
+from .playout import (
+    PlayoutResult,
+    begin_turn,
+    play_action,
+    play_actions,
+    play_turn,
+    playout,
+    random_policy,
+)
+
+# Version of the rules as the engine plays them. Bump it with every change to the engine, the
+# mechanics or the card database that can change the outcome of games: it is part of the deck
+# fingerprints, so results cached for the old rules are not used anymore.
+ENGINE_VERSION = 8
 
 __all__ = [
+    "ENGINE_VERSION",
     "get_available_actions",
     "execute_action",
+    "sample_action",
+    "PlayoutResult",
+    "begin_turn",
+    "play_action",
+    "play_actions",
+    "play_turn",
+    "playout",
+    "random_policy",
 ]
@@ -3,11 +3,15 @@ Game engine for Pokemon Pocket Simulator.
 Decouples game logic from UI by separating action discovery from execution.
 """
 
-from typing import TYPE_CHECKING, List, Optional, cast
+import random
+import uuid
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple, cast
 
 from ..core.card import Card
 from ..mechanics.action import Action, ActionType
 from ..mechanics.attack import Attack
+from ..mechanics.events import Event
 from ..mechanics.item import Item
 from ..mechanics.supporter import Supporter
 
@@ -15,6 +19,292 @@ if TYPE_CHECKING:
     from ..core.match import Match
     from ..core.player import Player
 
+# Cards a bench holds, as enforced by Player.add_card_to_bench
+MAX_BENCH = 3
+
+
+def use_on_card(player: "Player", item: Any, card_id: uuid.UUID) -> None:
+    """
+    Use an item or supporter on one of the player's pokemon in play.
+
+    Action functions look cards up by id instead of holding on to them, so that they act on
+    whichever copy of the player they are called with and can be pickled.
+
+    Args:
+        player: The player using the card
+        item: The item or supporter instance to use
+        card_id: The uuid of the pokemon to use it on
+    """
+    from ..core.player import Player as PlayerClass
+
+    card = PlayerClass.find_by_id(player.active_card_and_bench, card_id)
+    if card is None:
+        raise ValueError("Card not found in play")
+    hp = card.hp
+    item.use(card)
+    if player.print_actions:
+        name = getattr(item, "name", item.__class__.__name__)
+        print(f"\t- {name} used on {card.name}. Restored {card.hp - hp} HP. Current HP: {card.hp}")
+
+
+def end_turn(player: "Player") -> None:
+    """End the player's turn."""
+    player.can_continue = False
+
+
+# Action discovery is split into families. A family lists its targets, light-weight tuples
+# that are cheap to find, and builds the action of a target only when it is needed.
+# get_available_actions builds every target in order, sample_action only the one it draws.
+
+
+def _potion_targets(player: "Player") -> List[Any]:
+    # ITEM ACTIONS: Potion cards
+    potion_cards = [
+        card
+        for card in player.hand
+        if hasattr(card, "card_able_to_use") and card.__class__.__name__ == "Potion"
+    ]
+    if not potion_cards:
+        return []
+
+    from ..protocols import ICard
+
+    potion = Item.Potion()
+    damaged = [
+        pokemon
+        for pokemon in player.active_card_and_bench
+        if potion.card_able_to_use(cast(ICard, pokemon))
+    ]
+    return [pokemon for _ in potion_cards for pokemon in damaged]
+
+
+def _potion_action(player: "Player", pokemon: Card) -> Action:
+    current_potion = Item.Potion()  # Create instance for the action
+    return Action(
+        f"Use potion on ({pokemon})",
+        partial(use_on_card, item=current_potion, card_id=pokemon.uuid),
+        ActionType.ITEM,
+        item_class=Item.Potion,
+    )
+
+
+def _erika_targets(player: "Player") -> List[Any]:
+    # SUPPORTER ACTIONS (if not used this turn): Erika cards
+    if player.has_used_trainer:
+        return []
+    erika_cards = [
+        card
+        for card in player.hand
+        if hasattr(card, "card_able_to_use") and card.__class__.__name__ == "Erika"
+    ]
+    if not erika_cards:
+        return []
+
+    erika = Supporter.Erika()
+    grass = [pokemon for pokemon in player.active_card_and_bench if erika.card_able_to_use(pokemon)]
+    return [pokemon for _ in erika_cards for pokemon in grass]
+
+
+def _erika_action(player: "Player", pokemon: Card) -> Action:
+    current_erika = Supporter.Erika()  # Create instance for the action
+    return Action(
+        f"Use Erika on ({pokemon})",
+        partial(use_on_card, item=current_erika, card_id=pokemon.uuid),
+        ActionType.SUPPORTER,
+        item_class=Supporter.Erika,
+    )
+
+
+def _giovanni_targets(player: "Player") -> List[Any]:
+    # SUPPORTER ACTIONS (if not used this turn): Giovanni cards
+    if player.has_used_trainer:
+        return []
+    for card in player.hand:
+        if hasattr(card, "name") and card.__class__.__name__ == "Giovanni":
+            return [None]
+    return []
+
+
+def _giovanni_action(player: "Player", target: None) -> Action:
+    giovanni = Supporter.Giovanni()
+    return Action(
+        "Use Giovanni",
+        giovanni.use,
+        ActionType.SUPPORTER,
+        item_class=Supporter.Giovanni,
+    )
+
+
+def _evolution_targets(player: "Player") -> List[Any]:
+    # EVOLUTION ACTIONS
+    targets = []
+    for card in player.hand:
+        if isinstance(card, Card) and card.evolves_from is not None:
+            evolves_from_name = card.evolves_from if isinstance(card.evolves_from, str) else None
+            for card_to_evolve in player.active_card_and_bench:
+                if (
+                    card_to_evolve
+                    and evolves_from_name
+                    and evolves_from_name == card_to_evolve.name
+                    and card_to_evolve.can_evolve
+                ):
+                    targets.append((card_to_evolve, card))
+    return targets
+
+
+def _evolution_action(player: "Player", target: Tuple[Card, Card]) -> Action:
+    from ..core.player import Player as PlayerClass
+
+    card_to_evolve, card = target
+    return Action(
+        f"Evolve {card_to_evolve.name} to {card.name}",
+        partial(
+            PlayerClass.evolve_and_remove_from_hand,
+            card_to_evolve_id=card_to_evolve.uuid,
+            evolution_card_id=card.uuid,
+        ),
+        ActionType.EVOLVE,
+    )
+
+
+def _ability_targets(player: "Player") -> List[Any]:
+    # ABILITY ACTIONS, the abilities in play build their actions themselves
+    targets: List[Any] = []
+    for card, gather_actions in player.events.subscribers[Event.ON_GATHER_ACTIONS]:
+        if (
+            not card.has_used_ability
+            and hasattr(card.ability, "able_to_use")
+            and card.ability.able_to_use(player)
+        ):
+            targets.extend(gather_actions(player, card))
+    return targets
+
+
+def _ability_action(player: "Player", ability_action: Action) -> Action:
+    return ability_action
+
+
+def _attack_targets(player: "Player") -> List[Any]:
+    # ATTACK ACTIONS
+    active_card = cast(Card, player.active_card)
+    return [attack for attack in active_card.attacks if Attack.can_use_attack(active_card, attack)]
+
+
+def _attack_action(player: "Player", attack: Any) -> Action:
+    if isinstance(attack, dict):
+        func_name = attack.get("title", "").lower().replace(" ", "_")
+        attack_callable = getattr(Attack, func_name)
+        display_name = attack.get("title", str(attack))
+    else:
+        attack_callable = attack
+        display_name = getattr(attack, "__name__", str(attack))
+
+    return Action(
+        f"{cast(Card, player.active_card).name} use {display_name}",
+        attack_callable,
+        ActionType.ATTACK,
+        can_continue_turn=False,
+    )
+
+
+def _retreat_targets(player: "Player") -> List[Any]:
+    # RETREAT ACTIONS
+    active_card = cast(Card, player.active_card)
+    if active_card.get_total_energy() >= active_card.retreat_cost and len(player.bench) > 0:
+        return [None]
+    return []
+
+
+def _retreat_action(player: "Player", target: None) -> Action:
+    from ..core.player import Player as PlayerClass
+
+    return Action(
+        f"Retreat active card ({player.active_card})",
+        PlayerClass.retreat,
+        ActionType.FUNCTION,
+    )
+
+
+def _basic_targets(player: "Player") -> List[Any]:
+    # SET AN ACTIVE CARD when there is none
+    return [card for card in player.hand if isinstance(card, Card) and card.is_basic]
+
+
+def _bench_targets(player: "Player") -> List[Any]:
+    # ADD CARD TO BENCH, while the bench has room
+    if len(player.bench) >= MAX_BENCH:
+        return []
+    return _basic_targets(player)
+
+
+def _bench_action(player: "Player", card: Card) -> Action:
+    from ..core.player import Player as PlayerClass
+
+    return Action(
+        f"Add {card.name} to bench",
+        partial(PlayerClass.add_card_to_bench, card_id=card.uuid),
+        ActionType.ADD_CARD_TO_BENCH,
+    )
+
+
+def _energy_targets(player: "Player") -> List[Any]:
+    # ADD ENERGY
+    if player.has_added_energy is False and player.current_energy is not None:
+        return player.active_card_and_bench
+    return []
+
+
+def _energy_action(player: "Player", card: Card) -> Action:
+    from ..core.player import Player as PlayerClass
+
+    return Action(
+        f"Add {player.current_energy} energy to {card.name}",
+        partial(
+            PlayerClass._add_energy_action,
+            card_id=card.uuid,
+            energy=player.current_energy,
+        ),
+        ActionType.ADD_ENERGY,
+    )
+
+
+def _set_active_action(player: "Player", card: Card) -> Action:
+    from ..core.player import Player as PlayerClass
+
+    return Action(
+        f"Set {card.name} as active card",
+        partial(PlayerClass.set_active_card_from_hand, card_id=card.uuid),
+        ActionType.SET_ACTIVE_CARD,
+    )
+
+
+def _end_turn_action() -> Action:
+    return Action(
+        "End turn",
+        end_turn,
+        ActionType.END_TURN,
+        can_continue_turn=False,
+    )
+
+
+ActionFamily = Tuple[Callable[["Player"], List[Any]], Callable[["Player", Any], Action]]
+
+# Families of the actions of a player with an active card, in the order they are listed
+_IN_PLAY_FAMILIES: Tuple[ActionFamily, ...] = (
+    (_potion_targets, _potion_action),
+    (_erika_targets, _erika_action),
+    (_giovanni_targets, _giovanni_action),
+    (_evolution_targets, _evolution_action),
+    (_ability_targets, _ability_action),
+    (_attack_targets, _attack_action),
+    (_retreat_targets, _retreat_action),
+    (_bench_targets, _bench_action),
+    (_energy_targets, _energy_action),
+)
+
+# Families of a player without an active card
+_SETUP_FAMILIES: Tuple[ActionFamily, ...] = ((_basic_targets, _set_active_action),)
+
 
 def get_available_actions(player: "Player") -> List[Action]:
     """
@@ -27,207 +317,57 @@ def get_available_actions(player: "Player") -> List[Action]:
     Returns:
         List of Action objects representing all possible actions
     """
-    actions: List[Action] = []
+    families = _IN_PLAY_FAMILIES if player.active_card is not None else _SETUP_FAMILIES
 
-    if player.active_card is not None:
-        # ITEM ACTIONS: Potion cards
-        potion_cards = [
-            card
-            for card in player.hand
-            if hasattr(card, "card_able_to_use") and card.__class__.__name__ == "Potion"
-        ]
-
-        for _ in potion_cards:
-            from ..protocols import ICard
-
-            for pokemon in player.active_card_and_bench:
-                potion = Item.Potion()
-                if potion.card_able_to_use(cast(ICard, pokemon)):
-                    current_potion = Item.Potion()  # Create instance for lambda
-                    actions.append(
-                        Action(
-                            f"Use potion on ({pokemon})",
-                            lambda pokemon=pokemon, p=current_potion: p.use(cast(ICard, pokemon)),
-                            ActionType.ITEM,
-                            item_class=Item.Potion,
-                        )
-                    )
-
-        # SUPPORTER ACTIONS (if not used this turn)
-        if not player.has_used_trainer:
-            # Erika cards
-            erika_cards = [
-                card
-                for card in player.hand
-                if hasattr(card, "card_able_to_use") and card.__class__.__name__ == "Erika"
-            ]
-
-            for _ in erika_cards:
-                for pokemon in player.active_card_and_bench:
-                    erika = Supporter.Erika()
-                    if erika.card_able_to_use(pokemon):
-                        current_erika = Supporter.Erika()  # Create instance for lambda
-                        actions.append(
-                            Action(
-                                f"Use Erika on ({pokemon})",
-                                lambda card=pokemon, e=current_erika: e.use(card),
-                                ActionType.SUPPORTER,
-                                item_class=Supporter.Erika,
-                            )
-                        )
-
-            # Giovanni cards
-            giovanni_cards = [
-                card
-                for card in player.hand
-                if hasattr(card, "name") and card.__class__.__name__ == "Giovanni"
-            ]
-
-            if giovanni_cards:
-                giovanni = Supporter.Giovanni()
-                actions.append(
-                    Action(
-                        "Use Giovanni",
-                        lambda player=player: giovanni.use(player),
-                        ActionType.SUPPORTER,
-                        item_class=Supporter.Giovanni,
-                    )
-                )
-
-        # EVOLUTION ACTIONS
-        for card in player.hand:
-            if isinstance(card, Card) and card.evolves_from is not None:
-                for card_to_evolve in player.active_card_and_bench:
-                    evolves_from_name = (
-                        card.evolves_from if isinstance(card.evolves_from, str) else None
-                    )
-
-                    if (
-                        card_to_evolve
-                        and evolves_from_name
-                        and evolves_from_name == card_to_evolve.name
-                        and card_to_evolve.can_evolve
-                    ):
-                        from ..core.player import Player as PlayerClass
-
-                        actions.append(
-                            Action(
-                                f"Evolve {card_to_evolve.name} to {card.name}",
-                                lambda player=player, card_to_evolve_id=card_to_evolve.uuid, evolution_card_id=card.uuid: PlayerClass.evolve_and_remove_from_hand(
-                                    player,
-                                    card_to_evolve_id,
-                                    evolution_card_id,
-                                ),
-                                ActionType.EVOLVE,
-                            )
-                        )
-
-        # ABILITY ACTIONS
-        for card in player.active_card_and_bench:
-            if (
-                card.ability
-                and not card.has_used_ability
-                and hasattr(card.ability, "able_to_use")
-                and card.ability.able_to_use(player)
-            ):
-                ability_actions = card.ability.gather_actions(player, card)
-                for ability_action in ability_actions:
-                    actions.append(ability_action)
-
-        # ATTACK ACTIONS
-        for attack in player.active_card.attacks:
-            if isinstance(attack, dict):
-                func_name = attack.get("title", "").lower().replace(" ", "_")
-                attack_callable = getattr(Attack, func_name)
-                display_name = attack.get("title", str(attack))
-            else:
-                attack_callable = attack
-                display_name = getattr(attack, "__name__", str(attack))
-
-            if Attack.can_use_attack(player.active_card, attack):
-                actions.append(
-                    Action(
-                        f"{player.active_card.name} use {display_name}",
-                        lambda player, _atk=attack_callable: _atk(player),
-                        ActionType.ATTACK,
-                        can_continue_turn=False,
-                    )
-                )
-
-        # RETREAT ACTIONS
-        if (
-            player.active_card.get_total_energy() >= player.active_card.retreat_cost
-            and len(player.bench) > 0
-        ):
-            from ..core.player import Player as PlayerClass
-
-            actions.append(
-                Action(
-                    f"Retreat active card ({player.active_card})",
-                    lambda player=player: PlayerClass.retreat(player),
-                    ActionType.FUNCTION,
-                )
-            )
-
-        # ADD CARD TO BENCH
-        for card in player.hand:
-            if isinstance(card, Card) and card.is_basic:
-                from ..core.player import Player as PlayerClass
-
-                actions.append(
-                    Action(
-                        f"Add {card.name} to bench",
-                        lambda player=player, card_id=card.uuid: PlayerClass.add_card_to_bench(
-                            player, card_id
-                        ),
-                        ActionType.ADD_CARD_TO_BENCH,
-                    )
-                )
-
-        # ADD ENERGY
-        if player.has_added_energy is False and player.current_energy is not None:
-            for card in player.active_card_and_bench:
-                actions.append(
-                    Action(
-                        f"Add {player.current_energy} energy to {card.name}",
-                        lambda player=player, card_id=card.uuid, energy=player.current_energy: player._add_energy_action(
-                            card_id, energy
-                        ),
-                        ActionType.ADD_ENERGY,
-                    )
-                )
-
-    # SET AN ACTIVE CARD (when no active card exists)
-    else:
-        if not player.active_card:
-            from ..core.player import Player as PlayerClass
-
-            for card in player.hand:
-                if isinstance(card, Card) and card.is_basic:
-                    actions.append(
-                        Action(
-                            f"Set {card.name} as active card",
-                            lambda player=player, card_id=card.uuid: PlayerClass.set_active_card_from_hand(
-                                player, card_id
-                            ),
-                            ActionType.SET_ACTIVE_CARD,
-                        )
-                    )
+    actions: List[Action] = []
+    for targets, make_action in families:
+        for target in targets(player):
+            actions.append(make_action(player, target))
 
     # END TURN ACTION
     if player.active_card is not None and len(actions) > 0:
-        actions.append(
-            Action(
-                "End turn",
-                lambda player=player: setattr(player, "can_continue", False),
-                ActionType.END_TURN,
-                can_continue_turn=False,
-            )
-        )
+        actions.append(_end_turn_action())
 
     return actions
 
 
+def sample_action(player: "Player", rng: Optional[random.Random] = None) -> Optional[Action]:
+    """
+    Draw one of the available actions uniformly at random, without building the others.
+
+    Gives every action of get_available_actions the same probability, like choosing from
+    that list, but only counts the options of each family and builds the one drawn.
+
+    Args:
+        player: The player to draw an action for
+        rng: The random number generator to draw with, None uses the random module
+
+    Returns:
+        The drawn action, or None if the player has no actions
+    """
+    families = _IN_PLAY_FAMILIES if player.active_card is not None else _SETUP_FAMILIES
+
+    family_targets = []
+    total = 0
+    for targets, make_action in families:
+        found = targets(player)
+        if found:
+            family_targets.append((found, make_action))
+            total += len(found)
+
+    if total == 0:
+        return None
+
+    # The end turn action is listed last when there is anything else to do
+    has_end_turn = player.active_card is not None
+    index = (rng or random).randrange(total + 1 if has_end_turn else total)
+    for found, make_action in family_targets:
+        if index < len(found):
+            return make_action(player, found[index])
+        index -= len(found)
+    return _end_turn_action()
+
+
 def execute_action(player: "Player", action: Action, match: Optional["Match"] = None) -> bool:
     """
     Execute the given action for the player.
@@ -0,0 +1,177 @@
+"""
+Playout mode: play a match to its end as fast as the engine allows.
+
+Unlike Match.play_one_match, a playout does no printing, no GUI updates, no data collection and
+no serialization, and only returns who won, the final points and the number of turns. It is meant
+for random playouts in search and for running many games. Players that plan their turns
+(evaluate_actions) play their plans, the others follow the policy.
+
+A player starting its turn without pokemon left to play with loses the match, like in
+Match.play_one_match: both start the turn with Player.reset_turn_state.
+"""
+
+import random
+from typing import TYPE_CHECKING, Callable, List, NamedTuple, Optional, Tuple
+
+from ..core.match import MAX_TURNS
+from ..mechanics.action import Action, ActionType
+from ..mechanics.chance import CardDraw, EnergyDraw
+from .action_engine import execute_action, get_available_actions, sample_action
+
+if TYPE_CHECKING:
+    from ..core.match import Match
+    from ..core.player import Player
+
+# Chooses one of the legal actions, never called with an empty list
+Policy = Callable[[List[Action], random.Random], Action]
+
+
+class PlayoutResult(NamedTuple):
+    """
+    Outcome of a playout.
+
+    Attributes:
+        winner (Optional[int]): 0 if the starting player won, 1 if the second player won,
+            None if the match hit the turn limit.
+        points (Tuple[int, int]): The final points of the starting and the second player.
+        turns (int): The turn the match ended on.
+    """
+
+    winner: Optional[int]
+    points: Tuple[int, int]
+    turns: int
+
+
+def random_policy(actions: List[Action], rng: random.Random) -> Action:
+    """Choose uniformly at random, like the random bots of Player.process_bot_actions."""
+    return actions[rng.randrange(len(actions))]
+
+
+def play_action(match: "Match", player: "Player", action: Action) -> bool:
+    """
+    Execute the action and tell whether the player's turn goes on.
+
+    Follows the rules of Player.process_action_loop: setting the active card in the first two
+    turns ends the turn.
+
+    Returns:
+        bool: True if the player can continue its turn.
+    """
+    can_continue = execute_action(player, action)
+    if action.action_type == ActionType.SET_ACTIVE_CARD and match.turn <= 2:
+        return False
+    return can_continue
+
+
+def play_actions(
+    match: "Match", player: "Player", policy: Optional[Policy], rng: random.Random
+) -> None:
+    """
+    Play the rest of the player's turn with the policy.
+
+    Without a policy the actions are drawn uniformly with sample_action, which does not list
+    them all.
+    """
+    while True:
+        action: Optional[Action]
+        if policy is None:
+            action = sample_action(player, rng)
+        else:
+            actions = get_available_actions(player)
+            action = policy(actions, rng) if actions else None
+        if action is None or not play_action(match, player, action):
+            return
+
+
+def begin_turn(match: "Match", player: "Player") -> bool:
+    """
+    Start the next turn of the match for the player: reset its turn state and draw.
+
+    Returns:
+        bool: False if the player had no pokemon left to play with, True otherwise.
+    """
+    match.turn += 1
+    if not player.reset_turn_state(match):
+        return False
+    CardDraw(player).resolve()
+    EnergyDraw(player).resolve()
+    return True
+
+
+def play_turn(
+    match: "Match",
+    player: "Player",
+    policy: Optional[Policy],
+    rng: random.Random,
+    plan: bool = False,
+) -> bool:
+    """
+    Start the next turn of the match for the player and play it with the policy.
+
+    With plan, a player that plans its turns (evaluate_actions) plays its plan instead. Search
+    rollouts leave it off, so the copies of planning players do not start searches of their own.
+
+    Returns:
+        bool: False if the player had no pokemon left to play with, True otherwise.
+    """
+    if not begin_turn(match, player):
+        return False
+    if plan and player.evaluate_actions:
+        play_planned_actions(match, player)
+    else:
+        play_actions(match, player, policy, rng)
+    return True
+
+
+def play_planned_actions(match: "Match", player: "Player") -> None:
+    """Play the rest of the turn of a planning player, like Player.process_action_loop."""
+    actions = player.plan_turn(match)
+    player.can_continue = True
+    while player.can_continue:
+        actions = player.process_best_actions(match, actions)
+
+
+def playout(
+    match: "Match",
+    policy: Optional[Policy] = None,
+    rng: Optional[random.Random] = None,
+    max_turns: int = MAX_TURNS,
+) -> PlayoutResult:
+    """
+    Play the match from its current state to the end, between turns.
+
+    The match is played in place and its players stop printing, copy it first to keep it.
+
+    Args:
+        match (Match): The match to play, after match.turn turns were played.
+        policy (Optional[Policy]): Chooses the actions of both players, None plays uniformly
+            random actions like random_policy, without listing them.
+        rng (Optional[random.Random]): Random number generator of the policy, None uses a new one.
+            Card and energy draws use the random module like the rest of the engine.
+        max_turns (int): The turns played at most, after which the match ends without a
+            winner. MAX_TURNS is the limit of Match.start_turn.
+
+    Returns:
+        PlayoutResult: The winner, the final points and the number of turns.
+    """
+    if rng is None:
+        rng = random.Random()
+
+    players = (match.starting_player, match.second_player)
+    for player in players:
+        player.print_actions = False
+
+    winner: Optional[int] = None
+    while match.turn < max_turns:
+        seat = match.turn % 2
+        player = players[seat]
+        if not play_turn(match, player, policy, rng, plan=True):
+            # No pokemon left to play with
+            winner = 1 - seat
+            break
+        if player.handle_knockout_points():
+            winner = seat
+            break
+
+    match.game_over = True
+    return PlayoutResult(winner, (players[0].points, players[1].points), match.turn)
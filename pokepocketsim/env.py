@@ -0,0 +1,725 @@
+"""
+Reinforcement learning environments over matches, with the interface shape of gym.
+
+An Env plays the matches of one agent, the player of deck A, against an opponent bot. The
+agent chooses among the legal actions of its turn by index, in the order of
+engine.get_available_actions, like Player.process_rl_actions; the opponent's turns are played
+in between, in playout mode. Every decision of the agent is a step:
+
+    env = Env(deck_a, deck_b, seed=0)
+    observation, info = env.reset()
+    while True:
+        action = policy(observation, env.action_mask)
+        observation, reward, terminated, truncated, info = env.step(action)
+        if terminated or truncated:
+            break
+
+The reward is 1 when the agent wins, -1 when it loses and 0 otherwise. When a match ends
+before the agent's first decision, e.g. without a basic pokemon to play, reset returns a mask
+without legal actions and the next step, whatever its action, ends the episode with its
+reward, so no game is skipped.
+
+Observations are flat rows of OBSERVATION_SIZE floats, see OBSERVATION_NAMES, and action
+masks rows of MAX_ACTIONS flags telling which action indices are legal. Both are written in
+place into preallocated buffers, numpy arrays when numpy is installed and lists otherwise.
+
+A VecEnv steps several environments in lockstep, in this process or in worker processes, and
+resets the environments whose episodes ended. Worker processes write into buffers in shared
+memory, see SharedBuffers, so no observation goes through a pipe.
+
+Episodes are the games of a batch: environment i of n plays the games i, i + n, i + 2n... of
+play_many with the same decks and seed, so the agent meets the same deck orders and draws as a
+batch would.
+"""
+
+import multiprocessing
+import random
+import struct
+from array import array
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .batch import DeckTemplate, new_match, game_seed
+from .bots import Bot
+from .core.card import CARDS_DATA
+from .core.deck import Deck
+from .engine.action_engine import get_available_actions
+from .engine.playout import MAX_TURNS, begin_turn, play_action, play_turn
+from .mechanics.action import Action
+from .utils import config
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+
+    from .core.card import Card
+    from .core.match import Match
+    from .core.player import Player
+
+# Number of action indices, the actions of a turn past it are not offered
+MAX_ACTIONS = 64
+
+# Number of board slots of a side: the active card and the bench
+SLOTS = ("active", "bench_0", "bench_1", "bench_2")
+
+_GLOBAL_FIELDS = ("turn", "first", "energy", "added_energy", "used_trainer")
+_SIDE_FIELDS = ("points", "hand", "hand_pokemon", "deck", "discard")
+_SLOT_FIELDS = ("card", "hp", "max_hp", "energy", "stage", "ex", "conditions")
+
+# Names of the columns of an observation, in order. The agent's side ("self") comes first,
+# a card is its position in the card database plus one, 0 for an empty slot.
+OBSERVATION_NAMES = (
+    *_GLOBAL_FIELDS,
+    *(
+        name
+        for side in ("self", "opponent")
+        for name in (
+            *(f"{side}_{field}" for field in _SIDE_FIELDS),
+            *(f"{side}_{slot}_{field}" for slot in SLOTS for field in _SLOT_FIELDS),
+        )
+    ),
+)
+OBSERVATION_SIZE = len(OBSERVATION_NAMES)
+
+CARD_IDS: Dict[str, int] = {
+    entry["Pokemon"]["name"]: i + 1 for i, entry in enumerate(CARDS_DATA) if "Pokemon" in entry
+}
+
+# A row of a buffer written in place: a numpy array, a list or a shared memoryview
+Row = Any
+_EMPTY_SLOT = [0.0] * len(_SLOT_FIELDS)
+
+
+def zeros(shape: Tuple[int, ...], dtype: str = "float32") -> Any:
+    """A buffer of zeros: a numpy array with numpy installed, nested lists otherwise."""
+    if np is not None:
+        return np.zeros(shape, dtype=dtype)
+    value: Any = False if dtype == "bool" else 0.0
+    if len(shape) == 1:
+        return [value] * shape[0]
+    return [zeros(shape[1:], dtype) for _ in range(shape[0])]
+
+
+def _slot(card: Optional["Card"]) -> List[float]:
+    if card is None:
+        return _EMPTY_SLOT
+    return [
+        CARD_IDS.get(card.name, 0),
+        card.hp,
+        card.max_hp,
+        sum(card.energies.values()),
+        card.stage,
+        card.is_ex,
+        int(card.conditions),
+    ]
+
+
+def _side(player: "Player") -> List[float]:
+    values = [
+        player.points,
+        len(player.hand),
+        sum(1 for card in player.hand if getattr(card, "name", None) in CARD_IDS),
+        len(player.deck.cards),
+        len(player.discard_pile),
+    ]
+    values.extend(_slot(player.active_card))
+    for i in range(len(SLOTS) - 1):
+        values.extend(_slot(player.bench[i] if i < len(player.bench) else None))
+    return values
+
+
+def encode_observation(match: "Match", player: "Player", out: Row) -> None:
+    """
+    Write the position as the player sees it into an observation row, see OBSERVATION_NAMES.
+
+    Args:
+        match (Match): The match.
+        player (Player): The player observing, its side comes first.
+        out (Row): The row of OBSERVATION_SIZE values to write.
+    """
+    assert player.opponent is not None
+    values = [
+        match.turn,
+        player is match.starting_player,
+        player.current_energy is not None,
+        player.has_added_energy,
+        player.has_used_trainer,
+    ]
+    values.extend(_side(player))
+    values.extend(_side(player.opponent))
+    out[:] = array("f", values)
+
+
+def encode_action_mask(actions: Sequence[Action], out: Row) -> None:
+    """Write which of the MAX_ACTIONS action indices are legal into a mask row."""
+    legal = min(len(actions), MAX_ACTIONS)
+    out[:] = array("B", [1] * legal + [0] * (MAX_ACTIONS - legal))
+
+
+class Env:
+    """
+    The matches of one agent against an opponent bot, see the module documentation.
+
+    Attributes:
+        match (Optional[Match]): The match of the current episode.
+        agent (Optional[Player]): The agent's player, playing deck A.
+        observation (Row): The observation of the current step.
+        action_mask (Row): The legal action indices of the current step.
+        actions (List[Action]): The legal actions of the current step.
+        episodes (int): The number of episodes started.
+        done (bool): Whether the episode ended, reset starts the next one.
+    """
+
+    def __init__(
+        self,
+        deck_a: Deck,
+        deck_b: Optional[Deck] = None,
+        seed: int = 0,
+        opponent: Optional[Bot] = None,
+        max_turns: int = MAX_TURNS,
+        index: int = 0,
+        stride: int = 1,
+        observation: Optional[Row] = None,
+        action_mask: Optional[Row] = None,
+    ) -> None:
+        """
+        Args:
+            deck_a (Deck): The deck of the agent.
+            deck_b (Optional[Deck]): The deck of the opponent, None plays a mirror match.
+            seed (int): The batch seed the games are drawn from.
+            opponent (Optional[Bot]): The opponent bot, None plays random actions.
+            max_turns (int): The turn after which an episode is truncated.
+            index (int): The batch index of the first game.
+            stride (int): The difference between the batch indices of consecutive games.
+            observation (Optional[Row]): The row to write the observations to, None
+                allocates one.
+            action_mask (Optional[Row]): The row to write the action masks to, None
+                allocates one.
+        """
+        self.template_a = DeckTemplate(deck_a)
+        self.template_b = DeckTemplate(deck_b if deck_b is not None else deck_a)
+        self.seed = seed
+        self.bots = (Bot(), opponent if opponent is not None else Bot())
+        self.max_turns = max_turns
+        self.index = index
+        self.stride = stride
+        self.observation: Row = observation if observation is not None else zeros(
+            (OBSERVATION_SIZE,)
+        )
+        self.action_mask: Row = action_mask if action_mask is not None else zeros(
+            (MAX_ACTIONS,), "bool"
+        )
+
+        self.match: Optional["Match"] = None
+        self.agent: Optional["Player"] = None
+        self.actions: List[Action] = []
+        self.episodes = 0
+        self.done = True
+        self._rng = random.Random()
+        self._random_state: Optional[Tuple[Any, ...]] = None
+        # The outcome of a match that ended before the agent's first decision
+        self._outcome: Optional[Tuple[float, bool, bool]] = None
+
+    @contextmanager
+    def _engine(self) -> Iterator[None]:
+        """Play with the environment's own state of the random module and without the GUI."""
+        gui_enabled = config.gui_enabled
+        config.gui_enabled = False
+        outer_state = random.getstate()
+        if self._random_state is not None:
+            random.setstate(self._random_state)
+        try:
+            yield
+        finally:
+            self._random_state = random.getstate()
+            random.setstate(outer_state)
+            config.gui_enabled = gui_enabled
+
+    def reset(self, seed: Optional[int] = None) -> Tuple[Row, Dict[str, Any]]:
+        """
+        Start the next episode and play until the agent's first decision.
+
+        Args:
+            seed (Optional[int]): Start over with the games of this batch seed.
+
+        Returns:
+            Tuple[Row, Dict[str, Any]]: The observation and an info dict with the game index.
+        """
+        if seed is not None:
+            self.seed = seed
+            self.episodes = 0
+
+        game = self.index + self.episodes * self.stride
+        self.episodes += 1
+        with self._engine():
+            # new_match seeds the random module with the game
+            self.match, self._rng, starter = new_match(
+                self.template_a, self.template_b, self.seed, game, bots=self.bots
+            )
+            players = (self.match.starting_player, self.match.second_player)
+            self.agent = players[starter]
+            for player in players:
+                player.print_actions = False
+            outcome = self._play_until_decision()
+
+        self.done = False
+        self._outcome = None
+        if outcome[1] or outcome[2]:
+            # The match ended before the agent's first decision, e.g. without a basic pokemon
+            # to play: no action is legal and the next step ends the episode with the outcome
+            self.actions = []
+            self._outcome = outcome
+        self._encode()
+        return self.observation, {"game": game, "game_seed": game_seed(self.seed, game)}
+
+    def step(self, action: int) -> Tuple[Row, float, bool, bool, Dict[str, Any]]:
+        """
+        Play an action of the agent, then play until its next decision or the end of the match.
+
+        Args:
+            action (int): The index of the action in the legal actions, ignored when no action
+                is legal because the match ended before the agent's first decision.
+
+        Returns:
+            Tuple[Row, float, bool, bool, Dict[str, Any]]: The observation, the reward, whether
+                the match ended, whether it was stopped at max_turns, and an info dict, with
+                the final points of the agent and the opponent once the episode ended.
+
+        Raises:
+            ValueError: If the episode ended or the action is not legal.
+        """
+        if self.done or self.match is None or self.agent is None:
+            raise ValueError("The episode ended, call reset")
+        if self._outcome is not None:
+            reward, terminated, truncated = self._outcome
+            self._outcome = None
+        elif not 0 <= action < min(len(self.actions), MAX_ACTIONS):
+            raise ValueError(f"Action {action} is not legal, {len(self.actions)} actions")
+        else:
+            reward, terminated, truncated = self._play(action)
+
+        self._encode()
+        info: Dict[str, Any] = {}
+        if terminated or truncated:
+            self.done = True
+            assert self.agent.opponent is not None
+            info["points"] = (self.agent.points, self.agent.opponent.points)
+            info["turns"] = self.match.turn
+        return self.observation, reward, terminated, truncated, info
+
+    def _play(self, action: int) -> Tuple[float, bool, bool]:
+        """Play a legal action of the agent, then play until its next decision or the end."""
+        assert self.match is not None and self.agent is not None
+        with self._engine():
+            if play_action(self.match, self.agent, self.actions[action]):
+                self.actions = get_available_actions(self.agent)
+            else:
+                self.actions = []
+            if self.actions:
+                return 0.0, False, False
+
+            # The agent's turn is over, play until its next decision
+            reward, terminated, truncated = self._end_agent_turn()
+            if terminated:
+                return reward, terminated, truncated
+            return self._play_until_decision()
+
+    def _encode(self) -> None:
+        assert self.match is not None and self.agent is not None
+        encode_observation(self.match, self.agent, self.observation)
+        encode_action_mask(self.actions, self.action_mask)
+
+    def _end_agent_turn(self) -> Tuple[float, bool, bool]:
+        assert self.agent is not None
+        if self.agent.handle_knockout_points():
+            return 1.0, True, False
+        return 0.0, False, False
+
+    def _play_until_decision(self) -> Tuple[float, bool, bool]:
+        """
+        Play the turns until the agent has legal actions or the match ends, like playout.
+
+        Returns:
+            Tuple[float, bool, bool]: The reward, whether the match ended and whether it was
+                stopped at max_turns.
+        """
+        match, agent = self.match, self.agent
+        assert match is not None and agent is not None
+        players = (match.starting_player, match.second_player)
+        while match.turn < self.max_turns:
+            player = players[match.turn % 2]
+            if player is agent:
+                if not begin_turn(match, agent):
+                    return -1.0, True, False
+                self.actions = get_available_actions(agent)
+                if self.actions:
+                    return 0.0, False, False
+                reward, terminated, truncated = self._end_agent_turn()
+                if terminated:
+                    return reward, terminated, truncated
+            else:
+                if not play_turn(match, player, None, self._rng, plan=True):
+                    return 1.0, True, False
+                if player.handle_knockout_points():
+                    return -1.0, True, False
+        self.actions = []
+        return 0.0, False, True
+
+
+def _snapshot(row: Row) -> Any:
+    """A copy of a row: numpy arrays and lists copy themselves, shared memory views do not."""
+    return row.copy() if hasattr(row, "copy") else list(row)
+
+
+def _step_and_reset(env: Env, action: int) -> Tuple[float, bool, bool, Dict[str, Any]]:
+    """Step the environment, and reset it when its episode ended."""
+    _, reward, terminated, truncated, info = env.step(action)
+    if terminated or truncated:
+        info["final_observation"] = _snapshot(env.observation)
+        env.reset()
+    return reward, terminated, truncated, info
+
+
+# The buffers of a VecEnv: name, shape of a row, numpy dtype and struct format without numpy
+_BUFFER_FIELDS = (
+    ("observations", (OBSERVATION_SIZE,), "float32", "f"),
+    ("rewards", (), "float32", "f"),
+    ("terminated", (), "bool", "?"),
+    ("truncated", (), "bool", "?"),
+    ("action_masks", (MAX_ACTIONS,), "bool", "B"),
+    ("actions", (), "int64", "q"),
+)
+
+
+class SharedBuffers:
+    """
+    The buffers of a VecEnv in one block of shared memory.
+
+    The VecEnv creates the block and its workers attach to it by name, so the workers write
+    the observations, rewards, flags and action masks of their environments in place and read
+    their actions from it, and only signals go through the pipes. The buffers are numpy arrays
+    with numpy installed; otherwise rows are memoryviews, flags are bool and masks 0 or 1.
+
+    Attributes:
+        num_envs (int): The number of environments, the rows of every buffer.
+        shm (shared_memory.SharedMemory): The block of shared memory.
+        observations, rewards, terminated, truncated, action_masks, actions (Any): The buffers.
+    """
+
+    def __init__(self, num_envs: int, name: Optional[str] = None) -> None:
+        """
+        Args:
+            num_envs (int): The number of environments.
+            name (Optional[str]): The name of the block to attach to, None creates one.
+        """
+        self.num_envs = num_envs
+        offsets = []
+        size = 0
+        for _, shape, _, fmt in _BUFFER_FIELDS:
+            # Align every buffer for its widest item
+            size = -(-size // 8) * 8
+            offsets.append(size)
+            size += num_envs * _row_size(shape) * struct.calcsize(fmt)
+
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self._views: List[memoryview] = []
+        for (field, shape, dtype, fmt), offset in zip(_BUFFER_FIELDS, offsets):
+            setattr(self, field, self._buffer(offset, shape, dtype, fmt))
+
+    def _buffer(self, offset: int, shape: Tuple[int, ...], dtype: str, fmt: str) -> Any:
+        if np is not None:
+            return np.ndarray(
+                (self.num_envs, *shape), dtype=dtype, buffer=self.shm.buf, offset=offset
+            )
+        if not shape:
+            view = self.shm.buf[offset : offset + self.num_envs * struct.calcsize(fmt)].cast(fmt)
+            self._views.append(view)
+            return view
+        row_bytes = _row_size(shape) * struct.calcsize(fmt)
+        rows = [
+            self.shm.buf[offset + i * row_bytes : offset + (i + 1) * row_bytes].cast(fmt)
+            for i in range(self.num_envs)
+        ]
+        self._views.extend(rows)
+        return rows
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def close(self, unlink: bool = False) -> None:
+        """
+        Detach from the block, and with unlink free it once every process detached.
+
+        Numpy arrays still referenced keep the memory mapped until they are collected.
+        """
+        for view in self._views:
+            view.release()
+        self._views = []
+        try:
+            self.shm.close()
+        except BufferError:
+            pass
+        if unlink:
+            self.shm.unlink()
+
+
+def _row_size(shape: Tuple[int, ...]) -> int:
+    size = 1
+    for dimension in shape:
+        size *= dimension
+    return size
+
+
+def _worker(
+    connection: "Connection",
+    settings: List[Dict[str, Any]],
+    name: str,
+    num_envs: int,
+    start: int,
+) -> None:
+    """
+    Run the environments start to start + len(settings) - 1 of a VecEnv in a worker process.
+
+    The environments write into their rows of the shared buffers. Commands come as short byte
+    strings, the answer is None or the infos, or the exception a command raised.
+    """
+    buffers = SharedBuffers(num_envs, name)
+    envs = [
+        Env(
+            **kwargs,
+            observation=buffers.observations[i],
+            action_mask=buffers.action_masks[i],
+        )
+        for i, kwargs in enumerate(settings, start)
+    ]
+    try:
+        while True:
+            command = connection.recv_bytes()
+            try:
+                if command == b"reset":
+                    connection.send([env.reset()[1] for env in envs])
+                elif command == b"step":
+                    infos = []
+                    for i, env in enumerate(envs, start):
+                        reward, terminated, truncated, info = _step_and_reset(
+                            env, int(buffers.actions[i])
+                        )
+                        buffers.rewards[i] = reward
+                        buffers.terminated[i] = terminated
+                        buffers.truncated[i] = truncated
+                        infos.append(info)
+                    # Most steps end no episode, only say so
+                    connection.send(infos if any(infos) else None)
+                else:
+                    break
+            except Exception as e:
+                connection.send(e)
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        buffers.close()
+        connection.close()
+
+
+class VecEnv:
+    """
+    Environments stepped in lockstep, reset when their episodes end.
+
+    The buffers are allocated once and returned by every reset and step, copy them to keep
+    them past the next step. An environment whose episode ended in a step is reset in the
+    same step: its row holds the first observation of the next episode, and its info the last
+    observation of the ended one under "final_observation".
+
+    With workers, the buffers are SharedBuffers the workers write into, and a step only sends
+    a signal to every worker and waits for its answer.
+
+    Attributes:
+        num_envs (int): The number of environments.
+        observations (Any): The observations, num_envs rows of OBSERVATION_SIZE.
+        rewards (Any): The rewards of the last step.
+        terminated (Any): Whether the episode ended in the last step.
+        truncated (Any): Whether the episode was stopped at max_turns in the last step.
+        action_masks (Any): The legal action indices, num_envs rows of MAX_ACTIONS.
+    """
+
+    def __init__(
+        self,
+        deck_a: Deck,
+        deck_b: Optional[Deck] = None,
+        num_envs: int = 8,
+        seed: int = 0,
+        opponent: Optional[Bot] = None,
+        max_turns: int = MAX_TURNS,
+        workers: int = 0,
+    ) -> None:
+        """
+        Args:
+            deck_a (Deck): The deck of the agents.
+            deck_b (Optional[Deck]): The deck of the opponents, None plays mirror matches.
+            num_envs (int): The number of environments.
+            seed (int): The batch seed the games are drawn from.
+            opponent (Optional[Bot]): The opponent bot, None plays random actions.
+            max_turns (int): The turn after which an episode is truncated.
+            workers (int): The number of worker processes the environments are split between,
+                0 steps them in this process.
+
+        Raises:
+            ValueError: If there are no environments or more workers than environments.
+        """
+        if num_envs < 1:
+            raise ValueError(f"Expected at least one environment, got {num_envs}")
+        if workers > num_envs:
+            raise ValueError(f"{workers} workers for {num_envs} environments")
+
+        self.num_envs = num_envs
+        settings = [
+            {
+                "deck_a": deck_a,
+                "deck_b": deck_b,
+                "seed": seed,
+                "opponent": opponent,
+                "max_turns": max_turns,
+                "index": i,
+                "stride": num_envs,
+            }
+            for i in range(num_envs)
+        ]
+        self.envs: List[Env] = []
+        self._buffers: Optional[SharedBuffers] = None
+        self._connections: List["Connection"] = []
+        self._processes: List[Any] = []
+        # The environments of every worker, as a range of rows
+        self._slices: List[Tuple[int, int]] = []
+
+        if workers == 0:
+            self.observations = zeros((num_envs, OBSERVATION_SIZE))
+            self.rewards = zeros((num_envs,))
+            self.terminated = zeros((num_envs,), "bool")
+            self.truncated = zeros((num_envs,), "bool")
+            self.action_masks = zeros((num_envs, MAX_ACTIONS), "bool")
+            self.envs = [
+                Env(**kwargs, observation=self.observations[i], action_mask=self.action_masks[i])
+                for i, kwargs in enumerate(settings)
+            ]
+            return
+
+        self._buffers = SharedBuffers(num_envs)
+        self.observations = self._buffers.observations
+        self.rewards = self._buffers.rewards
+        self.terminated = self._buffers.terminated
+        self.truncated = self._buffers.truncated
+        self.action_masks = self._buffers.action_masks
+        for w in range(workers):
+            start, stop = w * num_envs // workers, (w + 1) * num_envs // workers
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_worker,
+                args=(child, settings[start:stop], self._buffers.name, num_envs, start),
+                daemon=True,
+            )
+            process.start()
+            child.close()
+            self._connections.append(parent)
+            self._processes.append(process)
+            self._slices.append((start, stop))
+
+    def _signal(self, command: bytes) -> List[Dict[str, Any]]:
+        """Send a command to every worker and collect the infos of their answers."""
+        for connection in self._connections:
+            connection.send_bytes(command)
+        infos: List[Dict[str, Any]] = []
+        error: Optional[Exception] = None
+        for connection, (start, stop) in zip(self._connections, self._slices):
+            answer = connection.recv()
+            if isinstance(answer, Exception):
+                error = answer
+                answer = None
+            infos.extend(answer if answer is not None else [{} for _ in range(start, stop)])
+        if error is not None:
+            raise error
+        return infos
+
+    def reset(self) -> Tuple[Any, List[Dict[str, Any]]]:
+        """
+        Start an episode in every environment.
+
+        Returns:
+            Tuple[Any, List[Dict[str, Any]]]: The observations and the info of every environment.
+        """
+        for i in range(self.num_envs):
+            self.rewards[i] = 0.0
+            self.terminated[i] = False
+            self.truncated[i] = False
+        if self._buffers is None:
+            return self.observations, [env.reset()[1] for env in self.envs]
+        return self.observations, self._signal(b"reset")
+
+    def step(self, actions: Sequence[int]) -> Tuple[Any, Any, Any, Any, List[Dict[str, Any]]]:
+        """
+        Play an action in every environment.
+
+        Args:
+            actions (Sequence[int]): The action index of every environment.
+
+        Returns:
+            Tuple[Any, Any, Any, Any, List[Dict[str, Any]]]: The observations, rewards,
+                terminated and truncated flags and the info of every environment.
+
+        Raises:
+            ValueError: If the number of actions is not num_envs or an action is not legal.
+        """
+        if len(actions) != self.num_envs:
+            raise ValueError(f"Expected {self.num_envs} actions, got {len(actions)}")
+        actions = [int(action) for action in actions]
+        for i, action in enumerate(actions):
+            if not any(self.action_masks[i]):
+                # The episode ended before the agent's first decision, the step ends it
+                continue
+            if not 0 <= action < MAX_ACTIONS or not self.action_masks[i][action]:
+                raise ValueError(f"Action {action} of environment {i} is not legal")
+
+        if self._buffers is not None:
+            for i, action in enumerate(actions):
+                self._buffers.actions[i] = action
+            infos = self._signal(b"step")
+            return self.observations, self.rewards, self.terminated, self.truncated, infos
+
+        infos = []
+        for i, env in enumerate(self.envs):
+            reward, terminated, truncated, info = _step_and_reset(env, actions[i])
+            self.rewards[i] = reward
+            self.terminated[i] = terminated
+            self.truncated[i] = truncated
+            infos.append(info)
+        return self.observations, self.rewards, self.terminated, self.truncated, infos
+
+    def close(self) -> None:
+        """Stop the worker processes and free the shared buffers."""
+        for connection in self._connections:
+            try:
+                connection.send_bytes(b"close")
+            except (BrokenPipeError, OSError):
+                pass
+            connection.close()
+        for process in self._processes:
+            process.join(timeout=1)
+        self._connections = []
+        self._processes = []
+        if self._buffers is not None:
+            self._buffers.close(unlink=True)
+            self._buffers = None
+
+    def __enter__(self) -> "VecEnv":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -0,0 +1,350 @@
+"""
+Rating ladder for bots.
+
+Every bot on the ladder has a rating on the Elo scale together with a rating deviation, the
+uncertainty of the rating, updated with the Glicko system after every match. A match is a short
+paired batch between two bots playing the same deck.
+
+Matches are scheduled where they tell the most: pairings are scored by how close the expected
+score is to even and by how uncertain both ratings are, so a new bot, which starts with a large
+deviation, plays many matches against bots of similar strength until it is placed, which takes
+a few hundred games. The matches of a round are played on a pool of worker processes and the
+ratings are updated as the matches finish, in the order they were scheduled. The ladder is kept
+in a JSON file and can be resumed at any time.
+"""
+
+import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from .batch import BatchResult, DeckTemplate, play_range
+from .bots import Bot, parse_bot
+from .core.deck import Deck, card_name
+from .engine.playout import MAX_TURNS
+from .regression import DEMO_DECK, DEMO_ENERGY_TYPES
+
+INITIAL_RATING = 1500.0
+INITIAL_DEVIATION = 350.0
+
+# Glicko constant q = ln(10) / 400
+_Q = math.log(10) / 400
+
+
+def _g(deviation: float) -> float:
+    """Glicko's weight of a game against an opponent with the given rating deviation."""
+    return 1 / math.sqrt(1 + 3 * (_Q * deviation) ** 2 / math.pi**2)
+
+
+@dataclass
+class LadderEntry:
+    """
+    A bot on the ladder.
+
+    Attributes:
+        name (str): The name of the bot on the ladder.
+        bot (str): The specification of the bot, see bots.parse_bot.
+        rating (float): The rating on the Elo scale.
+        deviation (float): The rating deviation, about half the width of a 95% interval.
+        games (int): The number of games played.
+        score (float): The points scored, 1 per win and 0.5 per unfinished game.
+    """
+
+    name: str
+    bot: str
+    rating: float = INITIAL_RATING
+    deviation: float = INITIAL_DEVIATION
+    games: int = 0
+    score: float = 0.0
+
+    def expected_score(self, other: "LadderEntry") -> float:
+        """The expected score of a game against the other bot."""
+        return 1 / (1 + 10 ** (-_g(other.deviation) * (self.rating - other.rating) / 400))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return asdict(self)
+
+
+class Ladder:
+    """
+    Rating ladder of bots, see the module documentation.
+
+    Attributes:
+        entries (Dict[str, LadderEntry]): The bots by name.
+        path (Optional[Path]): The JSON file the ladder is saved to after every round.
+        games_per_match (int): The number of games of a match, rounded up to pairs.
+        min_deviation (float): The smallest rating deviation, so ratings keep following bots
+            whose strength changes.
+        seed (int): The seed of the first match, every match gets the next one.
+        matches (int): The number of matches played.
+        deck_cards (List[str]): The names of the cards of the deck all bots play.
+        energy_types (List[str]): The energy types of that deck.
+        max_turns (int): The turn after which a game is stopped without a winner.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        deck: Optional[Deck] = None,
+        games_per_match: int = 20,
+        min_deviation: float = 30.0,
+        seed: int = 0,
+        max_turns: int = MAX_TURNS,
+    ) -> None:
+        self.entries: Dict[str, LadderEntry] = {}
+        self.path: Optional[Path] = Path(path) if path is not None else None
+        self.games_per_match: int = games_per_match + games_per_match % 2
+        self.min_deviation: float = min_deviation
+        self.seed: int = seed
+        self.matches: int = 0
+        self.max_turns: int = max_turns
+        if deck is None:
+            deck = Deck.from_names(DEMO_DECK, DEMO_ENERGY_TYPES)
+        self.deck_cards: List[str] = [card_name(card) for card in deck.cards]
+        self.energy_types: List[str] = list(deck.energy_types)
+        self._template = DeckTemplate(deck)
+
+    def add(self, name: str, bot: Union[Bot, str]) -> LadderEntry:
+        """
+        Put a new bot on the ladder with the initial rating and deviation.
+
+        Raises:
+            ValueError: If a bot with the name is on the ladder already.
+        """
+        if name in self.entries:
+            raise ValueError(f"Bot {name!r} is on the ladder already")
+        spec = str(bot) if isinstance(bot, Bot) else str(parse_bot(bot))
+        self.entries[name] = LadderEntry(name, spec)
+        return self.entries[name]
+
+    def remove(self, name: str) -> None:
+        del self.entries[name]
+
+    # Scheduling
+
+    def information(self, name_a: str, name_b: str) -> float:
+        """
+        How much a match between the two bots is expected to tell.
+
+        The variance of a game's outcome, highest for an even matchup, weighted with the sum of
+        the squared rating deviations of both bots.
+        """
+        entry_a = self.entries[name_a]
+        entry_b = self.entries[name_b]
+        expected = entry_a.expected_score(entry_b)
+        return expected * (1 - expected) * (entry_a.deviation**2 + entry_b.deviation**2)
+
+    def pairings(self, count: int) -> List[Tuple[str, str]]:
+        """
+        The most informative pairings, every bot in at most one of them while possible.
+
+        Args:
+            count (int): The number of pairings.
+
+        Returns:
+            List[Tuple[str, str]]: The pairings, the most informative first.
+        """
+        names = sorted(self.entries)
+        candidates = sorted(
+            ((a, b) for i, a in enumerate(names) for b in names[i + 1 :]),
+            key=lambda pair: self.information(*pair),
+            reverse=True,
+        )
+        chosen: List[Tuple[str, str]] = []
+        busy: set = set()
+        for pair in candidates:
+            if len(chosen) == count:
+                break
+            if busy.isdisjoint(pair):
+                chosen.append(pair)
+                busy.update(pair)
+        # Fewer bots than pairings: let the busy bots play more than one match
+        for pair in candidates:
+            if len(chosen) == count:
+                break
+            if pair not in chosen:
+                chosen.append(pair)
+        return chosen
+
+    # Rating updates
+
+    def record(self, name_a: str, name_b: str, result: BatchResult) -> None:
+        """
+        Update the ratings of both bots with the games of a match (one Glicko rating period).
+
+        Args:
+            name_a (str): The bot that played deck A.
+            name_b (str): The bot that played deck B.
+            result (BatchResult): The games of the match.
+        """
+        if result.games == 0:
+            return
+        entry_a = self.entries[name_a]
+        entry_b = self.entries[name_b]
+        score_a = result.wins[0] + 0.5 * result.unfinished
+        updates = (
+            (entry_a, entry_b, score_a),
+            (entry_b, entry_a, result.games - score_a),
+        )
+        # Both updates use the ratings from before the match
+        ratings = [
+            self._updated(entry, opponent, score, result.games)
+            for entry, opponent, score in updates
+        ]
+        for (entry, _, score), (rating, deviation) in zip(updates, ratings):
+            entry.rating = rating
+            entry.deviation = deviation
+            entry.games += result.games
+            entry.score += score
+
+    def _updated(
+        self, entry: LadderEntry, opponent: LadderEntry, score: float, games: int
+    ) -> Tuple[float, float]:
+        """The rating and deviation of the entry after scoring score in games games."""
+        g = _g(opponent.deviation)
+        expected = entry.expected_score(opponent)
+        d_squared = 1 / (_Q**2 * games * g**2 * expected * (1 - expected))
+        precision = 1 / entry.deviation**2 + 1 / d_squared
+        rating = entry.rating + _Q / precision * g * (score - games * expected)
+        deviation = max(math.sqrt(1 / precision), self.min_deviation)
+        return rating, deviation
+
+    # Playing
+
+    def _match_seed(self, match: int) -> int:
+        return self.seed + match
+
+    def _match_args(self, match: int, name_a: str, name_b: str) -> Tuple[Any, ...]:
+        bots = (parse_bot(self.entries[name_a].bot), parse_bot(self.entries[name_b].bot))
+        return (
+            self._template,
+            self._template,
+            self._match_seed(match),
+            0,
+            self.games_per_match,
+            None,
+            self.max_turns,
+            True,
+            bots,
+        )
+
+    def run(
+        self,
+        rounds: int = 1,
+        workers: int = 1,
+        matches_per_round: Optional[int] = None,
+        progress: Optional[Callable[["Ladder"], None]] = None,
+    ) -> None:
+        """
+        Play rounds of the most informative matches and update the ratings.
+
+        Args:
+            rounds (int): The number of rounds.
+            workers (int): The number of worker processes, 1 plays in this process.
+            matches_per_round (Optional[int]): The matches of a round, None plays one per
+                worker. The pairings are chosen again after every round.
+            progress (Optional[Callable[[Ladder], None]]): Called after every round.
+
+        Raises:
+            ValueError: If fewer than two bots are on the ladder.
+        """
+        if len(self.entries) < 2:
+            raise ValueError("The ladder needs at least two bots")
+        count = matches_per_round if matches_per_round is not None else max(1, workers)
+
+        pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+        try:
+            for _ in range(rounds):
+                pairings = self.pairings(count)
+                tasks = [
+                    self._match_args(self.matches + i, name_a, name_b)
+                    for i, (name_a, name_b) in enumerate(pairings)
+                ]
+                results: Iterable[BatchResult]
+                if pool is None:
+                    results = (play_range(*task) for task in tasks)
+                else:
+                    futures = [pool.submit(play_range, *task) for task in tasks]
+                    results = (future.result() for future in futures)
+                for (name_a, name_b), result in zip(pairings, results):
+                    self.record(name_a, name_b, result)
+                    self.matches += 1
+                if self.path is not None:
+                    self.save()
+                if progress is not None:
+                    progress(self)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+    # Reporting and persistence
+
+    def standings(self) -> List[LadderEntry]:
+        """The bots from the highest to the lowest rating."""
+        return sorted(self.entries.values(), key=lambda entry: entry.rating, reverse=True)
+
+    def report(self) -> str:
+        """The standings as a text table."""
+        width = max([len(name) for name in self.entries] + [4])
+        lines = [f"{'#':>3} {'bot':<{width}} {'rating':>7} {'dev':>5} {'games':>6} {'score':>6}"]
+        for rank, entry in enumerate(self.standings(), 1):
+            score = entry.score / entry.games if entry.games else 0.0
+            lines.append(
+                f"{rank:>3} {entry.name:<{width}} {entry.rating:>7.0f} {entry.deviation:>5.0f}"
+                f" {entry.games:>6} {score:>6.3f}"
+            )
+        return "\n".join(lines)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "games_per_match": self.games_per_match,
+            "min_deviation": self.min_deviation,
+            "seed": self.seed,
+            "matches": self.matches,
+            "max_turns": self.max_turns,
+            "deck": {"cards": list(self.deck_cards), "energy_types": list(self.energy_types)},
+            "entries": [entry.to_dict() for entry in self.standings()],
+        }
+
+    def save(self, path: Optional[Union[str, Path]] = None) -> None:
+        """
+        Write the ladder to its JSON file, replacing the old file only once it is complete.
+
+        Args:
+            path (Optional[Union[str, Path]]): The file, None uses the ladder's path.
+        """
+        target = Path(path) if path is not None else self.path
+        if target is None:
+            raise ValueError("The ladder has no path to save to")
+        target.parent.mkdir(parents=True, exist_ok=True)
+        temporary = target.with_name(target.name + ".tmp")
+        temporary.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+        os.replace(temporary, target)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "Ladder":
+        """
+        Read a ladder saved with save, it keeps saving to the same file.
+
+        Raises:
+            OSError: If the file cannot be read.
+        """
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        ladder = cls(
+            path,
+            deck=Deck.from_names(data["deck"]["cards"], data["deck"]["energy_types"]),
+            games_per_match=data["games_per_match"],
+            min_deviation=data["min_deviation"],
+            seed=data["seed"],
+            max_turns=data["max_turns"],
+        )
+        ladder.matches = data["matches"]
+        for entry in data["entries"]:
+            ladder.entries[entry["name"]] = LadderEntry(**entry)
+        return ladder
+
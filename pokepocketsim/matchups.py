@@ -0,0 +1,425 @@
+"""
+Matchup matrices with an on-disk cache of the results.
+
+Decks are identified by Deck.fingerprint, which covers the cards, the energy types and the
+version of the rules. The results of simulated matchups are stored in a local SQLite database
+keyed by the fingerprints of both decks and the simulation settings, so rebuilding a matrix
+only simulates the pairs involving new or changed decks, and changing the rules (bumping
+ENGINE_VERSION) makes every stored result stale.
+
+Decks with the same fingerprint but their cards in another order are shuffled differently, so
+they are treated as the same deck statistically, not game by game.
+"""
+
+import json
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from .batch import BatchResult, DeckTemplate, chunk_ranges, play_range
+from .core.deck import Deck
+from .engine.playout import MAX_TURNS, Policy
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS matchups (
+    deck_a TEXT NOT NULL,
+    deck_b TEXT NOT NULL,
+    settings TEXT NOT NULL,
+    games INTEGER NOT NULL,
+    wins_a INTEGER NOT NULL,
+    wins_b INTEGER NOT NULL,
+    unfinished INTEGER NOT NULL,
+    result TEXT NOT NULL,
+    created REAL NOT NULL,
+    PRIMARY KEY (deck_a, deck_b, settings)
+)
+"""
+
+
+class MatchupRecord(NamedTuple):
+    """
+    The stored outcome of a matchup, from the point of view of deck A.
+
+    Attributes:
+        games (int): The number of games played.
+        wins (Tuple[int, int]): The wins of deck A and deck B.
+        unfinished (int): The games stopped at the turn limit without a winner.
+    """
+
+    games: int
+    wins: Tuple[int, int]
+    unfinished: int
+
+    @property
+    def win_rate(self) -> float:
+        """Deck A's win rate, unfinished games count as half, like BatchResult.win_rate."""
+        if self.games == 0:
+            return 0.0
+        return (self.wins[0] + 0.5 * self.unfinished) / self.games
+
+    def swapped(self) -> "MatchupRecord":
+        """The same outcome from the point of view of deck B."""
+        return MatchupRecord(self.games, (self.wins[1], self.wins[0]), self.unfinished)
+
+    @classmethod
+    def from_result(cls, result: BatchResult) -> "MatchupRecord":
+        return cls(result.games, (result.wins[0], result.wins[1]), result.unfinished)
+
+
+def matchup_settings(
+    games: int,
+    seed: int = 0,
+    max_turns: int = MAX_TURNS,
+    paired: bool = False,
+    policy: Optional[Policy] = None,
+) -> str:
+    """
+    The part of a cache key describing how a matchup was simulated.
+
+    Results simulated with other settings are not reused. Policies are identified by their
+    qualified name.
+
+    Returns:
+        str: A canonical JSON string of the settings.
+    """
+    settings = {
+        "games": games,
+        "seed": seed,
+        "max_turns": max_turns,
+        "paired": paired,
+        "policy": None if policy is None else getattr(policy, "__qualname__", repr(policy)),
+    }
+    return json.dumps(settings, sort_keys=True)
+
+
+class MatchupCache:
+    """
+    SQLite store of matchup results, see the module documentation.
+
+    Every matchup is stored once, with the smaller fingerprint as deck A, and looked up from
+    either side. Use it as a context manager to close the database afterwards.
+
+    Attributes:
+        path (str): The database file, ":memory:" for a cache that is not kept.
+    """
+
+    def __init__(self, path: Union[str, Path] = ":memory:") -> None:
+        self.path: str = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self.path)
+        with self._connection:
+            self._connection.execute(_SCHEMA)
+
+    def get(self, deck_a: str, deck_b: str, settings: str) -> Optional[MatchupRecord]:
+        """
+        Look up a matchup.
+
+        Args:
+            deck_a (str): The fingerprint of deck A.
+            deck_b (str): The fingerprint of deck B.
+            settings (str): The simulation settings, see matchup_settings.
+
+        Returns:
+            Optional[MatchupRecord]: The outcome from deck A's point of view, None if the
+                matchup was not simulated with these settings.
+        """
+        swap = deck_b < deck_a
+        if swap:
+            deck_a, deck_b = deck_b, deck_a
+        row = self._connection.execute(
+            "SELECT games, wins_a, wins_b, unfinished FROM matchups"
+            " WHERE deck_a = ? AND deck_b = ? AND settings = ?",
+            (deck_a, deck_b, settings),
+        ).fetchone()
+        if row is None:
+            return None
+        record = MatchupRecord(row[0], (row[1], row[2]), row[3])
+        return record.swapped() if swap else record
+
+    def get_result(self, deck_a: str, deck_b: str, settings: str) -> Optional[Dict[str, Any]]:
+        """The full stored BatchResult.to_dict of a matchup, as it was simulated."""
+        row = self._connection.execute(
+            "SELECT result FROM matchups WHERE deck_a = ? AND deck_b = ? AND settings = ?",
+            (min(deck_a, deck_b), max(deck_a, deck_b), settings),
+        ).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def put(self, deck_a: str, deck_b: str, settings: str, result: BatchResult) -> None:
+        """
+        Store the outcome of a matchup, replacing an older one with the same key.
+
+        Args:
+            deck_a (str): The fingerprint of the result's deck A.
+            deck_b (str): The fingerprint of the result's deck B.
+            settings (str): The simulation settings, see matchup_settings.
+            result (BatchResult): The simulated games.
+        """
+        record = MatchupRecord.from_result(result)
+        if deck_b < deck_a:
+            deck_a, deck_b = deck_b, deck_a
+            record = record.swapped()
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO matchups VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    deck_a,
+                    deck_b,
+                    settings,
+                    record.games,
+                    record.wins[0],
+                    record.wins[1],
+                    record.unfinished,
+                    json.dumps(result.to_dict()),
+                    time.time(),
+                ),
+            )
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM matchups").fetchone()[0]
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __enter__(self) -> "MatchupCache":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def play_matchups(
+    pairs: Sequence[Tuple[Deck, Deck]],
+    games: int = 1000,
+    seed: int = 0,
+    workers: int = 1,
+    cache: Optional[MatchupCache] = None,
+    policy: Optional[Policy] = None,
+    max_turns: int = MAX_TURNS,
+    paired: bool = False,
+    chunk_size: int = 1000,
+) -> List[Tuple[MatchupRecord, bool]]:
+    """
+    The outcomes of many matchups, simulating only the ones missing in the cache.
+
+    The games of all missing matchups are split into chunks and played on one pool of worker
+    processes, so even a few games per matchup keep every worker busy. Every matchup plays the
+    same games as play_many with the same seed. Mirror matchups, two decks with the same
+    fingerprint, are not simulated: they are even.
+
+    Args:
+        pairs (Sequence[Tuple[Deck, Deck]]): The (deck A, deck B) pairs.
+        games (int): The number of games per matchup.
+        seed (int): The seed of the games.
+        workers (int): The number of worker processes, 1 plays in this process.
+        cache (Optional[MatchupCache]): The cache to look up and store the results in.
+        policy (Optional[Policy]): The policy of all players, None plays random actions.
+        max_turns (int): The turn after which a game is stopped without a winner.
+        paired (bool): Whether to play mirrored pairs of games, see play_many.
+        chunk_size (int): The number of games of a chunk.
+
+    Returns:
+        List[Tuple[MatchupRecord, bool]]: For every pair, the outcome from deck A's point of
+            view and whether it was simulated now.
+    """
+    settings = matchup_settings(games, seed, max_turns, paired, policy)
+    fingerprints = [(deck_a.fingerprint(), deck_b.fingerprint()) for deck_a, deck_b in pairs]
+
+    # Matchups to simulate, once per pair of fingerprints in the orientation first asked for
+    missing: Dict[Tuple[str, str], Tuple[Deck, Deck]] = {}
+    for (deck_a, deck_b), (fingerprint_a, fingerprint_b) in zip(pairs, fingerprints):
+        if fingerprint_a == fingerprint_b:
+            continue
+        if cache is not None and cache.get(fingerprint_a, fingerprint_b, settings) is not None:
+            continue
+        if (fingerprint_b, fingerprint_a) not in missing:
+            missing.setdefault((fingerprint_a, fingerprint_b), (deck_a, deck_b))
+
+    tasks = [
+        (key, DeckTemplate(deck_a), DeckTemplate(deck_b), start, stop)
+        for key, (deck_a, deck_b) in missing.items()
+        for start, stop in chunk_ranges(0, games, chunk_size, paired)
+    ]
+    results = {key: BatchResult(seed=seed) for key in missing}
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(play_range, a, b, seed, start, stop, policy, max_turns, paired)
+                for _, a, b, start, stop in tasks
+            ]
+            for (key, *_), future in zip(tasks, futures):
+                results[key].merge(future.result())
+    else:
+        for key, a, b, start, stop in tasks:
+            results[key].merge(play_range(a, b, seed, start, stop, policy, max_turns, paired))
+
+    records = {key: MatchupRecord.from_result(result) for key, result in results.items()}
+    if cache is not None:
+        for (fingerprint_a, fingerprint_b), result in results.items():
+            cache.put(fingerprint_a, fingerprint_b, settings, result)
+
+    outcomes: List[Tuple[MatchupRecord, bool]] = []
+    reported = set()
+    for fingerprint_a, fingerprint_b in fingerprints:
+        key = (fingerprint_a, fingerprint_b)
+        if fingerprint_a == fingerprint_b:
+            outcomes.append((MatchupRecord(games, (games // 2, games // 2), games % 2), False))
+        elif key in records or key[::-1] in records:
+            record = records[key] if key in records else records[key[::-1]].swapped()
+            # A matchup asked for twice was only simulated for the first
+            canonical = min(key, key[::-1])
+            outcomes.append((record, canonical not in reported))
+            reported.add(canonical)
+        else:
+            record = cache.get(fingerprint_a, fingerprint_b, settings)  # type: ignore[union-attr]
+            outcomes.append((record, False))  # type: ignore[arg-type]
+    return outcomes
+
+
+def play_matchup(
+    deck_a: Deck,
+    deck_b: Deck,
+    games: int = 1000,
+    seed: int = 0,
+    workers: int = 1,
+    cache: Optional[MatchupCache] = None,
+    policy: Optional[Policy] = None,
+    max_turns: int = MAX_TURNS,
+    paired: bool = False,
+) -> Tuple[MatchupRecord, bool]:
+    """
+    The outcome of a matchup, from the cache if it was simulated before.
+
+    See play_matchups for the arguments.
+
+    Returns:
+        Tuple[MatchupRecord, bool]: The outcome from deck A's point of view, and whether it
+            was simulated now.
+    """
+    return play_matchups(
+        [(deck_a, deck_b)],
+        games,
+        seed=seed,
+        workers=workers,
+        cache=cache,
+        policy=policy,
+        max_turns=max_turns,
+        paired=paired,
+    )[0]
+
+
+@dataclass
+class MatchupMatrix:
+    """
+    Win rates of every deck against every other deck.
+
+    Attributes:
+        names (List[str]): The names of the decks, in the order of the rows and columns.
+        fingerprints (List[str]): The fingerprints of the decks.
+        win_rates (List[List[float]]): win_rates[i][j] is deck i's win rate against deck j.
+        games (List[List[int]]): The number of games behind every win rate.
+        simulated (int): The number of matchups simulated for this matrix.
+        cached (int): The number of matchups taken from the cache.
+        seconds (float): The wall-clock time spent building the matrix.
+    """
+
+    names: List[str]
+    fingerprints: List[str]
+    win_rates: List[List[float]]
+    games: List[List[int]]
+    simulated: int = 0
+    cached: int = 0
+    seconds: float = field(default=0.0, compare=False)
+
+    def average(self, name: str) -> float:
+        """The deck's average win rate against the other decks of the matrix."""
+        i = self.names.index(name)
+        others = [rate for j, rate in enumerate(self.win_rates[i]) if j != i]
+        return sum(others) / len(others) if others else 0.5
+
+    def report(self) -> str:
+        """The matrix as a text table, rows are the decks' win rates against the columns."""
+        width = max([len(name) for name in self.names] + [5])
+        lines = [" " * width + " " + " ".join(f"{name[:width]:>{width}}" for name in self.names)]
+        for name, rates in zip(self.names, self.win_rates):
+            cells = " ".join(f"{rate:>{width}.3f}" for rate in rates)
+            lines.append(f"{name:<{width}} {cells}")
+        return "\n".join(lines)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "names": list(self.names),
+            "fingerprints": list(self.fingerprints),
+            "win_rates": [list(row) for row in self.win_rates],
+            "games": [list(row) for row in self.games],
+            "simulated": self.simulated,
+            "cached": self.cached,
+            "seconds": self.seconds,
+        }
+
+
+def matchup_matrix(
+    decks: Dict[str, Deck],
+    games: int = 1000,
+    seed: int = 0,
+    workers: int = 1,
+    cache: Optional[MatchupCache] = None,
+    policy: Optional[Policy] = None,
+    max_turns: int = MAX_TURNS,
+    paired: bool = False,
+) -> MatchupMatrix:
+    """
+    Build the matchup matrix of the decks, simulating only the matchups missing in the cache.
+
+    Every pair of decks is simulated once, the win rate of the other direction is its
+    complement.
+
+    Args:
+        decks (Dict[str, Deck]): The decks by name.
+        games (int): The number of games per matchup.
+        seed (int): The seed of the games.
+        workers (int): The number of worker processes, shared by all matchups.
+        cache (Optional[MatchupCache]): The cache of earlier results, None simulates all.
+        policy (Optional[Policy]): The policy of all players, None plays random actions.
+        max_turns (int): The turn after which a game is stopped without a winner.
+        paired (bool): Whether to play mirrored pairs of games, see play_many.
+
+    Returns:
+        MatchupMatrix: The matrix, with how many matchups were simulated.
+    """
+    start_time = time.perf_counter()
+    names = list(decks)
+    size = len(names)
+    matrix = MatchupMatrix(
+        names=names,
+        fingerprints=[decks[name].fingerprint() for name in names],
+        win_rates=[[0.5] * size for _ in range(size)],
+        games=[[0] * size for _ in range(size)],
+    )
+
+    indices = [(i, j) for i in range(size) for j in range(i + 1, size)]
+    outcomes = play_matchups(
+        [(decks[names[i]], decks[names[j]]) for i, j in indices],
+        games,
+        seed=seed,
+        workers=workers,
+        cache=cache,
+        policy=policy,
+        max_turns=max_turns,
+        paired=paired,
+    )
+    for (i, j), (record, simulated) in zip(indices, outcomes):
+        if simulated:
+            matrix.simulated += 1
+        elif cache is not None and matrix.fingerprints[i] != matrix.fingerprints[j]:
+            matrix.cached += 1
+        matrix.win_rates[i][j] = record.win_rate
+        matrix.win_rates[j][i] = record.swapped().win_rate
+        matrix.games[i][j] = matrix.games[j][i] = record.games
+
+    matrix.seconds = time.perf_counter() - start_time
+    return matrix
@@ -1,19 +1,39 @@
 """Game mechanics for Pokemon Pocket Simulator."""
 
 from .ability import Ability
-from .action import Action, ActionType
+from .action import Action, ActionNotFoundError, ActionType
 from .attack import Attack, EnergyType
+from .chance import (
+    CardDraw,
+    ChanceEvent,
+    CoinFlips,
+    EnergyDraw,
+    Outcome,
+    RetreatDiscard,
+    RetreatTarget,
+)
 from .condition import Condition
+from .events import Event, EventBus
 from .item import Item
 from .supporter import Supporter
 
 __all__ = [
     "Ability",
     "Action",
+    "ActionNotFoundError",
     "ActionType",
     "Attack",
     "EnergyType",
+    "ChanceEvent",
+    "Outcome",
+    "CardDraw",
+    "EnergyDraw",
+    "RetreatTarget",
+    "RetreatDiscard",
+    "CoinFlips",
     "Condition",
+    "Event",
+    "EventBus",
     "Item",
     "Supporter",
 ]
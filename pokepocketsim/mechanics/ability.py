@@ -1,4 +1,5 @@
 import uuid
+from functools import partial
 from typing import (
     TYPE_CHECKING,
     List,
@@ -27,9 +28,7 @@ class Ability:
 
             ab_action = Action(
                 f"Use ability {self.name} on {player.active_card.name}",
-                lambda player, card_using_ability_id=card_using_ability.uuid, self=self: self.use(
-                    player, card_using_ability_id
-                ),
+                partial(self.use, using_card_id=card_using_ability.uuid),
                 ActionType.ABILITY,
             )
             return [ab_action]  # Return a list containing the action
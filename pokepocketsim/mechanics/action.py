@@ -5,6 +5,10 @@ if TYPE_CHECKING:
     from .player import Player
 
 
+class ActionNotFoundError(ValueError):
+    """Raised when an action is not among the available ones, e.g. a stale planned action."""
+
+
 class ActionType(Enum):
     FUNCTION = 1
     ATTACK = 2
@@ -42,11 +46,7 @@ class Action:
                 if isinstance(card, type(self.item_class)):
                     player.hand.remove(card)
                     break
-            self.function()
-        elif self.action_type == ActionType.ADD_ENERGY:
-            self.function()
-        else:
-            self.function(player)
+        self.function(player)
         return self.can_continue_turn
 
     def to_dict(self) -> Dict[str, Any]:
@@ -78,4 +78,6 @@ class Action:
                 ]
             ):
                 return action
-        raise Exception(f"No action found, tried to find \n{action_to_find} from \n{action_list}")
+        raise ActionNotFoundError(
+            f"No action found, tried to find \n{action_to_find} from \n{action_list}"
+        )
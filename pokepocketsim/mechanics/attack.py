@@ -1,16 +1,23 @@
-# Dynamically created attack methods and their source code:
-from functools import wraps
+"""
+Attack damage and the Attack class.
+
+The attacks themselves are compiled from the card database by mechanics.effects and
+registered on the Attack class under their function names, e.g. Attack.psychic_sphere.
+"""
+
+from collections import Counter
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Dict,
-    List,
-    TypeVar,
-    cast,
+    Optional,
+    Sequence,
 )
 
-from .attack_common import EnergyType
+from .attack_common import EnergyType  # noqa: F401, re-exported
+from .condition import Condition
+from .events import Event, EventBus, fold_all
 
 if TYPE_CHECKING:
     from ..core.card import Card
@@ -19,76 +26,82 @@ if TYPE_CHECKING:
 
 # Type for attack functions
 AttackFunc = Callable[["Player"], None]
-F = TypeVar("F", bound=AttackFunc)
 
 
-def apply_damage(func: F) -> F:
+def deal_damage(player: "Player", damage: int) -> None:
     """
-    Decorator that wraps attack functions to apply damage to the opponent.
+    Deal an attack's damage from the player's active card to the opponent's active card.
 
     Args:
-        func: The attack function to wrap
-
-    Returns:
-        The wrapped function that handles the damage application
+        player: The attacking player
+        damage: The damage of the attack before type effectiveness and conditions
     """
+    if player.active_card is None or player.opponent is None:
+        return None
+    if player.opponent.active_card is None:
+        return None
+
+    sides = (player.events, player.opponent.events)
+    for events in sides:
+        events.emit(Event.ON_ATTACK, player, player.active_card)
+
+    if damage == 0:
+        return None
+
+    defender = player.opponent.active_card
+    damage = attack_damage(damage, player.active_card, defender, events=sides)
+
+    # Apply damage
+    defender.hp -= damage
+    if player.print_actions:
+        print(f"{player.active_card.name} attacks {defender.name} for {damage} damage!")
+    return None
+
+
+def attack_damage(
+    damage: int,
+    attacker: "Card",
+    defender: "Card",
+    attacker_conditions: Optional[Condition] = None,
+    events: Sequence[EventBus] = (),
+) -> int:
+    """
+    The damage an attack of the attacker deals to the defender.
 
-    @wraps(func)
-    def wrapper(player: "Player", *args: Any, **kwargs: Any) -> None:
-        # Get the attack metadata from the card's attack info
-        attack_name = func.__name__
-        if player.active_card is None:
-            return None
-
-        # Find the attack info in the card's attacks list
-        attack_info = None
-        for attack in player.active_card.attacks:
-            if attack["title"].lower().replace(" ", "_") == attack_name:
-                attack_info = attack
-                break
-
-        if not attack_info:
-            return None
-
-        # Call the attack function (which may have additional side effects)
-        func(player, *args, **kwargs)
-
-        if player.opponent is None or player.opponent.active_card is None:
-            return None
-
-        # Get fixed damage from attack info
-        damage = attack_info.get("fixed_damage", 0)
-        if damage == 0:
-            return None
+    Applies type effectiveness, the damage conditions of both cards and the on_damage handlers
+    of the cards in play, the way deal_damage deals it, so planners can tell the damage of an
+    attack without playing it.
 
-        # Type effectiveness
-        if player.active_card and player.opponent.active_card:
-            player_card_type = str(player.active_card.energy_type)
-            opponent_card_type = str(player.opponent.active_card.energy_type)
+    Args:
+        damage: The fixed damage of the attack
+        attacker: The attacking card, or the card it evolves into before attacking
+        defender: The defending card
+        attacker_conditions: The attacker's conditions, None for attacker.conditions
+        events: The event buses of both sides, the attacker's first
 
-            # Apply weakness and resistance adjustments
-            damage = apply_type_effects(damage, player_card_type, opponent_card_type)
+    Returns:
+        The damage dealt
+    """
+    if damage == 0:
+        return 0
+    if attacker_conditions is None:
+        attacker_conditions = attacker.conditions
 
-        # Apply conditions
-        if player.active_card and "Plus10DamageDealed" in player.active_card.conditions:
-            damage += 10
-        if player.active_card and "Plus30DamageDealed" in player.active_card.conditions:
-            damage += 30
-        if (
-            player.opponent.active_card
-            and "Minus20DamageReceived" in player.opponent.active_card.conditions
-        ):
-            damage = max(0, damage - 20)
+    # Type effectiveness, weakness and resistance adjustments
+    damage = apply_type_effects(damage, str(attacker.energy_type), str(defender.energy_type))
 
-        # Apply damage
-        if player.opponent.active_card:
-            player.opponent.active_card.hp -= damage
-            if player.print_actions:
-                print(
-                    f"{player.active_card.name} attacks {player.opponent.active_card.name} for {damage} damage!"
-                )
+    # Apply conditions
+    if attacker_conditions & Condition.Plus10DamageDealed:
+        damage += 10
+    if attacker_conditions & Condition.Plus30DamageDealed:
+        damage += 30
+    if attacker_conditions & Condition.Minus20DamageDealed:
+        damage = max(0, damage - 20)
+    if defender.conditions & Condition.Minus20DamageReceived:
+        damage = max(0, damage - 20)
 
-    return cast(F, wrapper)
+    # Effects of the cards in play
+    return int(fold_all(events, Event.ON_DAMAGE, damage, attacker, defender))
 
 
 def apply_type_effects(damage: int, attacker_type: str, defender_type: str) -> int:
@@ -140,35 +153,54 @@ class Attack:
             Boolean indicating if the attack can be used
         """
         # attack_func may be either a callable (Attack.<name>) or an attack
-        # metadata dict (from Card.attacks). Normalize to attack_name.
+        # metadata dict (from Card.attacks), which needs no lookup.
+        attack_info = None
         if isinstance(attack_func, dict):
-            attack_name = attack_func.get("title", "").lower().replace(" ", "_")
-        else:
-            attack_name = getattr(attack_func, "__name__", "")
+            for attack in card.attacks:
+                if attack is attack_func:
+                    attack_info = attack
+                    break
+
+        # Otherwise normalize to attack_name and find the attack info in the card's metadata
+        if attack_info is None:
+            if isinstance(attack_func, dict):
+                attack_name = attack_func.get("title", "").lower().replace(" ", "_")
+            else:
+                attack_name = getattr(attack_func, "__name__", "")
+            for attack in card.attacks:
+                title_as_func = attack.get("title", "").lower().replace(" ", "_")
+                if title_as_func == attack_name:
+                    attack_info = attack
+                    break
 
-        # Find the corresponding attack info in the card's attack metadata
-        attack_info = None
-        for attack in card.attacks:
-            title_as_func = attack.get("title", "").lower().replace(" ", "_")
-            if title_as_func == attack_name:
-                attack_info = attack
-                break
-                
         if not attack_info:
             return False
 
+        return Attack.energy_paid(card.energies, attack_info)
+
+    @staticmethod
+    def energy_paid(energies: Dict[str, int], attack_info: Dict[str, Any]) -> bool:
+        """
+        Check if the energies attached to a card pay for an attack's energy requirement.
+
+        Args:
+            energies: The attached energies by lowercase type
+            attack_info: The attack metadata dict (from Card.attacks)
+
+        Returns:
+            Boolean indicating if the energies pay for the attack
+        """
         required_energy = attack_info.get("energy_required", [])
         colorless_count = sum(1 for e in required_energy if e == "Colorless")
-        typed_energy = [e for e in required_energy if e != "Colorless"]
+        typed_energy = Counter(e.lower() for e in required_energy if e != "Colorless")
 
-        # Check each required typed energy
-        for energy in typed_energy:
-            energy_type = energy.lower()
-            if card.energies.get(energy_type, 0) < 1:
+        # Check each required typed energy, as many times as it is required
+        for energy_type, count in typed_energy.items():
+            if energies.get(energy_type, 0) < count:
                 return False
 
         # Check if we have enough total energy for colorless cost
-        remaining_energy = card.get_total_energy() - len(typed_energy)
+        remaining_energy = sum(energies.values()) - sum(typed_energy.values())
         if remaining_energy < colorless_count:
             return False
 
@@ -191,867 +223,3 @@ class Attack:
             f"{count} {energy_type}" for energy_type, count in energy_cost.items()
         )
         return f"{name} ({damage} damage, {energy_str})"
-
-    @staticmethod
-    @apply_damage
-    def psychic_sphere(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def psydrive(player: "Player") -> None:
-        if player.active_card and player.active_card.energies.get("psychic", 0) < 2:
-            if player.print_actions:
-                print(
-                    f"Not enough energy, only {player.active_card.energies.get('psychic', 0)} psychic energy"
-                )
-            return
-
-        if player.active_card:
-            player.active_card.remove_energy(EnergyType.Psychic)
-            player.active_card.remove_energy(EnergyType.Psychic)
-
-    @staticmethod
-    @apply_damage
-    def circle_circuit(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def slash(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def crimson_storm(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def psy_report(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def ice_wing(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def blizzard(player: "Player") -> None:
-        # TODO ATTACK
-        pass
-
-    @staticmethod
-    @apply_damage
-    def sleepy_song(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def mega_punch(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def bonemerang(player: "Player") -> None:
-        # TODO ATTACK
-        pass
-
-    @staticmethod
-    @apply_damage
-    def spooky_shot(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def peck(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def thundering_hurricane(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def inferno_dance(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def heat_blast(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def surf(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def hydro_bazooka(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def hydro_splash(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def inferno_onrush(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def tropical_swing(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def razor_leaf(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def giant_bloom(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def tail_whap(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def power_blast(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def gnaw(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def mega_drain(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def copy_anything(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def tackle(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def rollout(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def pay_day(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def sharpen(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def draco_meteor(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def wing_attack(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def lovestrike(player: "Player") -> None:
-        # TODO ATTACK
-        pass
-
-    @staticmethod
-    @apply_damage
-    def poison_horn(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def growl(player: "Player") -> None:
-        # TODO ATTACK
-        pass
-
-    @staticmethod
-    @apply_damage
-    def mud_slap(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def psychic(player: "Player") -> None:
-        # TODO ATTACK
-        pass
-
-    @staticmethod
-    @apply_damage
-    def electro_ball(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def hydro_pump(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def fire_mane(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def hyper_beam(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def water_gun(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def ember(player: "Player") -> None:
-        # TODO ATTACK
-        pass
-
-    @staticmethod
-    @apply_damage
-    def double_horn(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def drool(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def vine_whip(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def bubble_drain(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def gentle_slap(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def lightning_ball(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def mist_slash(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def gust(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def primal_wingbeat(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def dizzy_punch(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def heavy_impact(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def venoshock(player: "Player") -> None:
-        # TODO ATTACK
-        pass
-
-    @staticmethod
-    @apply_damage
-    def leech_life(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def double_edge(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def seismic_toss(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def psyshot(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def psypunch(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def bother(player: "Player") -> None:
-        # TODO ATTACK
-        pass
-
-    @staticmethod
-    @apply_damage
-    def thunder_fang(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def raging_thunder(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def pin_missile(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def spinning_attack(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def thunderbolt(player: "Player") -> None:
-        # TODO ATTACK
-        pass
-
-    @staticmethod
-    @apply_damage
-    def fire_spin(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def ice_beam(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def ancient_whirlpool(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def sky_attack(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def flamethrower(player: "Player") -> None:
-        # TODO ATTACK
-        pass
-
-    @staticmethod
-    @apply_damage
-    def heat_tackle(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def stomp(player: "Player") -> None:
-        # TODO ATTACK
-        pass
-
-    @staticmethod
-    @apply_damage
-    def soothing_scent(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def sharp_sting(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def second_strike(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def do_the_wave(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def horn_attack(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def continuous_lick(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def drill_peck(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def shadow_claw(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def tail_smack(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def metal_claw(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def bite(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def corner(player: "Player") -> None:
-        # TODO ATTACK
-        pass
-
-    @staticmethod
-    @apply_damage
-    def knock_back(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def spiral_kick(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def shell_attack(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def horn_drill(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def bone_beatdown(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def land_crush(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def strength(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def fight_back(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def dig(player: "Player") -> None:
-        # TODO ATTACK
-        pass
-
-    @staticmethod
-    @apply_damage
-    def double_lariat(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def smack(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def barrier_attack(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def will_o_wisp(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def super_psy_bolt(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def magical_shot(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def thunder_shock(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def head_bolt(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def thunder_spear(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def powder_snow(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def water_drip(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def leaf_supply(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def wave_splash(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def water_arrow(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def ko_crab(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def poison_tentacles(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def knuckle_punch(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def aqua_edge(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def fire_blast(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def fire_claws(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def rolling_tackle(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def poison_powder(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def sing(player: "Player") -> None:
-        # TODO ATTACK
-        pass
-
-    @staticmethod
-    @apply_damage
-    def surprise_attack(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def reckless_charge(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def slap(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def scratch(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def leek_slap(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def pound(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def hyper_voice(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def drill_run(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def ram(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def amass(player: "Player") -> None:
-        # TODO ATTACK
-        pass
-
-    @staticmethod
-    @apply_damage
-    def pierce(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def crunch(player: "Player") -> None:
-        # TODO ATTACK
-        pass
-
-    @staticmethod
-    @apply_damage
-    def suffocating_gas(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def poison_gas(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def glide(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def call_for_family(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def stretch_kick(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def jab(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def flop(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def low_kick(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def heart_stamp(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def mumble(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def teleport(player: "Player") -> None:
-        # TODO ATTACK
-        pass
-
-    @staticmethod
-    @apply_damage
-    def quick_attack(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def tiny_charge(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def zap_kick(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def thunder_punch(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def rain_splash(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def flap(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def splash(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def horn_hazard(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def vise_grip(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def tongue_slap(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def headbutt(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def razor_fin(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def headache(player: "Player") -> None:
-        # TODO ATTACK
-        pass
-
-    @staticmethod
-    @apply_damage
-    def combustion(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def magma_punch(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def flare(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def tail_whip(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def blot(player: "Player") -> None:
-        # TODO ATTACK
-        pass
-
-    @staticmethod
-    @apply_damage
-    def attach(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def sharp_scythe(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def absorb(player: "Player") -> None:
-        # TODO ATTACK
-        pass
-
-    @staticmethod
-    @apply_damage
-    def seed_bomb(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def sting(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def bug_bite(player: "Player") -> None:
-        pass
-
-    @staticmethod
-    @apply_damage
-    def find_a_friend(player: "Player") -> None:
-        pass
@@ -0,0 +1,200 @@
+"""
+Chance events: the random steps of the engine with their outcome distributions.
+
+Every random step of the engine is a ChanceEvent with the same interface:
+
+    outcomes()      every distinct outcome with its probability, for planners to enumerate
+    sample(rng)     one outcome drawn the way the engine always drew it
+    resolve(value)  play the step with the given outcome, or a sampled one for None
+
+The engine resolves the events without a value, so games play as before. An expected-value
+planner copies the state once per outcome, resolves the copy with that outcome and weights its
+evaluation with the probability, instead of sampling the step hundreds of times.
+"""
+
+import random
+from math import comb
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Tuple
+
+if TYPE_CHECKING:
+    from ..core.card import Card
+    from ..core.player import Player
+
+
+class Outcome(NamedTuple):
+    """
+    One outcome of a chance event.
+
+    Attributes:
+        value (Any): The outcome, as accepted by the event's resolve.
+        probability (float): Its probability, the probabilities of an event add up to 1.
+    """
+
+    value: Any
+    probability: float
+
+
+class ChanceEvent:
+    """A random step of the engine, see the module documentation."""
+
+    def outcomes(self) -> List[Outcome]:
+        """Every distinct outcome with its probability, empty if the step cannot happen."""
+        raise NotImplementedError
+
+    def sample(self, rng: Optional[random.Random] = None) -> Any:
+        """Draw an outcome, from the random module if no generator is given."""
+        outcomes = self.outcomes()
+        threshold = (rng or random).random()
+        for value, probability in outcomes:
+            threshold -= probability
+            if threshold < 0:
+                return value
+        return outcomes[-1].value
+
+    def resolve(self, value: Any = None) -> Any:
+        """Play the step with the outcome, a sampled one for None, and return the outcome."""
+        raise NotImplementedError
+
+    def expectation(self, function: Any) -> float:
+        """The expected value of function(outcome value) over the outcomes."""
+        return sum(probability * function(value) for value, probability in self.outcomes())
+
+
+class EnergyDraw(ChanceEvent):
+    """The energy a player draws at the start of its turn, uniform over its deck's types."""
+
+    def __init__(self, player: "Player") -> None:
+        self.player = player
+
+    def outcomes(self) -> List[Outcome]:
+        return [Outcome(*outcome) for outcome in self.player.deck.energy_outcomes()]
+
+    def sample(self, rng: Optional[random.Random] = None) -> str:
+        deck = self.player.deck
+        return (rng or deck.rng or random).choice(deck.energy_types)
+
+    def resolve(self, value: Optional[str] = None) -> str:
+        energy = value if value is not None else self.sample()
+        self.player.current_energy = energy
+        return energy
+
+
+class CardDraw(ChanceEvent):
+    """
+    The card a player draws at the start of its turn.
+
+    The deck order is hidden, so from the player's point of view every card of the deck is
+    equally likely. Copies of a card are one outcome, the index of the first copy. The engine
+    draws the top card of the already shuffled deck.
+    """
+
+    def __init__(self, player: "Player") -> None:
+        self.player = player
+
+    def outcomes(self) -> List[Outcome]:
+        return [Outcome(*outcome) for outcome in self.player.deck.draw_outcomes()]
+
+    def sample(self, rng: Optional[random.Random] = None) -> Optional[int]:
+        return 0 if self.player.deck.cards else None
+
+    def resolve(self, value: Optional[int] = None) -> Optional[Any]:
+        """Draw the card at the index into the hand, the top card for None."""
+        deck = self.player.deck
+        card = deck.draw_card() if value is None else deck.draw_card_at(value)
+        if card is not None:
+            self.player.hand.append(card)
+        return card
+
+
+class RetreatTarget(ChanceEvent):
+    """
+    The bench pokemon that becomes active when the active pokemon goes to the bench, in
+    Player.move_active_card_to_bench (retreat, Sabrina).
+
+    Outcomes are indices into the bench before the move, every bench pokemon is equally likely.
+    """
+
+    def __init__(self, player: "Player") -> None:
+        self.player = player
+
+    def outcomes(self) -> List[Outcome]:
+        bench = self.player.bench
+        return [Outcome(index, 1 / len(bench)) for index in range(len(bench))]
+
+    def sample(self, rng: Optional[random.Random] = None) -> int:
+        # Same draw as picking from the bench, so games keep their random stream
+        return (rng or random).randrange(len(self.player.bench))
+
+    def resolve(self, value: Optional[int] = None) -> int:
+        target = value if value is not None else self.sample()
+        self.player.move_active_card_to_bench(target)
+        return target
+
+
+class RetreatDiscard(ChanceEvent):
+    """
+    The energies discarded to pay a retreat cost, in Card.remove_retreat_cost_energy.
+
+    The engine discards one energy at a time, of a type chosen uniformly among the types the
+    card still has. Outcomes are the sorted tuples of discarded energy types.
+    """
+
+    def __init__(self, card: "Card") -> None:
+        self.card = card
+
+    def outcomes(self) -> List[Outcome]:
+        distribution: Dict[Tuple[str, ...], float] = {}
+
+        def discard(energies: Dict[str, int], discarded: Tuple[str, ...], p: float) -> None:
+            if len(discarded) == self.card.retreat_cost:
+                key = tuple(sorted(discarded))
+                distribution[key] = distribution.get(key, 0.0) + p
+                return
+            available = [energy for energy, count in energies.items() if count > 0]
+            for energy in available:
+                energies[energy] -= 1
+                discard(energies, discarded + (energy,), p / len(available))
+                energies[energy] += 1
+
+        if self.card.get_total_energy() >= self.card.retreat_cost:
+            discard(dict(self.card.energies), (), 1.0)
+        return [Outcome(value, probability) for value, probability in distribution.items()]
+
+    def sample(self, rng: Optional[random.Random] = None) -> Tuple[str, ...]:
+        energies = dict(self.card.energies)
+        discarded = []
+        for _ in range(self.card.retreat_cost):
+            available = [energy for energy, count in energies.items() if count > 0]
+            if not available:
+                raise ValueError("Not enough energy to cover the retreat cost.")
+            energy = (rng or random).choice(available)
+            energies[energy] -= 1
+            discarded.append(energy)
+        return tuple(sorted(discarded))
+
+    def resolve(self, value: Optional[Tuple[str, ...]] = None) -> Tuple[str, ...]:
+        discarded = value if value is not None else self.sample()
+        self.card.remove_retreat_cost_energy(discarded)
+        return discarded
+
+
+class CoinFlips(ChanceEvent):
+    """
+    The number of heads of flipping a coin count times, e.g. for attacks that flip coins or
+    for waking up (Asleep) and recovering (Paralyzed).
+    """
+
+    def __init__(self, count: int = 1) -> None:
+        self.count = count
+
+    def outcomes(self) -> List[Outcome]:
+        return [
+            Outcome(heads, comb(self.count, heads) / 2**self.count)
+            for heads in range(self.count + 1)
+        ]
+
+    def sample(self, rng: Optional[random.Random] = None) -> int:
+        return sum((rng or random).choice([True, False]) for _ in range(self.count))
+
+    def resolve(self, value: Optional[int] = None) -> int:
+        return value if value is not None else self.sample()
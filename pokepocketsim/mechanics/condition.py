@@ -1,39 +1,87 @@
-import random
+"""
+Special conditions and effects on pokemon, stored as bit flags.
 
+A card's conditions are one Condition value, the bitwise or of the conditions it has, so
+adding, removing and testing a condition is a single bit operation and a card's conditions
+copy and hash like an int.
 
-class ConditionBase:
-    def rid(self) -> bool:
-        raise NotImplementedError("Subclasses should implement this method")
+Every condition has an expiry in CONDITION_EXPIRY, which tells Card.update_conditions when the
+condition goes away at the start of its owner's turn: always, never, or when a coin flip comes
+up heads.
+"""
 
-    def serialize(self) -> str:
-        return self.__class__.__name__
+from enum import Enum, IntFlag
+from typing import Dict, List, Tuple
 
+from .chance import CoinFlips
 
-class Condition:
-    class Minus20DamageReceived(ConditionBase):
-        def rid(self) -> bool:
-            return True
 
-    class Minus20DamageDealed(ConditionBase):
-        def rid(self) -> bool:
-            return True
+class Condition(IntFlag):
+    NONE = 0
+    Minus20DamageReceived = 1
+    Minus20DamageDealed = 2
+    Plus10DamageDealed = 4
+    Plus30DamageDealed = 8
+    Poison = 16
+    Asleep = 32
+    Paralyzed = 64
 
-    class Plus10DamageDealed(ConditionBase):
-        def rid(self) -> bool:
-            return True
 
-    class Plus30DamageDealed(ConditionBase):
-        def rid(self) -> bool:
-            return True
+class Expiry(Enum):
+    """When a condition goes away at the start of its owner's turn."""
 
-    class Poison(ConditionBase):
-        def rid(self) -> bool:
-            return False
+    TURN = "turn"
+    NEVER = "never"
+    COIN_FLIP = "coin_flip"
 
-    class Asleep(ConditionBase):
-        def rid(self) -> bool:
-            return random.choice([True, False])
 
-    class Paralyzed(ConditionBase):
-        def rid(self) -> bool:
-            return random.choice([True, False])
+CONDITION_EXPIRY: Dict[Condition, Expiry] = {
+    Condition.Minus20DamageReceived: Expiry.TURN,
+    Condition.Minus20DamageDealed: Expiry.TURN,
+    Condition.Plus10DamageDealed: Expiry.TURN,
+    Condition.Plus30DamageDealed: Expiry.TURN,
+    Condition.Poison: Expiry.NEVER,
+    # Heads wakes the pokemon up, or lets it recover
+    Condition.Asleep: Expiry.COIN_FLIP,
+    Condition.Paralyzed: Expiry.COIN_FLIP,
+}
+
+# Every single condition, in flag order
+CONDITIONS: Tuple[Condition, ...] = tuple(CONDITION_EXPIRY)
+
+
+def _mask(expiry: Expiry) -> Condition:
+    mask = Condition.NONE
+    for condition, condition_expiry in CONDITION_EXPIRY.items():
+        if condition_expiry is expiry:
+            mask |= condition
+    return mask
+
+
+# The conditions of every expiry together
+EXPIRES_EACH_TURN: Condition = _mask(Expiry.TURN)
+EXPIRES_ON_HEADS: Condition = _mask(Expiry.COIN_FLIP)
+
+
+def expire(conditions: Condition) -> Condition:
+    """
+    The conditions left at the start of their owner's turn.
+
+    Args:
+        conditions (Condition): The conditions of a card.
+
+    Returns:
+        Condition: The conditions without the expired ones, a coin is flipped for every
+            condition that goes away on heads.
+    """
+    conditions &= ~EXPIRES_EACH_TURN
+    if conditions & EXPIRES_ON_HEADS:
+        for condition in CONDITIONS:
+            if condition & conditions & EXPIRES_ON_HEADS and CoinFlips(1).resolve() == 1:
+                conditions &= ~condition
+    return conditions
+
+
+def condition_names(conditions: Condition) -> List[str]:
+    """The names of the conditions, in flag order."""
+    return [str(condition.name) for condition in CONDITIONS if condition & conditions]
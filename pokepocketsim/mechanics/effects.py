@@ -0,0 +1,270 @@
+"""
+Compiler of the declarative attack effects in the card database.
+
+An attack record of the database gives the attack's damage ("fixed_damage") and the effects it
+has on top, as a list of specs under "effects":
+
+    {"kind": "discard_energy", "energy": "Psychic", "count": 2}
+        Discard energies from the attacker, "Any" discards energies of random types. Raises
+        ValueError without enough energies, the attack's cost has to cover them.
+    {"kind": "heal", "amount": 30}
+        Heal the attacker, up to its maximum hp.
+    {"kind": "apply_condition", "condition": "Poison", "target": "opponent"}
+        Give the defender ("opponent") or the attacker ("self") a Condition.
+    {"kind": "coin_flip", "count": 2, "damage_per_heads": 30, "on_heads": [...]}
+        Flip coins, add damage per heads and play the on_heads effects if every coin is heads.
+    {"kind": "bench_damage", "amount": 20}
+        Damage every pokemon on the opponent's bench, without type effectiveness.
+
+When the database is loaded every attack is compiled once into a closure that plays its effects
+and deals its damage, and registered on the Attack class under the attack's function name
+(the title in snake case), where the attack actions find it. The database is the only place the
+damage and the effects of an attack are written down.
+"""
+
+import hashlib
+import inspect
+import json
+import random
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List
+
+from .attack import Attack, AttackFunc, deal_damage
+from .attack_common import EnergyType
+from .chance import CoinFlips
+from .condition import Condition
+
+if TYPE_CHECKING:
+    from ..core.player import Player
+
+# Plays an effect and returns the damage it adds to the attack
+Effect = Callable[["Player"], int]
+
+
+def attack_function_name(title: str) -> str:
+    """The name of an attack's function, e.g. psychic_sphere for Psychic Sphere."""
+    return title.lower().replace(" ", "_")
+
+
+# The effects, called with the attacking player and the arguments of their spec
+
+
+def discard_energy(player: "Player", energy: str = "Any", count: int = 1) -> int:
+    card = player.active_card
+    if card is None:
+        return 0
+    energy = energy.lower()
+    # The cost of the attack covers the discard, see Attack.energy_paid
+    if energy == EnergyType.Any.value:
+        attached = sum(card.energies.values())
+    else:
+        attached = card.energies.get(energy, 0)
+    if attached < count:
+        raise ValueError(f"Not enough {energy} energy to discard {count}, {attached} attached")
+    for _ in range(count):
+        if energy == EnergyType.Any.value:
+            available = [e for e, amount in card.energies.items() if amount > 0]
+            card.remove_energy(EnergyType(random.choice(available)))
+        else:
+            card.remove_energy(EnergyType(energy))
+    return 0
+
+
+def heal(player: "Player", amount: int) -> int:
+    card = player.active_card
+    if card is not None:
+        card.hp = min(card.max_hp, card.hp + amount)
+    return 0
+
+
+def apply_condition(player: "Player", condition: str, target: str = "opponent") -> int:
+    side = player.opponent if target == "opponent" else player
+    if side is not None and side.active_card is not None:
+        side.active_card.add_condition(Condition[condition])
+    return 0
+
+
+def bench_damage(player: "Player", amount: int) -> int:
+    opponent = player.opponent
+    if opponent is None:
+        return 0
+    for card in list(opponent.bench):
+        card.hp -= amount
+        if card.hp <= 0:
+            # Knocked out on the bench, scored like an active pokemon
+            player.points += 2 if card.is_ex else 1
+            opponent.bench.remove(card)
+            opponent.events.leave(card)
+            opponent.discard_pile.append(card)
+    return 0
+
+
+def fixed_damage(player: "Player", title: str, default: int) -> int:
+    """The damage of the attack in the active card's own record, the default without one."""
+    card = player.active_card
+    if card is not None:
+        for record in card.attacks:
+            if record.get("title") == title:
+                return int(record.get("fixed_damage", 0))
+    return default
+
+
+EFFECTS: Dict[str, Callable[..., int]] = {
+    "discard_energy": discard_energy,
+    "heal": heal,
+    "apply_condition": apply_condition,
+    "bench_damage": bench_damage,
+}
+
+
+def _validate(kind: str, arguments: Dict[str, Any]) -> None:
+    """Check the arguments of a spec against its effect, raising ValueError."""
+    if kind == "coin_flip":
+        unknown = set(arguments) - {"count", "damage_per_heads", "on_heads"}
+        if unknown:
+            raise ValueError(f"Invalid coin_flip effect arguments {sorted(unknown)}")
+        return
+    if kind not in EFFECTS:
+        raise ValueError(f"Unknown attack effect {kind!r}")
+    try:
+        inspect.signature(EFFECTS[kind]).bind(None, **arguments)
+    except TypeError as e:
+        raise ValueError(f"Invalid {kind} effect arguments {arguments}: {e}") from e
+    if kind == "apply_condition":
+        if arguments["condition"] not in Condition.__members__:
+            raise ValueError(f"Unknown condition {arguments['condition']!r}")
+        if arguments.get("target", "opponent") not in ("opponent", "self"):
+            raise ValueError(f"Unknown condition target {arguments['target']!r}")
+
+
+def _coin_flip(
+    count: int = 1, damage_per_heads: int = 0, on_heads: Iterable[Dict[str, Any]] = ()
+) -> Effect:
+    effects = compile_effects(on_heads)
+
+    def coin_flip(player: "Player") -> int:
+        heads = CoinFlips(count).resolve()
+        damage = heads * damage_per_heads
+        if heads == count:
+            damage += sum(effect(player) for effect in effects)
+        return damage
+
+    return coin_flip
+
+
+def compile_effects(specs: Iterable[Dict[str, Any]]) -> List[Effect]:
+    """
+    Compile effect specs into effect functions.
+
+    Args:
+        specs (Iterable[Dict[str, Any]]): The specs, see the module documentation.
+
+    Returns:
+        List[Effect]: The effects, each plays its spec and returns the damage it adds.
+
+    Raises:
+        ValueError: If a spec has an unknown kind or arguments.
+    """
+    effects: List[Effect] = []
+    for spec in specs:
+        arguments = dict(spec)
+        kind = arguments.pop("kind", None)
+        _validate(kind, arguments)
+        if kind == "coin_flip":
+            effects.append(_coin_flip(**arguments))
+        else:
+            effects.append(partial(EFFECTS[kind], **arguments))
+    return effects
+
+
+def compile_attack(attack_info: Dict[str, Any]) -> AttackFunc:
+    """
+    Compile an attack record of the database into the function playing the attack.
+
+    The damage is read from the attacker's own record when the attack is played, so cards
+    sharing an attack title may deal different damage.
+
+    Args:
+        attack_info (Dict[str, Any]): The attack record, with "title", "fixed_damage" and
+            optional "effects".
+
+    Returns:
+        AttackFunc: Plays the effects, then deals the damage plus what the effects added.
+    """
+    title = attack_info.get("title", "")
+    effects = compile_effects(attack_info.get("effects") or [])
+
+    default = attack_info.get("fixed_damage", 0)
+
+    def attack(player: "Player") -> None:
+        if player.active_card is None:
+            return None
+        damage = sum(effect(player) for effect in effects)
+        deal_damage(player, fixed_damage(player, title, default) + damage)
+        return None
+
+    name = attack_function_name(title)
+    attack.__name__ = name
+    attack.__qualname__ = f"Attack.{name}"
+    attack.__module__ = Attack.__module__
+    return attack
+
+
+def unique_attacks(records: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    The attack records with one record per function name, in database order.
+
+    Raises:
+        ValueError: If two records with the same title declare different effects.
+    """
+    unique: Dict[str, Dict[str, Any]] = {}
+    for attack_info in records:
+        name = attack_function_name(attack_info.get("title", ""))
+        if name in unique:
+            if (unique[name].get("effects") or []) != (attack_info.get("effects") or []):
+                raise ValueError(f"Attack {attack_info.get('title')!r} has conflicting effects")
+            continue
+        unique[name] = attack_info
+    return list(unique.values())
+
+
+def attacks_digest(records: Iterable[Dict[str, Any]]) -> str:
+    """A digest of the titles, damage and effects of the attack records."""
+    keyed = sorted(
+        (
+            {
+                "title": attack_info.get("title", ""),
+                "fixed_damage": attack_info.get("fixed_damage", 0),
+                "effects": attack_info.get("effects") or [],
+            }
+            for attack_info in records
+        ),
+        key=lambda attack_info: json.dumps(attack_info, sort_keys=True),
+    )
+    return hashlib.sha256(json.dumps(keyed, sort_keys=True).encode()).hexdigest()
+
+
+def register_attacks(records: Iterable[Dict[str, Any]]) -> None:
+    """
+    Register the functions of the attack records on the Attack class.
+
+    The functions of generated_attacks (see generator_attack) are used while that module was
+    generated from the same records, otherwise the records are compiled.
+
+    Raises:
+        ValueError: If two records with the same title declare different effects.
+    """
+    attacks = unique_attacks(records)
+    try:
+        from . import generated_attacks
+
+        static = generated_attacks.ATTACKS
+        if generated_attacks.DIGEST != attacks_digest(attacks):
+            static = {}
+    except ImportError:
+        static = {}
+
+    for attack_info in attacks:
+        name = attack_function_name(attack_info.get("title", ""))
+        function = static.get(name) or compile_attack(attack_info)
+        setattr(Attack, name, staticmethod(function))
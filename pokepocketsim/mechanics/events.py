@@ -0,0 +1,96 @@
+"""
+Event hooks of the cards in play.
+
+Every player has an EventBus with a list of subscribers per event. A card subscribes its
+handlers when it comes into play and unsubscribes them when it leaves play (knocked out) or
+changes (evolves), see Card.handlers. Dispatching an event only runs the handlers of the cards
+that care about it, instead of checking every card in play for every effect.
+
+Handlers are called with the event's arguments followed by the subscribed card:
+
+    ON_TURN_START      handler(player, card)                 at the start of the owner's turn
+    ON_GATHER_ACTIONS  handler(player, card) -> actions      when the owner's actions are listed
+    ON_ATTACK          handler(player, attacker, card)       when either side attacks
+    ON_DAMAGE          handler(damage, attacker, defender, card) -> damage
+                                                             when attack damage is computed
+
+Abilities take part by defining methods named after the event values, e.g. gather_actions.
+"""
+
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Tuple
+
+if TYPE_CHECKING:
+    from ..core.card import Card
+
+Handler = Callable[..., Any]
+
+
+class Event(Enum):
+    ON_TURN_START = "on_turn_start"
+    ON_GATHER_ACTIONS = "gather_actions"
+    ON_ATTACK = "on_attack"
+    ON_DAMAGE = "on_damage"
+
+
+class EventBus:
+    """
+    Subscriber lists of one player's cards in play, see the module documentation.
+
+    Attributes:
+        subscribers (Dict[Event, List[Tuple[Card, Handler]]]): The handlers of every event,
+            in the order their cards came into play.
+    """
+
+    def __init__(self) -> None:
+        self.subscribers: Dict[Event, List[Tuple["Card", Handler]]] = {
+            event: [] for event in Event
+        }
+
+    def enter(self, card: "Card") -> None:
+        """Subscribe the handlers of a card coming into play."""
+        for event, handler in card.handlers():
+            self.subscribers[event].append((card, handler))
+
+    def leave(self, card: "Card") -> None:
+        """Unsubscribe the handlers of a card leaving play."""
+        for event, subscribers in self.subscribers.items():
+            if any(subscriber is card for subscriber, _ in subscribers):
+                self.subscribers[event] = [
+                    (subscriber, handler)
+                    for subscriber, handler in subscribers
+                    if subscriber is not card
+                ]
+
+    def refresh(self, card: "Card") -> None:
+        """Subscribe a card again after it changed, e.g. evolved."""
+        self.leave(card)
+        self.enter(card)
+
+    def emit(self, event: Event, *args: Any) -> None:
+        """Call the handlers of the event."""
+        for card, handler in self.subscribers[event]:
+            handler(*args, card)
+
+    def collect(self, event: Event, *args: Any) -> List[Any]:
+        """Call the handlers of the event and concatenate the lists they return."""
+        results: List[Any] = []
+        for card, handler in self.subscribers[event]:
+            results.extend(handler(*args, card))
+        return results
+
+    def fold(self, event: Event, value: Any, *args: Any) -> Any:
+        """Pass a value through the handlers of the event, each returns the new value."""
+        for card, handler in self.subscribers[event]:
+            value = handler(value, *args, card)
+        return value
+
+    def __len__(self) -> int:
+        return sum(len(subscribers) for subscribers in self.subscribers.values())
+
+
+def fold_all(buses: Iterable[EventBus], event: Event, value: Any, *args: Any) -> Any:
+    """Pass a value through the handlers of the event on every bus, in order."""
+    for bus in buses:
+        value = bus.fold(event, value, *args)
+    return value
@@ -0,0 +1,70 @@
+"""
+Attack functions generated from the card database by pokepocketsim.generator_attack.
+
+Do not edit, run python -m pokepocketsim.generator_attack after changing the attacks.
+"""
+
+from typing import TYPE_CHECKING, Callable, Dict
+
+from .attack import deal_damage
+from .effects import discard_energy, fixed_damage
+
+if TYPE_CHECKING:
+    from ..core.player import Player
+
+DIGEST = "f6d2b980012a71b5aeee20f0037c73e5ff5055b6cd42e50a571bcd1e70e2de4c"
+
+
+def psychic_sphere(player: "Player") -> None:
+    if player.active_card is None:
+        return None
+    damage = 0
+    damage += fixed_damage(player, "Psychic Sphere", 50)
+    deal_damage(player, damage)
+    return None
+
+
+def psydrive(player: "Player") -> None:
+    if player.active_card is None:
+        return None
+    damage = 0
+    damage += discard_energy(player, energy="Psychic", count=2)
+    damage += fixed_damage(player, "Psydrive", 150)
+    deal_damage(player, damage)
+    return None
+
+
+def ram(player: "Player") -> None:
+    if player.active_card is None:
+        return None
+    damage = 0
+    damage += fixed_damage(player, "Ram", 10)
+    deal_damage(player, damage)
+    return None
+
+
+def smack(player: "Player") -> None:
+    if player.active_card is None:
+        return None
+    damage = 0
+    damage += fixed_damage(player, "Smack", 30)
+    deal_damage(player, damage)
+    return None
+
+
+def psyshot(player: "Player") -> None:
+    if player.active_card is None:
+        return None
+    damage = 0
+    damage += fixed_damage(player, "Psyshot", 60)
+    deal_damage(player, damage)
+    return None
+
+
+ATTACKS: Dict[str, Callable[["Player"], None]] = {
+    "psychic_sphere": psychic_sphere,
+    "psydrive": psydrive,
+    "ram": ram,
+    "smack": smack,
+    "psyshot": psyshot,
+}
@@ -19,10 +19,6 @@ class Item:
         def use(self, card: ICard) -> None:
             """Use the potion on a card."""
             card.hp = min(card.hp + 20, card.max_hp)
-            restored_amount = min(20, card.max_hp - card.hp)
-            print(
-                f"\t- Potion used on {card.name}. Restored {restored_amount} HP. Current HP: {card.hp}"
-            )
 
         @staticmethod
         def serialize() -> str:
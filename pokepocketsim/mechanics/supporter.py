@@ -28,9 +28,9 @@ class Supporter:
             return True
 
         def use(self, player: IPlayer) -> None:
-            player.active_card.add_condition(Condition.Plus10DamageDealed())
+            player.active_card.add_condition(Condition.Plus10DamageDealed)
             for card in player.bench:
-                card.add_condition(Condition.Plus10DamageDealed())
+                card.add_condition(Condition.Plus10DamageDealed)
 
     class Sabrina(ISupporter):
         def __init__(self) -> None:
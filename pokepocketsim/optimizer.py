@@ -0,0 +1,439 @@
+"""
+Genetic deck optimizer.
+
+Searches the decks that can be built from a card pool for the highest average win rate against a
+reference field. A deck is a genome of card names and energy types, evolved with tournament
+selection, crossover, mutation and elitism.
+
+Fitness is the expensive part, so it is evaluated with successive halving: every generation, all
+candidates play a few games against every deck of the field, the better 1/eta of them play eta
+times as many, and so on until the survivors play max_games. Weak candidates are dropped after
+few games, and a candidate's fitness is its win rate on the highest rung it reached. All games
+run on one pool of worker processes through play_matchups, and with a MatchupCache the
+candidates seen in earlier generations (or earlier runs) are not simulated again.
+"""
+
+import math
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from .core.card import find_card_by_name
+from .core.deck import Deck
+from .engine.playout import MAX_TURNS, Policy
+from .matchups import MatchupCache, play_matchups
+from .mechanics.attack import EnergyType
+from .mechanics.item import Item
+from .mechanics.supporter import Supporter
+
+
+@dataclass(frozen=True)
+class DeckGenome:
+    """
+    A deck as the optimizer sees it, independent of the order of its cards.
+
+    Attributes:
+        cards (Tuple[str, ...]): The sorted names of the cards, items and supporters.
+        energy_types (Tuple[str, ...]): The sorted energy types.
+    """
+
+    cards: Tuple[str, ...]
+    energy_types: Tuple[str, ...]
+
+    @classmethod
+    def create(cls, cards: Sequence[str], energy_types: Sequence[str]) -> "DeckGenome":
+        return cls(tuple(sorted(cards)), tuple(sorted(set(energy_types))))
+
+    def to_deck(self) -> Deck:
+        return Deck.from_names(list(self.cards), list(self.energy_types))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {"cards": list(self.cards), "energy_types": list(self.energy_types)}
+
+    def __str__(self) -> str:
+        counts = Counter(self.cards)
+        cards = ", ".join(f"{count}x {name}" for name, count in sorted(counts.items()))
+        return f"{cards} [{'/'.join(self.energy_types)}]"
+
+
+class Fitness(NamedTuple):
+    """
+    The fitness of a candidate in one generation.
+
+    Candidates are ordered by the rung they reached first and their win rate second, so a
+    candidate dropped early never ranks above one that survived.
+
+    Attributes:
+        rung (int): The successive halving rung reached, 0 for the first.
+        win_rate (float): The average win rate against the field on that rung.
+        games (int): The games played against every deck of the field on that rung.
+    """
+
+    rung: int
+    win_rate: float
+    games: int
+
+
+@dataclass
+class GenerationStats:
+    """
+    Summary of one generation.
+
+    Attributes:
+        generation (int): The number of the generation, from 0.
+        best (DeckGenome): The best candidate of the generation.
+        best_win_rate (float): Its win rate against the field.
+        mean_win_rate (float): The mean win rate of the population, every candidate on the
+            highest rung it reached.
+        simulated (int): The number of matchups simulated for the generation.
+        cached (int): The number of matchups taken from the cache or played before.
+    """
+
+    generation: int
+    best: DeckGenome
+    best_win_rate: float
+    mean_win_rate: float
+    simulated: int
+    cached: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "generation": self.generation,
+            "best": self.best.to_dict(),
+            "best_win_rate": self.best_win_rate,
+            "mean_win_rate": self.mean_win_rate,
+            "simulated": self.simulated,
+            "cached": self.cached,
+        }
+
+
+@dataclass
+class OptimizationResult:
+    """
+    Outcome of an optimization run.
+
+    Attributes:
+        best (DeckGenome): The best deck found, among the candidates that played max_games.
+        win_rate (float): Its average win rate against the field.
+        history (List[GenerationStats]): The summary of every generation.
+        seconds (float): The wall-clock time spent.
+    """
+
+    best: DeckGenome
+    win_rate: float
+    history: List[GenerationStats] = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def simulated(self) -> int:
+        """The number of matchups simulated over the run."""
+        return sum(stats.simulated for stats in self.history)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "best": self.best.to_dict(),
+            "win_rate": self.win_rate,
+            "simulated": self.simulated,
+            "seconds": self.seconds,
+            "history": [stats.to_dict() for stats in self.history],
+        }
+
+
+def _is_trainer(name: str) -> bool:
+    return hasattr(Item, name) or hasattr(Supporter, name)
+
+
+class DeckOptimizer:
+    """
+    Genetic algorithm over the decks of a card pool, see the module documentation.
+
+    Attributes:
+        card_pool (List[str]): The names of the cards, items and supporters decks are built of.
+        field (List[Deck]): The reference decks the candidates play against.
+        energy_pool (List[str]): The energy types decks can use.
+        deck_size (int): The number of cards of a deck.
+        max_copies (int): The most copies of a card in a deck.
+        max_energy_types (int): The most energy types of a deck.
+        population_size (int): The number of candidates per generation.
+        generations (int): The number of generations.
+        tournament_size (int): The number of candidates competing in a tournament selection.
+        crossover_rate (float): The probability that a child is bred from two parents.
+        mutation_rate (float): The probability that a card of a child is replaced.
+        elitism (int): The number of best candidates copied into the next generation.
+        min_games (int): The games per field deck on the first successive halving rung.
+        max_games (int): The games per field deck on the last rung.
+        eta (int): The successive halving factor: 1/eta of the candidates move up a rung,
+            and play eta times as many games.
+        seed (int): The seed of the optimizer's own random choices and of the games.
+        workers (int): The number of worker processes, os.cpu_count() uses every core.
+        cache (MatchupCache): Where matchups are looked up and stored, a new cache in memory
+            if none is given.
+        policy (Optional[Policy]): The policy of all players, None plays random actions.
+        max_turns (int): The turn after which a game is stopped without a winner.
+        paired (bool): Whether to play mirrored pairs of games, see play_many. With a fixed
+            seed, all candidates then face the same draws of the field.
+    """
+
+    def __init__(
+        self,
+        card_pool: Sequence[str],
+        field: Sequence[Deck],
+        energy_pool: Optional[Sequence[str]] = None,
+        deck_size: int = 20,
+        max_copies: int = 2,
+        max_energy_types: int = 3,
+        population_size: int = 32,
+        generations: int = 20,
+        tournament_size: int = 3,
+        crossover_rate: float = 0.9,
+        mutation_rate: float = 0.1,
+        elitism: int = 2,
+        min_games: int = 50,
+        max_games: int = 800,
+        eta: int = 2,
+        seed: int = 0,
+        workers: int = 1,
+        cache: Optional[MatchupCache] = None,
+        policy: Optional[Policy] = None,
+        max_turns: int = MAX_TURNS,
+        paired: bool = True,
+    ) -> None:
+        self.card_pool: List[str] = list(dict.fromkeys(card_pool))
+        self.field: List[Deck] = list(field)
+        self.basics: List[str] = [
+            name
+            for name in self.card_pool
+            if not _is_trainer(name) and find_card_by_name(name)["stage"] == 0
+        ]
+        if energy_pool is None:
+            energy_pool = sorted(
+                {
+                    find_card_by_name(name)["energy_type"].value
+                    for name in self.card_pool
+                    if not _is_trainer(name)
+                }
+                - {EnergyType.Colorless.value}
+            )
+        self.energy_pool: List[str] = list(energy_pool)
+
+        if not self.basics:
+            raise ValueError("The card pool needs a basic pokemon")
+        if not self.energy_pool:
+            raise ValueError("The energy pool is empty")
+        if not self.field:
+            raise ValueError("The field needs at least one deck")
+        if len(self.card_pool) * max_copies < deck_size:
+            raise ValueError(
+                f"{len(self.card_pool)} cards with {max_copies} copies each cannot fill a deck"
+                f" of {deck_size}"
+            )
+        if eta < 2 or min_games <= 0 or max_games < min_games:
+            raise ValueError("Successive halving needs eta >= 2 and 0 < min_games <= max_games")
+
+        self.deck_size: int = deck_size
+        self.max_copies: int = max_copies
+        self.max_energy_types: int = max_energy_types
+        self.population_size: int = population_size
+        self.generations: int = generations
+        self.tournament_size: int = tournament_size
+        self.crossover_rate: float = crossover_rate
+        self.mutation_rate: float = mutation_rate
+        self.elitism: int = elitism
+        self.min_games: int = min_games
+        self.max_games: int = max_games
+        self.eta: int = eta
+        self.seed: int = seed
+        self.workers: int = workers
+        self.cache: MatchupCache = cache if cache is not None else MatchupCache()
+        self.policy: Optional[Policy] = policy
+        self.max_turns: int = max_turns
+        self.paired: bool = paired
+        self.rng: random.Random = random.Random(seed)
+        self._decks: Dict[DeckGenome, Deck] = {}
+
+    # Variation
+
+    def random_genome(self) -> DeckGenome:
+        """A random legal deck with one energy type."""
+        slots = [name for name in self.card_pool for _ in range(self.max_copies)]
+        cards = self.rng.sample(slots, self.deck_size)
+        return self._repair(cards, [self.rng.choice(self.energy_pool)])
+
+    def crossover(self, parent_a: DeckGenome, parent_b: DeckGenome) -> DeckGenome:
+        """
+        A child dealt from the cards of both parents.
+
+        The cards of the parents are pooled, at most max_copies of each, and the child gets a
+        random deck_size of them. Its energy types are drawn from both parents' energy types.
+        """
+        counts = Counter(parent_a.cards) + Counter(parent_b.cards)
+        slots = [name for name, count in counts.items() for _ in range(min(count, self.max_copies))]
+        cards = self.rng.sample(slots, min(self.deck_size, len(slots)))
+
+        energies = sorted(set(parent_a.energy_types) | set(parent_b.energy_types))
+        size = len(self.rng.choice((parent_a, parent_b)).energy_types)
+        return self._repair(cards, self.rng.sample(energies, min(size, len(energies))))
+
+    def mutate(self, genome: DeckGenome) -> DeckGenome:
+        """
+        Replace every card with probability mutation_rate by another card of the pool, and
+        with the same probability add, drop or replace an energy type.
+        """
+        cards = list(genome.cards)
+        for index in range(len(cards)):
+            if self.rng.random() < self.mutation_rate:
+                cards[index] = self._random_card(cards, exclude=index)
+
+        energies = list(genome.energy_types)
+        if self.rng.random() < self.mutation_rate:
+            unused = [energy for energy in self.energy_pool if energy not in energies]
+            operation = self.rng.randrange(3)
+            if operation == 0 and unused and len(energies) < self.max_energy_types:
+                energies.append(self.rng.choice(unused))
+            elif operation == 1 and len(energies) > 1:
+                energies.remove(self.rng.choice(energies))
+            elif unused:
+                energies[self.rng.randrange(len(energies))] = self.rng.choice(unused)
+        return self._repair(cards, energies)
+
+    def _random_card(self, cards: List[str], exclude: Optional[int] = None) -> str:
+        """A card of the pool with fewer than max_copies in cards, not counting cards[exclude]."""
+        counts = Counter(card for index, card in enumerate(cards) if index != exclude)
+        allowed = [name for name in self.card_pool if counts[name] < self.max_copies]
+        return self.rng.choice(allowed)
+
+    def _repair(self, cards: List[str], energy_types: List[str]) -> DeckGenome:
+        """Make a deck legal: deck_size cards, at most max_copies each, at least one basic."""
+        counts: Counter = Counter()
+        legal = []
+        for name in cards:
+            if counts[name] < self.max_copies:
+                counts[name] += 1
+                legal.append(name)
+        while len(legal) < self.deck_size:
+            legal.append(self._random_card(legal))
+        legal = legal[: self.deck_size]
+
+        if not any(name in self.basics for name in legal):
+            basic = self.rng.choice(self.basics)
+            legal[self.rng.randrange(len(legal))] = basic
+        return DeckGenome.create(legal, energy_types or [self.rng.choice(self.energy_pool)])
+
+    def _tournament(
+        self, population: List[DeckGenome], fitness: Dict[DeckGenome, Fitness]
+    ) -> DeckGenome:
+        contestants = self.rng.sample(population, min(self.tournament_size, len(population)))
+        return max(contestants, key=lambda genome: fitness[genome][:2])
+
+    # Fitness
+
+    def _deck(self, genome: DeckGenome) -> Deck:
+        if genome not in self._decks:
+            self._decks[genome] = genome.to_deck()
+        return self._decks[genome]
+
+    def evaluate(
+        self, genomes: Sequence[DeckGenome]
+    ) -> Tuple[Dict[DeckGenome, Fitness], int, int]:
+        """
+        Evaluate the candidates with successive halving, see the module documentation.
+
+        Args:
+            genomes (Sequence[DeckGenome]): The candidates, duplicates are evaluated once.
+
+        Returns:
+            Tuple[Dict[DeckGenome, Fitness], int, int]: The fitness of every candidate, the
+                number of matchups simulated and the number taken from the cache.
+        """
+        survivors = list(dict.fromkeys(genomes))
+        fitness: Dict[DeckGenome, Fitness] = {}
+        simulated = cached = 0
+        games = self.min_games
+        rung = 0
+        while True:
+            pairs = [
+                (self._deck(genome), opponent) for genome in survivors for opponent in self.field
+            ]
+            outcomes = play_matchups(
+                pairs,
+                games,
+                seed=self.seed,
+                workers=self.workers,
+                cache=self.cache,
+                policy=self.policy,
+                max_turns=self.max_turns,
+                paired=self.paired,
+            )
+            for index, genome in enumerate(survivors):
+                records = outcomes[index * len(self.field) : (index + 1) * len(self.field)]
+                win_rate = sum(record.win_rate for record, _ in records) / len(records)
+                fitness[genome] = Fitness(rung, win_rate, games)
+            simulated += sum(1 for _, was_simulated in outcomes if was_simulated)
+            cached += sum(1 for _, was_simulated in outcomes if not was_simulated)
+
+            if games >= self.max_games:
+                return fitness, simulated, cached
+            survivors.sort(key=lambda genome: fitness[genome].win_rate, reverse=True)
+            survivors = survivors[: max(1, math.ceil(len(survivors) / self.eta))]
+            games = min(games * self.eta, self.max_games)
+            rung += 1
+
+    # Evolution
+
+    def run(
+        self, progress: Optional[Callable[[GenerationStats], None]] = None
+    ) -> OptimizationResult:
+        """
+        Evolve the population for the configured number of generations.
+
+        Args:
+            progress (Optional[Callable[[GenerationStats], None]]): Called after every
+                generation, e.g. to report or checkpoint.
+
+        Returns:
+            OptimizationResult: The best deck found and the history of the run.
+        """
+        start_time = time.perf_counter()
+        population = [self.random_genome() for _ in range(self.population_size)]
+        result: Optional[OptimizationResult] = None
+
+        for generation in range(self.generations):
+            fitness, simulated, cached = self.evaluate(population)
+            ranked = sorted(fitness, key=lambda genome: fitness[genome][:2], reverse=True)
+            best = ranked[0]
+            win_rates = [fitness[genome].win_rate for genome in population]
+            stats = GenerationStats(
+                generation=generation,
+                best=best,
+                best_win_rate=fitness[best].win_rate,
+                mean_win_rate=sum(win_rates) / len(win_rates),
+                simulated=simulated,
+                cached=cached,
+            )
+            if result is None:
+                result = OptimizationResult(best, fitness[best].win_rate)
+            elif fitness[best].win_rate > result.win_rate:
+                result.best, result.win_rate = best, fitness[best].win_rate
+            result.history.append(stats)
+            if progress is not None:
+                progress(stats)
+
+            if generation == self.generations - 1:
+                break
+            offspring = ranked[: self.elitism]
+            while len(offspring) < self.population_size:
+                parent = self._tournament(population, fitness)
+                if self.rng.random() < self.crossover_rate:
+                    parent = self.crossover(parent, self._tournament(population, fitness))
+                offspring.append(self.mutate(parent))
+            population = offspring
+
+        if result is None:
+            raise ValueError("The optimizer needs at least one generation")
+        result.seconds = time.perf_counter() - start_time
+        return result
@@ -1,8 +1,11 @@
-from typing import TYPE_CHECKING, List, Protocol
+from typing import TYPE_CHECKING, List, Optional, Protocol
 
-from .mechanics.condition import ConditionBase
+from .mechanics.condition import Condition
 
 if TYPE_CHECKING:
+    from .core.match import Match
+    from .core.player import Player
+    from .mechanics.action import Action
     from .mechanics.attack_common import EnergyType
 
 
@@ -12,7 +15,7 @@ class ICard(Protocol):
     max_hp: int
     name: str
 
-    def add_condition(self, condition: ConditionBase) -> None: ...
+    def add_condition(self, condition: Condition) -> None: ...
 
 
 class IPlayer(Protocol):
@@ -20,10 +23,14 @@ class IPlayer(Protocol):
     bench: List[ICard]
     opponent: "IPlayer"
 
-    def move_active_card_to_bench(self) -> None: ...
+    def move_active_card_to_bench(self, target: Optional[int] = None) -> None: ...
 
 
 class ISupporter(Protocol):
     name: str
 
     def card_able_to_use(self, card: ICard) -> bool: ...
+
+
+class IPlanner(Protocol):
+    def plan(self, match: "Match", player: "Player") -> List["Action"]: ...
@@ -0,0 +1,240 @@
+"""
+Sequential probability ratio test (SPRT) for bot regression testing.
+
+The new bot plays paired games against the old bot, both with the same deck, and after every
+round the log-likelihood ratio of H1 (the new bot is elo1 stronger) against H0 (it is elo0
+stronger) is updated. The test stops as soon as the ratio crosses one of the bounds given by the
+error rates alpha and beta, which usually takes far fewer games than a fixed-size test.
+
+The ratio is the generalized SPRT on the scores of the game pairs: a pair scores 0, 0.25, 0.5,
+0.75 or 1 for the new bot, and the normal approximation of the mean pair score gives
+
+    LLR = pairs * (s1 - s0) * (2 * mean - s0 - s1) / (2 * variance)
+
+with s0 and s1 the expected scores at elo0 and elo1. Pairing the games, with the seats swapped
+and common random numbers, removes the luck of the draw that both bots share.
+"""
+
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from .batch import BatchResult, DeckTemplate, chunk_ranges, play_chunks
+from .bots import Bot
+from .core.deck import Deck
+from .engine.playout import MAX_TURNS
+
+# The deck both bots play with unless another one is given
+DEMO_DECK = ["Ralts", "Kirlia", "Gardevoir", "Mewtwo EX", "Potion", "Potion"]
+DEMO_ENERGY_TYPES = ["psychic"]
+
+
+def elo_to_score(elo: float) -> float:
+    """The expected score of a player elo points stronger than its opponent."""
+    return 1.0 / (1.0 + 10 ** (-elo / 400))
+
+
+def score_to_elo(score: float) -> float:
+    """The elo difference of an expected score, infinite for a score of 0 or 1."""
+    if score <= 0.0:
+        return -math.inf
+    if score >= 1.0:
+        return math.inf
+    return -400 * math.log10(1 / score - 1)
+
+
+def sprt_bounds(alpha: float, beta: float) -> Tuple[float, float]:
+    """
+    The bounds of the log-likelihood ratio.
+
+    Args:
+        alpha (float): The probability of accepting H1 when H0 is true.
+        beta (float): The probability of accepting H0 when H1 is true.
+
+    Returns:
+        Tuple[float, float]: H0 is accepted below the lower bound, H1 above the upper bound.
+    """
+    return math.log(beta / (1 - alpha)), math.log((1 - beta) / alpha)
+
+
+def sprt_llr(result: BatchResult, elo0: float, elo1: float) -> float:
+    """
+    The log-likelihood ratio of H1 against H0 over the game pairs of a paired batch.
+
+    Args:
+        result (BatchResult): The paired batch, with the tested bot as deck A.
+        elo0 (float): The elo difference of H0.
+        elo1 (float): The elo difference of H1.
+
+    Returns:
+        float: The ratio, 0 while the pair scores have no variance.
+    """
+    scores = result.pair_scores
+    if scores.count < 2 or scores.variance <= 0:
+        return 0.0
+    s0 = elo_to_score(elo0)
+    s1 = elo_to_score(elo1)
+    return scores.count * (s1 - s0) * (2 * scores.mean - s0 - s1) / (2 * scores.variance)
+
+
+@dataclass
+class SPRTResult:
+    """
+    Outcome of an SPRT.
+
+    Attributes:
+        verdict (str): "H1" if the new bot is better by elo1, "H0" if it is not better than
+            elo0, "inconclusive" if the game budget ran out first.
+        llr (float): The final log-likelihood ratio.
+        bounds (Tuple[float, float]): The lower and upper bound of the ratio.
+        elo0 (float): The elo difference of H0.
+        elo1 (float): The elo difference of H1.
+        alpha (float): The probability of a false H1.
+        beta (float): The probability of a false H0.
+        old_bot (str): The specification of the old bot.
+        new_bot (str): The specification of the new bot.
+        seconds (float): The wall-clock time spent.
+        result (BatchResult): The games, with the new bot as deck A.
+    """
+
+    verdict: str
+    llr: float
+    bounds: Tuple[float, float]
+    elo0: float
+    elo1: float
+    alpha: float
+    beta: float
+    old_bot: str
+    new_bot: str
+    seconds: float
+    result: BatchResult
+
+    @property
+    def score(self) -> float:
+        """The new bot's mean pair score."""
+        return self.result.pair_scores.mean if self.result.pair_scores.count else 0.5
+
+    @property
+    def elo(self) -> float:
+        """The estimated elo difference of the new bot."""
+        return score_to_elo(self.score)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        elo = self.elo
+        return {
+            "verdict": self.verdict,
+            "llr": self.llr,
+            "bounds": list(self.bounds),
+            "games": self.result.games,
+            "pairs": self.result.pair_scores.count,
+            "score": self.score,
+            "elo": elo if math.isfinite(elo) else None,
+            "wins": list(self.result.wins),
+            "unfinished": self.result.unfinished,
+            "elo0": self.elo0,
+            "elo1": self.elo1,
+            "alpha": self.alpha,
+            "beta": self.beta,
+            "old_bot": self.old_bot,
+            "new_bot": self.new_bot,
+            "seed": self.result.seed,
+            "seconds": self.seconds,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"SPRTResult({self.verdict}, llr={self.llr:.2f} {list(self.bounds)},"
+            f" {self.result.games} games, score={self.score:.3f})"
+        )
+
+
+def sprt(
+    old_bot: Bot,
+    new_bot: Bot,
+    deck: Optional[Deck] = None,
+    elo0: float = 0.0,
+    elo1: float = 10.0,
+    alpha: float = 0.05,
+    beta: float = 0.05,
+    seed: int = 0,
+    workers: int = 1,
+    batch_size: int = 100,
+    max_games: int = 100_000,
+    max_turns: int = MAX_TURNS,
+) -> SPRTResult:
+    """
+    Test whether the new bot is stronger than the old bot, see the module documentation.
+
+    Args:
+        old_bot (Bot): The bot in use.
+        new_bot (Bot): The candidate.
+        deck (Optional[Deck]): The deck both bots play, None uses DEMO_DECK.
+        elo0 (float): The elo difference of H0, usually 0.
+        elo1 (float): The elo difference of H1, the smallest improvement worth detecting.
+        alpha (float): The probability of accepting H1 when H0 is true.
+        beta (float): The probability of accepting H0 when H1 is true.
+        seed (int): The seed of the games.
+        workers (int): The number of worker processes, 1 plays in this process.
+        batch_size (int): The number of games per worker and round, rounded up to pairs.
+        max_games (int): The most games played before giving up as inconclusive.
+        max_turns (int): The turn after which a game is stopped without a winner.
+
+    Returns:
+        SPRTResult: The verdict and the games it is based on.
+
+    Raises:
+        ValueError: If elo1 is not larger than elo0 or an error rate is not in (0, 1).
+    """
+    if elo1 <= elo0:
+        raise ValueError("elo1 must be larger than elo0")
+    if not (0 < alpha < 1 and 0 < beta < 1):
+        raise ValueError("alpha and beta must be between 0 and 1")
+
+    start_time = time.perf_counter()
+    if deck is None:
+        deck = Deck.from_names(DEMO_DECK, DEMO_ENERGY_TYPES)
+    template = DeckTemplate(deck)
+    bots = (new_bot, old_bot)
+    lower, upper = sprt_bounds(alpha, beta)
+    batch_size += batch_size % 2
+    round_size = batch_size * max(1, workers)
+
+    result = BatchResult(seed=seed)
+    llr = 0.0
+    verdict = "inconclusive"
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        while result.games < max_games:
+            stop = min(result.games + round_size, max_games)
+            chunks: List[Tuple[int, int]] = chunk_ranges(result.games, stop, batch_size, paired=True)
+            play_chunks(
+                pool, workers, template, template, seed, chunks, None, max_turns, True, bots, result
+            )
+
+            llr = sprt_llr(result, elo0, elo1)
+            if llr >= upper:
+                verdict = "H1"
+                break
+            if llr <= lower:
+                verdict = "H0"
+                break
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    return SPRTResult(
+        verdict=verdict,
+        llr=llr,
+        bounds=(lower, upper),
+        elo0=elo0,
+        elo1=elo1,
+        alpha=alpha,
+        beta=beta,
+        old_bot=str(old_bot),
+        new_bot=str(new_bot),
+        seconds=time.perf_counter() - start_time,
+        result=result,
+    )
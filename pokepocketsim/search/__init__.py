@@ -0,0 +1,27 @@
+"""
+Search algorithms for Pokemon Pocket Simulator bots.
+Planners look ahead from a game state and return the sequence of actions to play.
+"""
+
+from .evaluator import Evaluator, LeafBuffer, LinearEvaluator, extract_features
+from .expectimax import Expectimax, greedy_reply
+from .lethal import DamageEntry, DamageTable, find_lethal
+from .mcts import MCTS, determinize, rollout_policy
+from .transposition import TranspositionTable, state_key
+
+__all__ = [
+    "Evaluator",
+    "LeafBuffer",
+    "LinearEvaluator",
+    "extract_features",
+    "Expectimax",
+    "greedy_reply",
+    "DamageEntry",
+    "DamageTable",
+    "find_lethal",
+    "MCTS",
+    "determinize",
+    "rollout_policy",
+    "TranspositionTable",
+    "state_key",
+]
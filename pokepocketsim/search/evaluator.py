@@ -0,0 +1,175 @@
+"""
+Leaf evaluation for the planners.
+
+Leaves are reduced to a short feature row in one pass over the board, collected in a buffer
+and scored in batches. With numpy installed a batch is scored with a single matrix product,
+otherwise with plain Python.
+"""
+
+from operator import mul
+from typing import TYPE_CHECKING, Any, List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+
+if TYPE_CHECKING:
+    from ..core.player import Player
+
+# Names of the columns of a feature row, in order
+FEATURE_NAMES = (
+    "points",
+    "damage_dealt",
+    "evolved_cards",
+    "energy_in_play",
+    "cards_in_play",
+    "opponent_points",
+    "damage_taken",
+)
+
+# Weights of Player.evaluate_player. It truncates the damage term to an integer, so the scores
+# are equal while damage comes in multiples of 10, as all damage of the card database does
+DEFAULT_WEIGHTS = (25.0, 0.1, 5.0, 0.0, 0.0, 0.0, 0.0)
+
+FeatureRow = Tuple[float, ...]
+
+
+def extract_features(player: "Player") -> FeatureRow:
+    """
+    Reduce the player's position to a feature row, see FEATURE_NAMES.
+
+    Args:
+        player (Player): The player to describe.
+
+    Returns:
+        FeatureRow: One value per feature name.
+    """
+    evolved_cards = 0
+    energy_in_play = 0
+    cards_in_play = 0
+    damage_taken = 0
+
+    active_card = player.active_card
+    if active_card is not None:
+        cards_in_play = 1
+        damage_taken = active_card.max_hp - active_card.hp
+        energy_in_play = sum(active_card.energies.values())
+        if active_card.stage != 0:
+            evolved_cards = 1
+    for card in player.bench:
+        cards_in_play += 1
+        damage_taken += card.max_hp - card.hp
+        energy_in_play += sum(card.energies.values())
+        if card.stage != 0:
+            evolved_cards += 1
+
+    damage_dealt = 0
+    opponent_points = 0
+    opponent = player.opponent
+    if opponent is not None:
+        opponent_points = opponent.points
+        # Same as Player.get_damage_dealt_to_cards: nothing counts without an active card
+        if opponent.active_card is not None:
+            damage_dealt = opponent.active_card.max_hp - opponent.active_card.hp
+            for card in opponent.bench:
+                damage_dealt += card.max_hp - card.hp
+
+    return (
+        player.points,
+        damage_dealt,
+        evolved_cards,
+        energy_in_play,
+        cards_in_play,
+        opponent_points,
+        damage_taken,
+    )
+
+
+class Evaluator:
+    """
+    Base class for leaf evaluators.
+
+    Subclasses implement score_batch, single positions are scored through it unless a
+    subclass has a faster path.
+    """
+
+    def score_batch(self, rows: Sequence[FeatureRow]) -> List[float]:
+        """Score a batch of feature rows."""
+        raise NotImplementedError("Subclasses should implement this method")
+
+    def evaluate(self, player: "Player") -> float:
+        """Score a single position."""
+        return self.score_batch([extract_features(player)])[0]
+
+
+class LinearEvaluator(Evaluator):
+    """
+    Scores a position as a weighted sum of its features.
+
+    The default weights are the ones of Player.evaluate_player, without its truncation of the
+    damage term, see DEFAULT_WEIGHTS. Learned weights can be loaded by passing them in the order
+    of FEATURE_NAMES.
+
+    Attributes:
+        weights (Tuple[float, ...]): One weight per feature.
+        bias (float): Added to every score.
+    """
+
+    def __init__(self, weights: Sequence[float] = DEFAULT_WEIGHTS, bias: float = 0.0) -> None:
+        if len(weights) != len(FEATURE_NAMES):
+            raise ValueError(f"Expected {len(FEATURE_NAMES)} weights, got {len(weights)}")
+        self.weights: Tuple[float, ...] = tuple(float(w) for w in weights)
+        self.bias: float = float(bias)
+        self._weights_array: Any = np.asarray(self.weights) if np is not None else None
+
+    def score_batch(self, rows: Sequence[FeatureRow]) -> List[float]:
+        if not rows:
+            return []
+        if self._weights_array is not None:
+            scores = np.asarray(rows, dtype=float) @ self._weights_array + self.bias
+            return [float(score) for score in scores]
+
+        weights = self.weights
+        bias = self.bias
+        return [sum(map(mul, weights, row)) + bias for row in rows]
+
+    def evaluate(self, player: "Player") -> float:
+        return sum(map(mul, self.weights, extract_features(player))) + self.bias
+
+
+class LeafBuffer:
+    """
+    Collects leaves of a search and scores them in batches.
+
+    Attributes:
+        evaluator (Evaluator): The evaluator scoring the batches.
+        batch_size (int): The number of leaves after which the buffer reports itself full.
+    """
+
+    def __init__(self, evaluator: Evaluator, batch_size: int = 4096) -> None:
+        self.evaluator: Evaluator = evaluator
+        self.batch_size: int = batch_size
+        self._rows: List[FeatureRow] = []
+        self._payloads: List[Any] = []
+
+    @property
+    def full(self) -> bool:
+        return len(self._rows) >= self.batch_size
+
+    def add(self, player: "Player", payload: Any) -> None:
+        """Buffer the player's position together with a payload returned by flush."""
+        self._rows.append(extract_features(player))
+        self._payloads.append(payload)
+
+    def flush(self) -> List[Tuple[float, Any]]:
+        """Score the buffered leaves and empty the buffer."""
+        scores = self.evaluator.score_batch(self._rows)
+        scored = list(zip(scores, self._payloads))
+        self._rows = []
+        self._payloads = []
+        return scored
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
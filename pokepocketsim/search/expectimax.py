@@ -0,0 +1,201 @@
+"""
+Depth-limited expectimax search over whole turns.
+
+The planning player's turns are max nodes over the distinct end states of the turn, the
+opponent's turns are played by a fast reply model, and every turn after the one being planned
+starts with a chance node over the card drawn and the energy drawn, weighted by the deck.
+"""
+
+import copy
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple
+
+from ..core.match import MAX_SEARCH_DEPTH, Match
+from ..core.player import Player
+from ..mechanics.action import Action
+from ..mechanics.chance import CardDraw, EnergyDraw
+from .evaluator import Evaluator
+from .lethal import find_lethal
+from .transposition import TranspositionTable, state_key
+
+if TYPE_CHECKING:
+    import uuid
+
+# Score of a won game, larger than any evaluation of a running game
+WIN_SCORE = 1000
+
+# Plays the given player's turn and returns the match and player after it
+ReplyModel = Callable[[Match, Player], Tuple[Match, Player]]
+
+
+def greedy_reply(match: Match, player: Player, max_depth: int = 3) -> Tuple[Match, Player]:
+    """
+    Reply model playing the short sequence that maximizes the player's own evaluation.
+
+    Args:
+        match (Match): The match, with the player's turn already set up.
+        player (Player): The player to move.
+        max_depth (int): The longest sequence of actions considered.
+
+    Returns:
+        Tuple[Match, Player]: The match and the player after the turn.
+    """
+    best_evaluation = float("-inf")
+    best_state = (match, player)
+
+    for _, match_copy, player_copy in Match._iter_sequences(
+        match, player, [], depth=0, max_depth=max_depth, seen=set()
+    ):
+        evaluation = Player.evaluate_player(player_copy)
+        if evaluation > best_evaluation:
+            best_evaluation = evaluation
+            best_state = (match_copy, player_copy)
+
+    return best_state
+
+
+def start_turn_with_outcome(
+    match: Match, player: Player, draw_index: Optional[int], energy: str
+) -> None:
+    """
+    Start the player's turn with a known card draw and energy instead of random ones.
+
+    Args:
+        match (Match): The match to advance.
+        player (Player): The player whose turn starts.
+        draw_index (Optional[int]): Index of the drawn card in the deck, None for no draw.
+        energy (str): The energy drawn for the turn.
+    """
+    match.turn += 1
+    if not player.reset_turn_state(match):
+        return
+    if draw_index is not None:
+        CardDraw(player).resolve(draw_index)
+    EnergyDraw(player).resolve(energy)
+
+
+class Expectimax:
+    """
+    Multi-turn expectimax planner.
+
+    Attributes:
+        depth (int): The number of whole turns searched, including the turn being planned.
+            A depth of 1 plans a single turn against the relative evaluation.
+        sequence_depth (int): The longest action sequence considered in later turns.
+        beam_width (int): The number of best-looking end states of a turn that are searched
+            further, the rest are cut off by their static evaluation.
+        reply_model (ReplyModel): How the opponent plays its turns.
+        table (TranspositionTable): Memo of chance node values keyed by state.
+        evaluator (Optional[Evaluator]): Scores positions, None uses Player.evaluate_player.
+    """
+
+    def __init__(
+        self,
+        depth: int = 2,
+        sequence_depth: int = 4,
+        beam_width: int = 6,
+        reply_model: Optional[ReplyModel] = None,
+        table: Optional[TranspositionTable] = None,
+        evaluator: Optional[Evaluator] = None,
+    ) -> None:
+        self.depth: int = depth
+        self.sequence_depth: int = sequence_depth
+        self.beam_width: int = beam_width
+        self.reply_model: ReplyModel = reply_model if reply_model is not None else greedy_reply
+        self.table: TranspositionTable = table if table is not None else TranspositionTable()
+        self.evaluator: Optional[Evaluator] = evaluator
+        self._root_id: Optional["uuid.UUID"] = None
+
+    def plan(self, match: Match, player: Player) -> List[Action]:
+        """
+        Plan the rest of the player's current turn.
+
+        Args:
+            match (Match): The match in progress.
+            player (Player): The player to move, with its turn already set up.
+
+        Returns:
+            List[Action]: The sequence of actions with the highest expected value.
+        """
+        self._root_id = player.id
+        match_copy, player_copy = match._copy_for_simulation(player, setup_turn=False)
+
+        # A winning attack ends the game, no need to look further
+        lethal = find_lethal(player_copy)
+        if lethal is not None:
+            return lethal
+
+        outcomes = self._turn_outcomes(match_copy, player_copy, MAX_SEARCH_DEPTH)
+
+        best_value = float("-inf")
+        best_sequence: List[Action] = []
+        for sequence, end_match, end_player in outcomes:
+            value = self._after_turn(end_match, end_player, self.depth - 1)
+            if value > best_value:
+                best_value = value
+                best_sequence = sequence
+
+        return best_sequence
+
+    def evaluate(self, player: Player) -> float:
+        """Static evaluation from the planning player's point of view."""
+        score = self.evaluator.evaluate if self.evaluator is not None else Player.evaluate_player
+        me = player if player.id == self._root_id else player.opponent
+        if me is None or me.opponent is None:
+            return float(score(player))
+        return float(score(me) - score(me.opponent))
+
+    def _turn_outcomes(
+        self, match: Match, player: Player, max_depth: int
+    ) -> List[Tuple[List[Action], Match, Player]]:
+        """The distinct end states of the player's turn, best looking first, cut to the beam."""
+        outcomes = list(Match._iter_sequences(match, player, [], 0, max_depth, seen=set()))
+        if not outcomes:
+            return [([], match, player)]
+
+        outcomes.sort(key=lambda outcome: self.evaluate(outcome[2]), reverse=True)
+        return outcomes[: self.beam_width]
+
+    def _after_turn(self, match: Match, player: Player, turns_left: int) -> float:
+        """Value of the state right after the player finished its turn."""
+        if player.handle_knockout_points():
+            return WIN_SCORE if player.id == self._root_id else -WIN_SCORE
+        if turns_left <= 0 or player.opponent is None:
+            return self.evaluate(player)
+        return self._chance(match, player.opponent, turns_left)
+
+    def _chance(self, match: Match, player: Player, turns_left: int) -> float:
+        """Expected value over the card and the energy the player draws to start its turn."""
+        key = ("chance", turns_left, state_key(match, player))
+        cached = self.table.get(key)
+        if cached is not None:
+            return cached
+
+        draws: List[Tuple[Optional[int], float]] = []
+        draws.extend(CardDraw(player).outcomes())
+        if not draws:
+            draws.append((None, 1.0))
+
+        value = 0.0
+        for draw_index, draw_probability in draws:
+            for energy, energy_probability in EnergyDraw(player).outcomes():
+                match_copy, player_copy = copy.deepcopy((match, player))
+                start_turn_with_outcome(match_copy, player_copy, draw_index, energy)
+                value += draw_probability * energy_probability * self._turn(
+                    match_copy, player_copy, turns_left
+                )
+
+        self.table.store(key, value)
+        return value
+
+    def _turn(self, match: Match, player: Player, turns_left: int) -> float:
+        """Value of the player's turn: a max node for the planning player, a reply otherwise."""
+        if player.id != self._root_id:
+            end_match, end_player = self.reply_model(match, player)
+            return self._after_turn(end_match, end_player, turns_left - 1)
+
+        return max(
+            self._after_turn(end_match, end_player, turns_left - 1)
+            for _, end_match, end_player in self._turn_outcomes(
+                match, player, self.sequence_depth
+            )
+        )
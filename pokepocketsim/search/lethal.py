@@ -0,0 +1,227 @@
+"""
+Per-turn damage table and a fast lethal check before the turn search.
+
+The damage table lists, for every attack the player's active pokemon can make this turn, as it
+is or after evolving from the hand, the damage against every pokemon of the opponent. The damage
+comes from attack_damage, the function the attacks themselves deal damage with, so type
+effectiveness and the damage conditions (Plus10DamageDealed, Plus30DamageDealed,
+Minus20DamageReceived) are counted the same way. An entry also tells whether the attack is paid
+for this turn, with or without attaching the turn's energy, and whether playing Giovanni first
+adds damage.
+
+Before searching every sequence of the turn, the planners ask find_lethal for the cheapest line
+whose attack wins the game. Lines are tried from the fewest actions up and played on a copy of
+the player before they are returned, so a line is only returned when it really wins.
+"""
+
+import copy
+from typing import TYPE_CHECKING, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from ..core.card import Card
+from ..engine import execute_action, get_available_actions
+from ..mechanics.action import Action, ActionType
+from ..mechanics.attack import Attack, attack_damage
+from ..mechanics.condition import Condition
+from ..mechanics.supporter import Supporter
+
+if TYPE_CHECKING:
+    from ..core.player import Player
+
+# Points that win the game, see Player.handle_knockout_points
+WINNING_POINTS = 3
+
+
+class DamageEntry(NamedTuple):
+    """
+    One attack against one defender in the damage table.
+
+    Attributes:
+        attacker (str): The name of the attacking pokemon, after the evolution if any.
+        attack (str): The title of the attack.
+        defender (Card): The opponent's pokemon.
+        damage (int): The damage the attack deals to the defender.
+        evolution (Optional[Card]): The card in hand the active pokemon evolves into first.
+        supporter (bool): Whether Giovanni is played first.
+        attach (bool): Whether the turn's energy is attached to the attacker first.
+        reachable (bool): Whether the attacker has the energy for the attack this turn.
+        knockout (bool): Whether the damage knocks the defender out.
+        wins (bool): Whether knocking out the defender as the active pokemon wins the game.
+    """
+
+    attacker: str
+    attack: str
+    defender: Card
+    damage: int
+    evolution: Optional[Card]
+    supporter: bool
+    attach: bool
+    reachable: bool
+    knockout: bool
+    wins: bool
+
+    @property
+    def cost(self) -> int:
+        """The number of actions of the line, the attack included."""
+        return 1 + (self.evolution is not None) + self.supporter + self.attach
+
+
+class DamageTable:
+    """
+    Damage of the player's reachable attacks this turn, see the module documentation.
+
+    Attributes:
+        player (Player): The player whose turn it is.
+        entries (List[DamageEntry]): Every attack against every defender, a supporter or an
+            energy attachment only where it adds damage or pays for the attack.
+    """
+
+    def __init__(self, player: "Player") -> None:
+        self.player = player
+        self.entries: List[DamageEntry] = self._build(player)
+
+    @staticmethod
+    def _forms(player: "Player") -> List[Tuple[Card, Optional[Card]]]:
+        """The active pokemon and every form it can evolve into from the hand this turn."""
+        active = player.active_card
+        if active is None:
+            return []
+        forms: List[Tuple[Card, Optional[Card]]] = [(active, None)]
+        if active.can_evolve:
+            forms.extend(
+                (card, card)
+                for card in player.hand
+                if isinstance(card, Card) and card.evolves_from == active.name
+            )
+        return forms
+
+    @staticmethod
+    def _build(player: "Player") -> List[DamageEntry]:
+        active = player.active_card
+        opponent = player.opponent
+        if active is None or opponent is None:
+            return []
+
+        can_attach = not player.has_added_energy and player.current_energy is not None
+        with_energy: Dict[str, int] = dict(active.energies)
+        if can_attach:
+            energy = str(player.current_energy)
+            with_energy[energy] = with_energy.get(energy, 0) + 1
+        can_boost = not player.has_used_trainer and any(
+            isinstance(card, Supporter.Giovanni) for card in player.hand
+        )
+        boosted = active.conditions | Condition.Plus10DamageDealed
+        events = (player.events, opponent.events)
+
+        entries = []
+        for form, evolution in DamageTable._forms(player):
+            for attack in form.attacks:
+                paid = Attack.energy_paid(active.energies, attack)
+                attach = not paid and can_attach and Attack.energy_paid(with_energy, attack)
+                for defender in opponent.active_card_and_bench:
+                    base = attack.get("fixed_damage", 0)
+                    damage = attack_damage(base, form, defender, events=events)
+                    supporter = False
+                    if can_boost:
+                        boosted_damage = attack_damage(base, form, defender, boosted, events)
+                        supporter = boosted_damage > damage
+                        damage = max(damage, boosted_damage)
+                    knockout = damage > 0 and defender.hp <= damage
+                    points = player.points + (2 if defender.is_ex else 1)
+                    entries.append(
+                        DamageEntry(
+                            form.name,
+                            attack.get("title", ""),
+                            defender,
+                            damage,
+                            evolution,
+                            supporter,
+                            attach,
+                            paid or attach,
+                            knockout,
+                            knockout and (points >= WINNING_POINTS or not opponent.bench),
+                        )
+                    )
+        return entries
+
+    def against(self, defender: Card) -> List[DamageEntry]:
+        """The reachable entries against the defender, the most damage first."""
+        return sorted(
+            (e for e in self.entries if e.reachable and e.defender is defender),
+            key=lambda entry: (-entry.damage, entry.cost),
+        )
+
+    def knockouts(self) -> List[DamageEntry]:
+        """The reachable entries knocking out the opponent's active pokemon, cheapest first."""
+        opponent = self.player.opponent
+        if opponent is None or opponent.active_card is None:
+            return []
+        return sorted(
+            (entry for entry in self.against(opponent.active_card) if entry.knockout),
+            key=lambda entry: entry.cost,
+        )
+
+    def lethal(self) -> List[DamageEntry]:
+        """The reachable entries winning the game this turn, cheapest first."""
+        return [entry for entry in self.knockouts() if entry.wins]
+
+
+def _step(player: "Player", matches: Callable[[Action], bool]) -> Optional[Action]:
+    """Play the first available action the predicate accepts, None if there is none."""
+    for action in get_available_actions(player):
+        if matches(action):
+            execute_action(player, action)
+            return action
+    return None
+
+
+def _play_line(player: "Player", entry: DamageEntry) -> Optional[List[Action]]:
+    """Play the entry's line on a copy of the player, the actions if the attack wins."""
+    player_copy = copy.deepcopy(player)
+    player_copy.print_actions = False
+    active = player_copy.active_card
+    opponent = player_copy.opponent
+    if active is None or opponent is None:
+        return None
+
+    steps: List[Callable[[Action], bool]] = []
+    if entry.evolution is not None:
+        evolve = f"Evolve {active.name} to {entry.evolution.name}"
+        steps.append(lambda a: a.action_type == ActionType.EVOLVE and a.name == evolve)
+    if entry.supporter:
+        steps.append(lambda a: a.item_class is Supporter.Giovanni)
+    if entry.attach:
+        attach = f"Add {player_copy.current_energy} energy to {active.name}"
+        steps.append(lambda a: a.action_type == ActionType.ADD_ENERGY and a.name == attach)
+    attack = f"{entry.attacker} use {entry.attack}"
+    steps.append(lambda a: a.action_type == ActionType.ATTACK and a.name == attack)
+
+    line: List[Action] = []
+    for matches in steps:
+        action = _step(player_copy, matches)
+        if action is None:
+            return None
+        line.append(action)
+
+    if player_copy.handle_knockout_points() or (
+        opponent.active_card is None and not opponent.bench
+    ):
+        return line
+    return None
+
+
+def find_lethal(player: "Player") -> Optional[List[Action]]:
+    """
+    The cheapest line of the player's turn that wins the game with an attack.
+
+    Args:
+        player (Player): The player to move, with its turn already set up. It is not changed.
+
+    Returns:
+        Optional[List[Action]]: The actions of the line, the attack last, or None if no
+            reachable attack wins this turn.
+    """
+    for entry in DamageTable(player).lethal():
+        line = _play_line(player, entry)
+        if line is not None:
+            return line
+    return None
@@ -0,0 +1,231 @@
+"""
+Monte Carlo tree search over the actions of a turn.
+
+The tree is built over action names, so the same node is reached by equivalent actions in
+different samples of the hidden information. Every iteration plays on a determinization: the
+opponent's hand and deck are dealt again from the cards it could be holding, and the planning
+player's own deck is shuffled, since only the size of the hand and the cards in play are public.
+Leaves are valued with a fast rollout over the following turns.
+"""
+
+import copy
+import math
+import random
+import time
+from typing import Dict, List, Optional
+
+from ..core.match import Match
+from ..core.player import Player
+from ..engine import get_available_actions, play_action, play_actions, play_turn
+from ..mechanics.action import Action, ActionType
+from .evaluator import Evaluator
+from .lethal import find_lethal
+
+# Scale of the evaluation difference mapped to a win probability at the rollout horizon
+EVALUATION_SCALE = 25.0
+
+
+def determinize(player: Player, rng: random.Random) -> None:
+    """
+    Sample the information hidden from the player, consistent with what it can see.
+
+    The opponent keeps the number of cards in its hand, the cards are dealt again from its
+    hand and deck together. The player's own deck is shuffled.
+
+    Args:
+        player (Player): The player whose point of view is kept, mutated in place.
+        rng (random.Random): The random number generator to sample with.
+    """
+    rng.shuffle(player.deck.cards)
+
+    opponent = player.opponent
+    if opponent is None:
+        return
+    unseen = opponent.hand + opponent.deck.cards
+    rng.shuffle(unseen)
+    hand_size = len(opponent.hand)
+    opponent.hand = unseen[:hand_size]
+    opponent.deck.cards = unseen[hand_size:]
+
+
+def rollout_policy(actions: List[Action], rng: random.Random) -> Action:
+    """
+    Light-weight policy used in rollouts: attack when possible, otherwise a random action.
+
+    Args:
+        actions (List[Action]): The legal actions, not empty.
+        rng (random.Random): The random number generator to choose with.
+
+    Returns:
+        Action: The chosen action.
+    """
+    for action in actions:
+        if action.action_type == ActionType.ATTACK:
+            return action
+    return actions[rng.randrange(len(actions))]
+
+
+class _Node:
+    """A node of the search tree, reached by playing the action named by its key."""
+
+    __slots__ = ("action", "children", "visits", "value", "ends_turn")
+
+    def __init__(self, action: Optional[Action] = None, ends_turn: bool = False) -> None:
+        self.action: Optional[Action] = action
+        self.children: Dict[str, "_Node"] = {}
+        self.visits: int = 0
+        self.value: float = 0.0
+        self.ends_turn: bool = ends_turn
+
+    def uct(self, parent_visits: int, exploration: float) -> float:
+        return self.value / self.visits + exploration * math.sqrt(
+            math.log(parent_visits) / self.visits
+        )
+
+
+class MCTS:
+    """
+    Monte Carlo tree search planner (UCT) with determinized hidden information.
+
+    Use it as a player mode with ``Player(name, deck, planner=MCTS(...))``.
+
+    Attributes:
+        iterations (int): The maximum number of iterations per plan.
+        think_ms (Optional[int]): Wall-clock budget per plan in milliseconds, None to only
+            stop after the iterations.
+        exploration (float): The UCT exploration constant.
+        rollout_turns (int): The number of turns played by a rollout after the planned one,
+            before the position is scored.
+        evaluator (Optional[Evaluator]): Scores positions at the rollout horizon, None uses
+            Player.evaluate_player.
+        rng (random.Random): The random number generator of the determinizations and rollouts.
+    """
+
+    def __init__(
+        self,
+        iterations: int = 200,
+        think_ms: Optional[int] = None,
+        exploration: float = 1.4,
+        rollout_turns: int = 6,
+        evaluator: Optional[Evaluator] = None,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.iterations: int = iterations
+        self.think_ms: Optional[int] = think_ms
+        self.exploration: float = exploration
+        self.rollout_turns: int = rollout_turns
+        self.evaluator: Optional[Evaluator] = evaluator
+        self.rng: random.Random = random.Random(seed)
+
+    def plan(self, match: Match, player: Player) -> List[Action]:
+        """
+        Plan the rest of the player's current turn.
+
+        Args:
+            match (Match): The match in progress.
+            player (Player): The player to move, with its turn already set up.
+
+        Returns:
+            List[Action]: The most visited line of the search tree.
+        """
+        root_match, root_player = match._copy_for_simulation(player, setup_turn=False)
+
+        # A winning attack ends the game, no need to look further
+        lethal = find_lethal(root_player)
+        if lethal is not None:
+            return lethal
+
+        root = _Node()
+
+        deadline = None
+        if self.think_ms is not None:
+            deadline = time.perf_counter() + self.think_ms / 1000
+
+        for _ in range(self.iterations):
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            match_copy, player_copy = copy.deepcopy((root_match, root_player))
+            determinize(player_copy, self.rng)
+            self._iterate(root, match_copy, player_copy)
+
+        # Follow the most visited children until the turn ends or the tree does
+        plan: List[Action] = []
+        node = root
+        while node.children:
+            node = max(node.children.values(), key=lambda child: child.visits)
+            if node.action is not None:
+                plan.append(node.action)
+            if node.ends_turn:
+                break
+        return plan
+
+    def _iterate(self, root: _Node, match: Match, player: Player) -> None:
+        """Select and expand a line of the turn, roll it out and back up the result."""
+        path = [root]
+        node = root
+
+        # Selection and expansion, over the actions legal in this determinization
+        while not node.ends_turn:
+            actions = get_available_actions(player)
+            if not actions:
+                break
+
+            legal: Dict[str, Action] = {}
+            for action in actions:
+                legal.setdefault(action.name, action)
+            unexpanded = [name for name in legal if name not in node.children]
+
+            if unexpanded:
+                action = legal[unexpanded[self.rng.randrange(len(unexpanded))]]
+                child = _Node(action, ends_turn=not play_action(match, player, action))
+                node.children[action.name] = child
+                path.append(child)
+                node = child
+                break
+
+            parent_visits = node.visits
+            children = node.children
+            name = max(
+                legal, key=lambda name: children[name].uct(parent_visits, self.exploration)
+            )
+            play_action(match, player, legal[name])
+            node = children[name]
+            path.append(node)
+
+        value = self._rollout(match, player, finish_turn=not node.ends_turn)
+
+        for visited in path:
+            visited.visits += 1
+            visited.value += value
+
+    def _rollout(self, match: Match, player: Player, finish_turn: bool) -> float:
+        """
+        Play on from the middle of the player's turn and score the result.
+
+        Returns:
+            float: 1 for a win of the planning player, 0 for a loss, the win probability
+                estimated from the evaluation otherwise.
+        """
+        if finish_turn:
+            play_actions(match, player, rollout_policy, self.rng)
+        if player.handle_knockout_points():
+            return 1.0
+
+        current = player.opponent
+        for _ in range(self.rollout_turns):
+            if current is None:
+                break
+            if not play_turn(match, current, rollout_policy, self.rng):
+                # The player to move had no pokemon left
+                return 0.0 if current is player else 1.0
+            if current.handle_knockout_points():
+                return 1.0 if current is player else 0.0
+            current = current.opponent
+
+        score = self.evaluator.evaluate if self.evaluator is not None else Player.evaluate_player
+        difference = score(player) - (score(player.opponent) if player.opponent else 0)
+        return 1.0 / (1.0 + math.exp(-difference / EVALUATION_SCALE))
+
+    def __repr__(self) -> str:
+        return f"MCTS(iterations={self.iterations}, think_ms={self.think_ms})"
+
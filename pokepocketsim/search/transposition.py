@@ -0,0 +1,94 @@
+"""
+State keys and a transposition table for the search algorithms.
+
+Two game states with the same key play out the same way, no matter in which order the actions
+that led to them were taken.
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Optional, Tuple
+
+from ..core.card import Card
+from ..core.deck import card_name
+
+if TYPE_CHECKING:
+    from ..core.match import Match
+    from ..core.player import Player
+
+
+def card_key(card: Card) -> Tuple[Any, ...]:
+    """Key of a card in play: everything about it that affects the rest of the game."""
+    return (
+        card.name,
+        card.hp,
+        tuple(sorted((energy, count) for energy, count in card.energies.items() if count > 0)),
+        int(card.conditions),
+        card.can_evolve,
+        card.has_used_ability,
+    )
+
+
+def player_key(player: "Player") -> Tuple[Any, ...]:
+    """
+    Key of a player's side of the board.
+
+    The hand and the deck are keyed as multisets of card names, the search treats the deck
+    as shuffled so its order does not matter.
+    """
+    return (
+        player.points,
+        card_key(player.active_card) if player.active_card is not None else None,
+        tuple(sorted(card_key(card) for card in player.bench)),
+        tuple(sorted(card_name(card) for card in player.hand)),
+        tuple(sorted(card_name(card) for card in player.deck.cards)),
+        player.current_energy,
+        player.has_added_energy,
+        player.has_used_trainer,
+    )
+
+
+def state_key(match: "Match", player: "Player") -> Tuple[Any, ...]:
+    """Key of the whole game state, seen from the given player."""
+    opponent = player_key(player.opponent) if player.opponent is not None else None
+    return (match.turn, player_key(player), opponent)
+
+
+class TranspositionTable:
+    """
+    A bounded memo of search results keyed by state keys.
+
+    When the table is full it is cleared, which keeps memory bounded without any bookkeeping
+    on the hot path.
+
+    Attributes:
+        max_entries (int): The number of entries stored before the table is cleared.
+        hits (int): The number of successful lookups.
+        misses (int): The number of failed lookups.
+    """
+
+    def __init__(self, max_entries: int = 100_000) -> None:
+        self.max_entries: int = max_entries
+        self.entries: Dict[Hashable, float] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def get(self, key: Hashable) -> Optional[float]:
+        value = self.entries.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def store(self, key: Hashable, value: float) -> None:
+        if len(self.entries) >= self.max_entries:
+            self.entries.clear()
+        self.entries[key] = value
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __repr__(self) -> str:
+        return (
+            f"TranspositionTable({len(self.entries)} entries, "
+            f"{self.hits} hits, {self.misses} misses)"
+        )
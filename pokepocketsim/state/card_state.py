@@ -6,6 +6,8 @@ Pure data class for easy serialization and deserialization.
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
+from ..mechanics.condition import condition_names
+
 
 @dataclass
 class CardState:
@@ -56,7 +58,7 @@ class CardState:
             ability=card.ability.__class__.__name__ if card.ability else None,
             has_used_ability=card.has_used_ability,
             can_evolve=card.can_evolve,
-            conditions=[c.__class__.__name__ for c in card.conditions],
+            conditions=condition_names(card.conditions),
             damage_modifier=getattr(card, "damage_modifier", 0),
         )
 
@@ -0,0 +1,269 @@
+"""
+Online statistics for simulation batches.
+
+Every statistic here takes one observation at a time, uses memory independent of the number of
+observations and can be merged with the same statistic computed elsewhere, e.g. by another
+worker process, giving the same result as if all observations had been added to one of them.
+"""
+
+import math
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Two-sided 95% normal quantile
+Z_95 = 1.959963984540054
+
+
+def wilson_interval(successes: float, trials: float, z: float = Z_95) -> Tuple[float, float]:
+    """
+    Wilson score interval of a success probability.
+
+    Unlike the normal approximation it stays inside [0, 1] and works for rates close to 0 or 1.
+
+    Args:
+        successes (float): The number of successes, draws may count as half a success.
+        trials (float): The number of trials.
+        z (float): The normal quantile of the confidence level, 1.96 for 95%.
+
+    Returns:
+        Tuple[float, float]: The lower and upper bound, (0, 1) without trials.
+    """
+    if trials <= 0:
+        return 0.0, 1.0
+    p = successes / trials
+    z2 = z * z
+    denominator = 1 + z2 / trials
+    center = (p + z2 / (2 * trials)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / trials + z2 / (4 * trials * trials)) / denominator
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+class RunningStats:
+    """
+    Count, mean, variance, minimum and maximum with Welford's algorithm.
+
+    Attributes:
+        count (int): The number of observations.
+        mean (float): The mean of the observations.
+        m2 (float): The sum of squared differences from the mean.
+        minimum (Optional[float]): The smallest observation.
+        maximum (Optional[float]): The largest observation.
+    """
+
+    def __init__(self) -> None:
+        self.count: int = 0
+        self.mean: float = 0.0
+        self.m2: float = 0.0
+        self.minimum: Optional[float] = None
+        self.maximum: Optional[float] = None
+
+    def add(self, value: float) -> None:
+        """Add one observation."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+
+    def merge(self, other: "RunningStats") -> None:
+        """Add the observations summarized by another instance (Chan et al.)."""
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.minimum, self.maximum = other.minimum, other.maximum
+            return
+
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.minimum = min(self.minimum, other.minimum)  # type: ignore[type-var]
+        self.maximum = max(self.maximum, other.maximum)  # type: ignore[type-var]
+
+    @property
+    def variance(self) -> float:
+        """The sample variance, 0 for fewer than two observations."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stddev(self) -> float:
+        return math.sqrt(self.variance)
+
+    @property
+    def stderr(self) -> float:
+        """The standard error of the mean."""
+        return math.sqrt(self.variance / self.count) if self.count > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "stddev": self.stddev,
+            "min": self.minimum,
+            "max": self.maximum,
+        }
+
+    def __repr__(self) -> str:
+        return f"RunningStats(count={self.count}, mean={self.mean:.3f}, stddev={self.stddev:.3f})"
+
+
+class Histogram:
+    """
+    Histogram with fixed, equally wide bins over [low, high).
+
+    Values below low and from high on are counted in an underflow and an overflow bin.
+
+    Attributes:
+        low (float): The lower bound of the first bin.
+        high (float): The upper bound of the last bin.
+        counts (List[int]): The counts of the bins.
+        underflow (int): The number of values below low.
+        overflow (int): The number of values from high on.
+    """
+
+    def __init__(self, low: float, high: float, bins: int) -> None:
+        if bins <= 0 or high <= low:
+            raise ValueError("A histogram needs at least one bin and high > low")
+        self.low: float = low
+        self.high: float = high
+        self.counts: List[int] = [0] * bins
+        self.underflow: int = 0
+        self.overflow: int = 0
+        self._width: float = (high - low) / bins
+
+    def add(self, value: float, count: int = 1) -> None:
+        """Add a value, count times."""
+        if value < self.low:
+            self.underflow += count
+        elif value >= self.high:
+            self.overflow += count
+        else:
+            self.counts[int((value - self.low) / self._width)] += count
+
+    def merge(self, other: "Histogram") -> None:
+        """Add the counts of another histogram with the same bins."""
+        if (other.low, other.high, len(other.counts)) != (self.low, self.high, len(self.counts)):
+            raise ValueError("Only histograms with the same bins can be merged")
+        for i, count in enumerate(other.counts):
+            self.counts[i] += count
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts) + self.underflow + self.overflow
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Histogram):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def bin_edges(self) -> List[float]:
+        """The edges of the bins, one more than there are bins."""
+        return [self.low + i * self._width for i in range(len(self.counts) + 1)]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "low": self.low,
+            "high": self.high,
+            "counts": list(self.counts),
+            "underflow": self.underflow,
+            "overflow": self.overflow,
+        }
+
+
+class WinRate:
+    """
+    Wins, losses and draws of one side, with a Wilson interval of its win rate.
+
+    Draws count as half a win.
+
+    Attributes:
+        wins (int): The games won.
+        losses (int): The games lost.
+        draws (int): The games without a winner.
+    """
+
+    def __init__(self) -> None:
+        self.wins: int = 0
+        self.losses: int = 0
+        self.draws: int = 0
+
+    def add(self, won: Optional[bool]) -> None:
+        """Add a game: True for a win, False for a loss, None for a draw."""
+        if won is None:
+            self.draws += 1
+        elif won:
+            self.wins += 1
+        else:
+            self.losses += 1
+
+    def merge(self, other: "WinRate") -> None:
+        self.wins += other.wins
+        self.losses += other.losses
+        self.draws += other.draws
+
+    @property
+    def games(self) -> int:
+        return self.wins + self.losses + self.draws
+
+    @property
+    def rate(self) -> float:
+        """The win rate, 0.5 without games."""
+        if self.games == 0:
+            return 0.5
+        return (self.wins + 0.5 * self.draws) / self.games
+
+    def interval(self, z: float = Z_95) -> Tuple[float, float]:
+        """The Wilson interval of the win rate, see wilson_interval."""
+        return wilson_interval(self.wins + 0.5 * self.draws, self.games, z)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        low, high = self.interval()
+        return {
+            "wins": self.wins,
+            "losses": self.losses,
+            "draws": self.draws,
+            "rate": self.rate,
+            "interval": [low, high],
+        }
+
+    def __repr__(self) -> str:
+        low, high = self.interval()
+        return f"WinRate({self.rate:.3f} [{low:.3f}, {high:.3f}] over {self.games} games)"
+
+
+class CardCounter:
+    """
+    Counts of events per card name, e.g. how often a card was in play at the end of a game.
+
+    The memory use is bounded by the number of distinct cards.
+
+    Attributes:
+        counts (Counter): The count of every card name.
+    """
+
+    def __init__(self) -> None:
+        self.counts: Counter = Counter()
+
+    def add(self, names: Iterable[str]) -> None:
+        """Count every name once per occurrence."""
+        self.counts.update(names)
+
+    def merge(self, other: "CardCounter") -> None:
+        self.counts.update(other.counts)
+
+    def most_common(self, n: Optional[int] = None) -> List[Tuple[str, int]]:
+        return self.counts.most_common(n)
+
+    def to_dict(self) -> Dict[str, int]:
+        """Convert to dictionary for JSON serialization."""
+        return dict(self.counts)
@@ -3,6 +3,7 @@ Command-line interface for Pokemon Pocket Simulator.
 """
 
 import argparse
+import json
 import sys
 from typing import Optional
 
@@ -24,6 +25,50 @@ def main(argv: Optional[list] = None) -> int:
     )
     play_parser.add_argument("--deck", help="Deck configuration (not yet implemented)")
 
+    # SPRT command
+    sprt_parser = subparsers.add_parser(
+        "sprt",
+        help="Test whether a new bot is stronger than an old bot",
+        description=(
+            "Play paired games between two bots until a sequential probability ratio test "
+            "decides, and print the verdict as JSON. Bots are given as kind[:key=value,...], "
+            "e.g. random, planner:think_ms=20 or mcts:iterations=100. "
+            "Exits with 0 for H1 (the new bot is better), 1 for H0 and 2 if inconclusive."
+        ),
+    )
+    sprt_parser.add_argument("old_bot", help="The bot in use")
+    sprt_parser.add_argument("new_bot", help="The candidate bot")
+    sprt_parser.add_argument("--elo0", type=float, default=0.0, help="Elo of H0 (default: 0)")
+    sprt_parser.add_argument("--elo1", type=float, default=10.0, help="Elo of H1 (default: 10)")
+    sprt_parser.add_argument("--alpha", type=float, default=0.05, help="False H1 rate")
+    sprt_parser.add_argument("--beta", type=float, default=0.05, help="False H0 rate")
+    sprt_parser.add_argument("--seed", type=int, default=0, help="Seed of the games")
+    sprt_parser.add_argument("--workers", type=int, default=1, help="Worker processes")
+    sprt_parser.add_argument("--batch-size", type=int, default=100, help="Games per round")
+    sprt_parser.add_argument("--max-games", type=int, default=100_000, help="Game budget")
+
+    # Ladder command
+    ladder_parser = subparsers.add_parser(
+        "ladder",
+        help="Rate bots on a ladder",
+        description=(
+            "Play the most informative matches between the bots of a ladder, update their "
+            "ratings and print the standings. The ladder is created if the file does not exist."
+        ),
+    )
+    ladder_parser.add_argument("path", help="The JSON file of the ladder")
+    ladder_parser.add_argument(
+        "--add",
+        action="append",
+        default=[],
+        metavar="NAME=BOT",
+        help="Put a bot on the ladder, e.g. greedy=planner (repeatable)",
+    )
+    ladder_parser.add_argument("--rounds", type=int, default=10, help="Rounds of matches")
+    ladder_parser.add_argument("--workers", type=int, default=1, help="Worker processes")
+    ladder_parser.add_argument("--games", type=int, default=20, help="Games per match")
+    ladder_parser.add_argument("--json", action="store_true", help="Print the ladder as JSON")
+
     # Version command
     version_parser = subparsers.add_parser("version", help="Show version")
 
@@ -33,6 +78,12 @@ def main(argv: Optional[list] = None) -> int:
         print("poke-pocket-sim version 0.2.0")
         return 0
 
+    elif args.command == "sprt":
+        return run_sprt(args)
+
+    elif args.command == "ladder":
+        return run_ladder(args)
+
     elif args.command == "play":
         print(f"Starting game in {args.mode} mode...")
         print("Note: Use 'python3 demo_tui.py' for now")
@@ -44,5 +95,61 @@ def main(argv: Optional[list] = None) -> int:
         return 0
 
 
+def run_sprt(args: argparse.Namespace) -> int:
+    """Run the sprt command and return its exit code."""
+    from ..bots import parse_bot
+    from ..regression import sprt
+
+    try:
+        old_bot = parse_bot(args.old_bot)
+        new_bot = parse_bot(args.new_bot)
+    except ValueError as error:
+        print(f"poke-sim sprt: {error}", file=sys.stderr)
+        return 2
+
+    result = sprt(
+        old_bot,
+        new_bot,
+        elo0=args.elo0,
+        elo1=args.elo1,
+        alpha=args.alpha,
+        beta=args.beta,
+        seed=args.seed,
+        workers=args.workers,
+        batch_size=args.batch_size,
+        max_games=args.max_games,
+    )
+    print(json.dumps(result.to_dict(), indent=2))
+    return {"H1": 0, "H0": 1}.get(result.verdict, 2)
+
+
+def run_ladder(args: argparse.Namespace) -> int:
+    """Run the ladder command and return its exit code."""
+    from pathlib import Path
+
+    from ..ladder import Ladder
+
+    if Path(args.path).exists():
+        ladder = Ladder.load(args.path)
+    else:
+        ladder = Ladder(args.path, games_per_match=args.games)
+
+    try:
+        for addition in args.add:
+            name, separator, bot = addition.partition("=")
+            if not separator:
+                raise ValueError(f"Expected NAME=BOT, got {addition!r}")
+            ladder.add(name, bot)
+        if len(ladder.entries) >= 2 and args.rounds > 0:
+            ladder.run(rounds=args.rounds, workers=args.workers)
+    except ValueError as error:
+        print(f"poke-sim ladder: {error}", file=sys.stderr)
+        return 2
+
+    ladder.save()
+    print(json.dumps(ladder.to_dict(), indent=2) if args.json else ladder.report())
+    return 0
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -0,0 +1,43 @@
+from typing import Callable, Optional, Sequence
+
+import pytest
+
+from pokepocketsim import Card, Deck, Item
+
+# The pokemon of the test deck, one of each
+DECK_NAMES = ("Ralts", "Kirlia", "Gardevoir", "Mewtwo EX")
+
+DeckFactory = Callable[..., Deck]
+
+
+def build_deck(
+    names: Optional[Sequence[str]] = None,
+    energy_types: Sequence[str] = ("psychic",),
+    potions: int = 0,
+) -> Deck:
+    """
+    Build a fresh test deck.
+
+    Args:
+        names (Optional[Sequence[str]]): The names of the cards, see Deck.from_names. None builds
+            one of each of DECK_NAMES.
+        energy_types (Sequence[str]): The energy types of the deck.
+        potions (int): The number of Potions added to the DECK_NAMES deck.
+
+    Returns:
+        Deck: The new deck.
+    """
+    if names is not None:
+        return Deck.from_names(list(names), list(energy_types))
+    deck = Deck(energy_types=list(energy_types))
+    for name in DECK_NAMES:
+        deck.add(Card.create_card(name))
+    for _ in range(potions):
+        deck.add(Item.Potion)
+    return deck
+
+
+@pytest.fixture
+def create_deck() -> DeckFactory:
+    """The factory of fresh test decks, see build_deck."""
+    return build_deck
@@ -0,0 +1,147 @@
+import pytest
+
+from pokepocketsim import (
+    Deck,
+    compare_candidates,
+    estimate_winrate,
+    play_many,
+    replay_game,
+)
+from pokepocketsim.batch import DeckTemplate, new_match
+from pokepocketsim.stats import Histogram
+from pokepocketsim.utils import config
+
+
+class TestBatch:
+    """
+    TestBatch:
+        Verifies the batch runner playing many games between two decks.
+
+        Test Methods:
+            - test_play_many_aggregates_results: Totals of a batch add up
+            - test_play_many_is_reproducible: Same seed, same results, with or without workers
+            - test_replay_game: A single game of a batch can be played again
+            - test_estimate_winrate_stops_early: The estimate stops once precise or decided
+            - test_paired_games_share_random_streams: Mirrored games replay the same draws
+            - test_compare_identical_candidates: Common random numbers cancel all noise
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self, create_deck):
+        # Disable GUI for testing
+        config.gui_enabled = False
+
+        self.deck_a = create_deck(potions=2)
+        self.deck_b = create_deck(potions=2)
+
+    def test_play_many_aggregates_results(self):
+        """Test that the aggregated results of a batch are consistent."""
+        cards = len(self.deck_a.cards)
+        result = play_many(self.deck_a, self.deck_b, 40, seed=3)
+
+        assert result.games == 40
+        assert sum(result.wins) + result.unfinished == 40
+        assert sum(result.seat_wins) == sum(result.wins)
+        assert result.turns.total == 40
+        assert [histogram.total for histogram in result.points] == [40, 40]
+        assert result.record.games == 40
+        assert 0.0 <= result.win_rate <= 1.0
+        assert result.to_dict()["games"] == 40
+        low, high = result.interval()
+        assert low <= result.win_rate <= high
+        assert sum(result.cards_in_play[0].counts.values()) > 0
+
+        # The template decks are left untouched
+        assert len(self.deck_a.cards) == cards
+
+    def test_play_many_is_reproducible(self):
+        """Test that a batch only depends on its seed, not on the number of workers."""
+        serial = play_many(self.deck_a, self.deck_b, 20, seed=7)
+        again = play_many(self.deck_a, self.deck_b, 20, seed=7)
+        parallel = play_many(self.deck_a, self.deck_b, 20, seed=7, workers=2, chunk_size=5)
+
+        assert serial == again
+        assert serial == parallel
+
+        # Live partial results arrive after every chunk
+        partial = []
+        chunked = play_many(
+            self.deck_a, self.deck_b, 20, seed=7, chunk_size=8, progress=partial.append
+        )
+        assert chunked == serial
+        assert len(partial) == 3
+        assert chunked.turn_stats.count == 20
+        assert chunked.report().startswith("20 games")
+
+    def test_replay_game(self):
+        """Test that replaying every game of a batch gives the batch results."""
+        result = play_many(self.deck_a, self.deck_b, 6, seed=11)
+
+        turns = []
+        for index in range(6):
+            match = replay_game(self.deck_a, self.deck_b, seed=11, index=index)
+            assert match.game_over
+            turns.append(match.turn)
+
+        histogram = Histogram(0, result.turns.high, len(result.turns.counts))
+        for turn in turns:
+            histogram.add(turn)
+        assert histogram == result.turns
+
+    def test_estimate_winrate_stops_early(self):
+        """Test that the win rate estimate stops as soon as its interval allows it."""
+        # A deck without pokemon to play loses every game, which is decided quickly
+        empty = Deck(energy_types=["psychic"])
+        decided = estimate_winrate(self.deck_a, empty, target_ci=0.001, batch_size=50)
+        assert decided.reason == "decided"
+        assert decided.win_rate == 1.0
+        assert decided.games < 1000
+
+        # A mirror match is not decided, it runs until the interval is narrow enough
+        precise = estimate_winrate(self.deck_a, self.deck_b, target_ci=0.1, batch_size=20)
+        assert precise.reason == "precise"
+        low, high = precise.interval
+        assert (high - low) / 2 <= 0.1
+        assert precise.games == precise.result.games
+        assert precise.seconds > 0
+
+        # The games are the first games of the batch with the same seed
+        assert precise.result == play_many(self.deck_a, self.deck_b, precise.games)
+
+        capped = estimate_winrate(self.deck_a, self.deck_b, target_ci=0.0, max_games=30)
+        assert capped.reason == "budget"
+        assert capped.games == 30
+
+    def test_paired_games_share_random_streams(self):
+        """Test that both games of a pair deal the same cards and energies to each deck."""
+        template_a = DeckTemplate(self.deck_a)
+        template_b = DeckTemplate(self.deck_b)
+        first, _, starter_first = new_match(template_a, template_b, 5, 0, paired=True)
+        second, _, starter_second = new_match(template_a, template_b, 5, 1, paired=True)
+
+        assert (starter_first, starter_second) == (0, 1)
+        # Deck A starts the first game and is second in the mirrored one
+        same_deck = [
+            (first.starting_player, second.second_player),
+            (first.second_player, second.starting_player),
+        ]
+        for a, b in same_deck:
+            assert [str(card) for card in a.hand] == [str(card) for card in b.hand]
+            assert [str(card) for card in a.deck.cards] == [str(card) for card in b.deck.cards]
+            assert a.deck.rng.getstate() == b.deck.rng.getstate()
+
+        result = play_many(self.deck_a, self.deck_b, 20, seed=5, paired=True, chunk_size=5)
+        assert result.pair_scores.count == 10
+        low, high = result.paired_interval()
+        assert low <= result.pair_scores.mean <= high
+
+    def test_compare_identical_candidates(self, create_deck):
+        """Test that identical candidates play identical paired games."""
+        comparison = compare_candidates(
+            self.deck_a, create_deck(potions=2), [self.deck_b], 10, seed=2
+        )
+
+        assert comparison.pairs == 5
+        assert comparison.difference == 0.0
+        assert comparison.interval == (0.0, 0.0)
+        assert comparison.result_x == comparison.result_y
@@ -0,0 +1,98 @@
+import random
+from collections import Counter
+
+import pytest
+
+from pokepocketsim import Card, Deck, Player
+from pokepocketsim.mechanics import (
+    CardDraw,
+    CoinFlips,
+    EnergyDraw,
+    RetreatDiscard,
+    RetreatTarget,
+)
+from pokepocketsim.utils import config
+
+
+def create_player() -> Player:
+    names = ["Ralts", "Ralts", "Kirlia", "Potion"] * 2
+    deck = Deck.from_names(names, ["psychic", "psychic", "grass"])
+    player = Player("p", deck)
+    player.print_actions = False
+    return player
+
+
+class TestChance:
+    """
+    TestChance:
+        Verifies the chance events and their outcome distributions.
+
+        Test Methods:
+            - test_distributions_add_up: Every event's probabilities sum to one
+            - test_retreat_discard_matches_sampling: Enumerated discards match the engine's draws
+            - test_resolve_with_outcome: Resolving with an outcome plays exactly that outcome
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        config.gui_enabled = False
+
+    def create_retreating_card(self) -> Card:
+        card = Card.create_card("Mewtwo EX")
+        card.energies = {"psychic": 2, "grass": 1}
+        return card
+
+    def test_distributions_add_up(self):
+        player = create_player()
+        player.active_card = Card.create_card("Ralts")
+        player.bench = [Card.create_card("Kirlia"), Card.create_card("Ralts")]
+        events = [
+            CardDraw(player),
+            EnergyDraw(player),
+            RetreatTarget(player),
+            RetreatDiscard(self.create_retreating_card()),
+            CoinFlips(3),
+        ]
+        for event in events:
+            assert sum(outcome.probability for outcome in event.outcomes()) == pytest.approx(1)
+
+        energies = dict(EnergyDraw(player).outcomes())
+        assert energies == pytest.approx({"psychic": 2 / 3, "grass": 1 / 3})
+        assert [p for _, p in CoinFlips(2).outcomes()] == [0.25, 0.5, 0.25]
+        assert CoinFlips(4).expectation(lambda heads: heads) == pytest.approx(2)
+
+    def test_retreat_discard_matches_sampling(self):
+        card = self.create_retreating_card()
+        outcomes = dict(RetreatDiscard(card).outcomes())
+        # A type is chosen among the types left, not among the energies
+        expected = {("psychic", "psychic"): 0.25, ("grass", "psychic"): 0.75}
+        assert outcomes == pytest.approx(expected)
+
+        rng = random.Random(0)
+        samples = Counter(RetreatDiscard(card).sample(rng) for _ in range(20000))
+        for value, probability in outcomes.items():
+            assert samples[value] / 20000 == pytest.approx(probability, abs=0.02)
+
+    def test_resolve_with_outcome(self):
+        player = create_player()
+        active = Card.create_card("Ralts")
+        kirlia, ralts = Card.create_card("Kirlia"), Card.create_card("Ralts")
+        player.active_card = active
+        player.bench = [kirlia, ralts]
+        RetreatTarget(player).resolve(1)
+        assert player.active_card is ralts
+        assert player.bench == [kirlia, active]
+
+        card = self.create_retreating_card()
+        RetreatDiscard(card).resolve(("grass", "psychic"))
+        assert card.energies == {"psychic": 1, "grass": 0}
+
+        draw_index = dict(CardDraw(player).outcomes())
+        index = next(i for i in draw_index if player.deck.cards[i].__class__.__name__ == "Potion")
+        size = len(player.deck.cards)
+        drawn = CardDraw(player).resolve(index)
+        assert type(drawn).__name__ == "Potion"
+        assert len(player.deck.cards) == size - 1 and player.hand[-1] is drawn
+
+        EnergyDraw(player).resolve("grass")
+        assert player.current_energy == "grass"
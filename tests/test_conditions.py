@@ -0,0 +1,101 @@
+import pytest
+
+from pokepocketsim import Card, Match, Player
+from pokepocketsim.engine import execute_action, get_available_actions
+from pokepocketsim.mechanics import Condition, Supporter
+from pokepocketsim.mechanics.action import ActionType
+from pokepocketsim.search import find_lethal
+from pokepocketsim.utils import config
+
+
+class TestConditions:
+    """
+    TestConditions:
+        Verifies the bit flag conditions of cards and their effect on damage.
+
+        Test Methods:
+            - test_add_remove_and_test: Conditions are set, tested and cleared as flags
+            - test_update_expires_turn_conditions: Turn conditions expire, Poison stays
+            - test_bench_conditions_expire: Turn conditions on the bench expire, also in search
+            - test_giovanni_adds_damage: Giovanni's Plus10DamageDealed adds to the attack
+            - test_lethal_with_giovanni: The lethal check plays Giovanni when it wins
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self, create_deck):
+        # Disable GUI for testing
+        config.gui_enabled = False
+
+        self.player1 = Player("p1", create_deck(), is_bot=True)
+        self.player2 = Player("p2", create_deck(), is_bot=True)
+        self.player1.print_actions = False
+        self.player2.print_actions = False
+        self.match = Match(self.player1, self.player2)
+        self.match.turn = 3
+
+        self.player1.hand = [Supporter.Giovanni()]
+        self.player1.active_card = Card.create_card("Mewtwo EX")
+        self.player1.active_card.energies = {"psychic": 2}
+        self.player1.current_energy = None
+        self.player2.active_card = Card.create_card("Ralts")
+        self.player2.bench = []
+
+    def test_add_remove_and_test(self):
+        """Test that conditions behave as flags."""
+        card = Card.create_card("Ralts")
+        assert card.conditions == Condition.NONE
+
+        card.add_condition(Condition.Poison)
+        card.add_condition(Condition.Poison)
+        card.add_condition(Condition.Plus10DamageDealed)
+        assert card.has_condition(Condition.Poison)
+        assert card.serialize()["conditions"] == ["Plus10DamageDealed", "Poison"]
+
+        card.remove_condition(Condition.Poison)
+        assert not card.has_condition(Condition.Poison)
+        assert card.conditions == Condition.Plus10DamageDealed
+
+    def test_update_expires_turn_conditions(self):
+        """Test that the damage conditions expire at the start of the turn and Poison stays."""
+        card = Card.create_card("Ralts")
+        card.add_condition(Condition.Plus30DamageDealed | Condition.Minus20DamageReceived)
+        card.add_condition(Condition.Poison)
+        card.update_conditions()
+        assert card.conditions == Condition.Poison
+
+    def test_bench_conditions_expire(self):
+        """Test that the turn start expires the conditions of the bench, also on search copies."""
+        kirlia = Card.create_card("Kirlia")
+        self.player1.bench = [kirlia]
+        kirlia.add_condition(Condition.Plus10DamageDealed)
+        kirlia.can_evolve = False
+
+        _, player_copy = self.match._copy_for_simulation(self.player1)
+        assert player_copy.bench[0].conditions == Condition.NONE
+        assert player_copy.bench[0].can_evolve
+
+        self.player1.reset_turn_state(self.match)
+        assert kirlia.conditions == Condition.NONE
+
+    def test_giovanni_adds_damage(self):
+        """Test that Giovanni makes the attack deal 10 more damage."""
+        actions = get_available_actions(self.player1)
+        giovanni = next(a for a in actions if a.item_class is Supporter.Giovanni)
+        execute_action(self.player1, giovanni, self.match)
+        assert self.player1.active_card.has_condition(Condition.Plus10DamageDealed)
+
+        attack = next(
+            a for a in self.player1.gather_actions() if a.action_type == ActionType.ATTACK
+        )
+        execute_action(self.player1, attack, self.match)
+        assert self.player2.active_card.hp == 60 - 50 - 10
+
+    def test_lethal_with_giovanni(self):
+        """Test that the lethal check plays Giovanni when the extra damage wins."""
+        self.player2.active_card.hp = 60
+        line = find_lethal(self.player1)
+        assert line is not None
+        assert [a.action_type for a in line] == [ActionType.SUPPORTER, ActionType.ATTACK]
+
+        self.player2.active_card.hp = 70
+        assert find_lethal(self.player1) is None
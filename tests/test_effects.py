@@ -0,0 +1,119 @@
+import pickle
+import random
+
+import pytest
+
+from pokepocketsim import Attack, Card, Match, Player
+from pokepocketsim.mechanics import Condition
+from pokepocketsim.mechanics.effects import compile_attack, compile_effects
+from pokepocketsim.utils import config
+
+
+class TestEffects:
+    """
+    TestEffects:
+        Verifies the attack effect compiler and the attacks compiled from the database.
+
+        Test Methods:
+            - test_database_attacks_are_registered: Every database attack is on Attack
+            - test_psydrive_discards_energy: Psydrive deals its damage and discards two energies
+            - test_effect_kinds: Heal, condition, coin flip and bench damage effects
+            - test_psydrive_needs_two_psychic: One psychic energy neither pays nor discards
+            - test_bench_knockout_wins: A bench knockout reaching 3 points wins the game
+            - test_invalid_specs_raise: Unknown kinds and arguments raise ValueError
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self, create_deck):
+        # Disable GUI for testing
+        config.gui_enabled = False
+
+        self.player1 = Player("p1", create_deck(), is_bot=True)
+        self.player2 = Player("p2", create_deck(), is_bot=True)
+        self.player1.print_actions = False
+        self.player2.print_actions = False
+        self.match = Match(self.player1, self.player2)
+
+        self.player1.active_card = Card.create_card("Mewtwo EX")
+        self.player1.active_card.energies = {"psychic": 3, "grass": 1}
+        self.player2.active_card = Card.create_card("Mewtwo EX")
+        self.player2.bench = [Card.create_card("Ralts"), Card.create_card("Kirlia")]
+
+    def test_database_attacks_are_registered(self):
+        """Test that the compiled attacks are found and pickled by name."""
+        for name in ["psychic_sphere", "psydrive", "ram", "smack", "psyshot"]:
+            attack = getattr(Attack, name)
+            assert attack.__name__ == name
+            assert pickle.loads(pickle.dumps(attack)) is attack
+
+    def test_psydrive_discards_energy(self):
+        """Test that Psydrive deals 150 damage and discards two psychic energies."""
+        Attack.psydrive(self.player1)
+        assert self.player2.active_card.hp == 0
+        assert self.player1.active_card.energies == {"psychic": 1, "grass": 1}
+
+    def test_effect_kinds(self):
+        """Test the heal, condition, coin flip and bench damage effects."""
+        attacker = self.player1.active_card
+        attacker.hp = 100
+        attack = compile_attack(
+            {
+                "title": "Test Attack",
+                "fixed_damage": 10,
+                "effects": [
+                    {"kind": "heal", "amount": 30},
+                    {"kind": "apply_condition", "condition": "Poison"},
+                    {"kind": "coin_flip", "count": 2, "damage_per_heads": 20},
+                    {"kind": "bench_damage", "amount": 60},
+                ],
+            }
+        )
+        random.seed(0)
+        heads = sum(random.choice([True, False]) for _ in range(2))
+        random.seed(0)
+        attack(self.player1)
+
+        assert attacker.hp == 130
+        assert self.player2.active_card.has_condition(Condition.Poison)
+        assert self.player2.active_card.hp == 150 - 10 - 20 * heads
+
+        # Ralts is knocked out on the bench and scores a point, Kirlia survives
+        assert [card.name for card in self.player2.bench] == ["Kirlia"]
+        assert self.player1.points == 1
+
+    def test_psydrive_needs_two_psychic(self):
+        """Test that Psydrive cannot be played with one of its two psychic energies."""
+        attacker = self.player1.active_card
+        attacker.energies = {"psychic": 1, "grass": 3}
+        assert not Attack.can_use_attack(attacker, Attack.psydrive)
+
+        with pytest.raises(ValueError):
+            Attack.psydrive(self.player1)
+        assert attacker.energies == {"psychic": 1, "grass": 3}
+        assert self.player2.active_card.hp == 150
+
+    def test_bench_knockout_wins(self):
+        """Test that the points of a bench knockout alone end the game."""
+        self.player1.points = 2
+        attack = compile_attack(
+            {
+                "title": "Test Attack",
+                "fixed_damage": 10,
+                "effects": [{"kind": "bench_damage", "amount": 60}],
+            }
+        )
+        attack(self.player1)
+
+        # The active card survives, Ralts knocked out on the bench scores the third point
+        assert self.player2.active_card.hp == 140
+        assert self.player1.points == 3
+        assert self.player1.handle_knockout_points()
+
+    def test_invalid_specs_raise(self):
+        """Test that invalid specs are rejected when compiling."""
+        with pytest.raises(ValueError):
+            compile_effects([{"kind": "teleport"}])
+        with pytest.raises(ValueError):
+            compile_effects([{"kind": "heal"}])
+        with pytest.raises(ValueError):
+            compile_effects([{"kind": "apply_condition", "condition": "Confused"}])
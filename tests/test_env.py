@@ -0,0 +1,188 @@
+import random
+from typing import List
+
+import pytest
+
+from pokepocketsim import Deck, Env, VecEnv
+from pokepocketsim.env import (
+    MAX_ACTIONS,
+    OBSERVATION_NAMES,
+    OBSERVATION_SIZE,
+    SharedBuffers,
+)
+from pokepocketsim.utils import config
+
+
+def legal_actions(action_mask) -> List[int]:
+    # Without legal actions any action ends the episode
+    return [i for i, legal in enumerate(action_mask) if legal] or [0]
+
+
+def play_episode(env: Env, rng: random.Random) -> List[list]:
+    """Play an episode with random legal actions, returning the observations."""
+    observation, _ = env.reset()
+    observations = [list(observation)]
+    while True:
+        observation, reward, terminated, truncated, info = env.step(
+            rng.choice(legal_actions(env.action_mask))
+        )
+        observations.append(list(observation))
+        if terminated or truncated:
+            observations.append([reward, info["points"], info["turns"]])
+            return observations
+
+
+class TestEnv:
+    """
+    TestEnv:
+        Verifies the reinforcement learning environments.
+
+        Test Methods:
+            - test_episode: An episode steps through the agent's decisions to a reward
+            - test_illegal_actions_raise: Masked actions and steps after the end raise
+            - test_no_decision_ends_episode: A match over before any decision is one step
+            - test_episodes_are_reproducible: Same seed, same episodes, whatever runs between
+            - test_vec_env_auto_reset: Ended episodes are reset in the same step
+            - test_vec_env_workers: Worker processes step the same episodes
+            - test_shared_buffers: Workers and the VecEnv share the buffers, freed on close
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self, create_deck):
+        # Disable GUI for testing
+        config.gui_enabled = False
+
+        self.deck_a = create_deck(potions=2)
+        self.deck_b = create_deck(potions=2)
+
+    def test_episode(self):
+        """Test that an episode ends with a reward and the agent plays whole turns."""
+        env = Env(self.deck_a, self.deck_b, seed=1)
+        assert len(OBSERVATION_NAMES) == OBSERVATION_SIZE
+        observations = play_episode(env, random.Random(0))
+        reward, points, turns = observations.pop()
+
+        assert all(len(observation) == OBSERVATION_SIZE for observation in observations)
+        assert len(env.action_mask) == MAX_ACTIONS
+        assert reward in (-1.0, 0.0, 1.0)
+        if reward == 1.0:
+            assert points[0] >= 3
+        assert turns == env.match.turn
+
+        # The agent takes several actions in some turns
+        turn = OBSERVATION_NAMES.index("turn")
+        agent_turns = [observation[turn] for observation in observations[:-1]]
+        assert len(set(agent_turns)) < len(agent_turns)
+
+    def test_illegal_actions_raise(self):
+        """Test that only the legal actions of a running episode can be played."""
+        env = Env(self.deck_a, self.deck_b, seed=1)
+        env.reset()
+        with pytest.raises(ValueError):
+            env.step(len(legal_actions(env.action_mask)))
+
+        play_episode(env, random.Random(0))
+        with pytest.raises(ValueError):
+            env.step(0)
+
+    def test_no_decision_ends_episode(self):
+        """Test that a deck without basic pokemon loses every episode in one step."""
+        deck = Deck.from_names(["Kirlia"] * 4 + ["Gardevoir"] * 2, ["psychic"])
+        env = Env(deck, self.deck_b, seed=1)
+        for game in range(3):
+            _, info = env.reset()
+            assert info["game"] == game
+            assert not any(env.action_mask)
+            _, reward, terminated, truncated, _ = env.step(0)
+            assert (reward, terminated, truncated) == (-1.0, True, False)
+
+        with VecEnv(deck, self.deck_b, num_envs=2, seed=1) as vec_env:
+            vec_env.reset()
+            _, rewards, terminated, _, infos = vec_env.step([0, 0])
+            assert list(rewards) == [-1.0, -1.0]
+            assert all(terminated)
+
+    def test_episodes_are_reproducible(self):
+        """Test that episodes only depend on the seed and the actions."""
+        first = play_episode(Env(self.deck_a, self.deck_b, seed=2), random.Random(0))
+
+        # Interleave with another environment and draws from the random module
+        env = Env(self.deck_a, self.deck_b, seed=2)
+        other = Env(self.deck_a, self.deck_b, seed=5)
+        rng = random.Random(0)
+        observation, _ = env.reset()
+        other.reset()
+        second = [list(observation)]
+        while True:
+            random.random()
+            other.step(random.choice(legal_actions(other.action_mask)))
+            if other.done:
+                other.reset()
+            observation, reward, terminated, truncated, info = env.step(
+                rng.choice(legal_actions(env.action_mask))
+            )
+            second.append(list(observation))
+            if terminated or truncated:
+                second.append([reward, info["points"], info["turns"]])
+                break
+        assert first == second
+
+    def test_vec_env_auto_reset(self):
+        """Test that ended episodes are reset, with their last observation in the info."""
+        rng = random.Random(0)
+        with VecEnv(self.deck_a, self.deck_b, num_envs=3, seed=3) as env:
+            observations, infos = env.reset()
+            assert [info["game"] for info in infos] == [0, 1, 2]
+
+            ended = 0
+            for _ in range(400):
+                actions = [rng.choice(legal_actions(mask)) for mask in env.action_masks]
+                observations, rewards, terminated, truncated, infos = env.step(actions)
+                for i, info in enumerate(infos):
+                    if terminated[i] or truncated[i]:
+                        ended += 1
+                        assert len(info["final_observation"]) == OBSERVATION_SIZE
+                        assert env.envs[i].episodes >= 2
+                    else:
+                        assert rewards[i] == 0.0
+                # Every environment has a running episode, the decks always draw a basic
+                assert all(any(mask) for mask in env.action_masks)
+            assert ended > 0
+
+    def test_vec_env_workers(self):
+        """Test that environments in worker processes play the same episodes."""
+        results = []
+        for workers in (0, 2):
+            rng = random.Random(0)
+            steps = []
+            with VecEnv(self.deck_a, self.deck_b, num_envs=4, seed=4, workers=workers) as env:
+                observations, _ = env.reset()
+                steps.append([list(row) for row in observations])
+                for _ in range(100):
+                    actions = [rng.choice(legal_actions(mask)) for mask in env.action_masks]
+                    observations, rewards, terminated, _, _ = env.step(actions)
+                    steps.append([list(row) for row in observations])
+                    steps.append([list(rewards), list(terminated)])
+            results.append(steps)
+        assert results[0] == results[1]
+
+    def test_shared_buffers(self):
+        """Test that the buffers attached by name are the VecEnv's, and freed on close."""
+        env = VecEnv(self.deck_a, self.deck_b, num_envs=3, seed=5, workers=1)
+        try:
+            observations, _ = env.reset()
+            name = env._buffers.name
+            attached = SharedBuffers(3, name)
+            assert [list(row) for row in attached.observations] == [
+                list(row) for row in observations
+            ]
+            attached.observations[0][0] = -1.0
+            assert observations[0][0] == -1.0
+            attached.close()
+
+            with pytest.raises(ValueError):
+                env.step([MAX_ACTIONS - 1] * 3)
+        finally:
+            env.close()
+        with pytest.raises(FileNotFoundError):
+            SharedBuffers(3, name)
@@ -0,0 +1,115 @@
+import pytest
+
+from pokepocketsim import Card, Match, Player
+from pokepocketsim.engine import execute_action, get_available_actions
+from pokepocketsim.mechanics.action import ActionType
+from pokepocketsim.mechanics.events import Event
+from pokepocketsim.search import DamageTable
+from pokepocketsim.utils import config
+
+
+class Intimidate:
+    """Test ability: the holder's side deals 20 more damage and counts attacks and turns."""
+
+    def __init__(self) -> None:
+        self.name = "Intimidate"
+        self.attacks = 0
+        self.turns = 0
+
+    def on_turn_start(self, player: Player, card: Card) -> None:
+        self.turns += 1
+
+    def on_attack(self, player: Player, attacker: Card, card: Card) -> None:
+        self.attacks += 1
+
+    def on_damage(self, damage: int, attacker: Card, defender: Card, card: Card) -> int:
+        return damage + 20 if attacker is card else damage
+
+
+class TestEvents:
+    """
+    TestEvents:
+        Verifies the event bus of the cards in play.
+
+        Test Methods:
+            - test_subscriptions_follow_play: Cards subscribe entering play and leave knocked out
+            - test_evolving_subscribes_ability: Evolving into Gardevoir offers Psy Shadow
+            - test_handlers_run_on_events: Turn start, attack and damage handlers run
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self, create_deck):
+        # Disable GUI for testing
+        config.gui_enabled = False
+
+        self.player1 = Player("p1", create_deck(), is_bot=True)
+        self.player2 = Player("p2", create_deck(), is_bot=True)
+        self.player1.print_actions = False
+        self.player2.print_actions = False
+        self.match = Match(self.player1, self.player2)
+        self.match.turn = 3
+
+    def test_subscriptions_follow_play(self):
+        """Test that only cards with effects subscribe, and leave when knocked out."""
+        ralts = Card.create_card("Ralts")
+        gardevoir = Card.create_card("Gardevoir")
+        self.player2.hand = [ralts, gardevoir]
+        Player.set_active_card_from_hand(self.player2, gardevoir.uuid)
+        Player.add_card_to_bench(self.player2, ralts.uuid)
+
+        gather = self.player2.events.subscribers[Event.ON_GATHER_ACTIONS]
+        assert [card for card, _ in gather] == [gardevoir]
+        assert any(a.action_type == ActionType.ABILITY for a in self.player2.gather_actions())
+
+        gardevoir.hp = 0
+        assert not self.player1.handle_knockout_points()
+        assert len(self.player2.events) == 0
+
+    def test_evolving_subscribes_ability(self):
+        """Test that evolving subscribes the ability of the evolved form."""
+        kirlia = Card.create_card("Kirlia")
+        gardevoir = Card.create_card("Gardevoir")
+        self.player1.hand = [kirlia, gardevoir]
+        Player.set_active_card_from_hand(self.player1, kirlia.uuid)
+        kirlia.can_evolve = True
+        assert len(self.player1.events) == 0
+
+        evolve = next(
+            a for a in get_available_actions(self.player1) if a.action_type == ActionType.EVOLVE
+        )
+        execute_action(self.player1, evolve, self.match)
+        assert self.player1.events.subscribers[Event.ON_GATHER_ACTIONS]
+
+        # The ability is used once per turn, the turn start handler makes it available again
+        ability = next(
+            a for a in get_available_actions(self.player1) if a.action_type == ActionType.ABILITY
+        )
+        execute_action(self.player1, ability, self.match)
+        assert not any(
+            a.action_type == ActionType.ABILITY for a in get_available_actions(self.player1)
+        )
+        self.player1.reset_turn_state(self.match)
+        assert any(a.action_type == ActionType.ABILITY for a in get_available_actions(self.player1))
+
+    def test_handlers_run_on_events(self):
+        """Test that the handlers of an ability run and modify the attack damage."""
+        mewtwo = Card.create_card("Mewtwo EX")
+        mewtwo.ability = Intimidate()
+        mewtwo.energies = {"psychic": 2}
+        self.player1.hand = [mewtwo]
+        Player.set_active_card_from_hand(self.player1, mewtwo.uuid)
+        self.player2.active_card = Card.create_card("Mewtwo EX")
+
+        self.player1.reset_turn_state(self.match)
+        assert mewtwo.ability.turns == 1
+
+        table = DamageTable(self.player1)
+        entry = next(e for e in table.entries if e.attack == "Psychic Sphere")
+        assert entry.damage == 70
+
+        attack = next(
+            a for a in get_available_actions(self.player1) if a.action_type == ActionType.ATTACK
+        )
+        execute_action(self.player1, attack, self.match)
+        assert mewtwo.ability.attacks == 1
+        assert self.player2.active_card.hp == 150 - 70
@@ -0,0 +1,121 @@
+import copy
+import pickle
+import random
+import types
+
+import pytest
+
+from pokepocketsim import Attack, Card, Match, Player
+from pokepocketsim.generator_attack import attack_records, generate_source, main
+from pokepocketsim.mechanics import generated_attacks
+from pokepocketsim.mechanics.effects import compile_attack
+from pokepocketsim.utils import config
+
+RECORDS = [
+    {"title": "Psychic Sphere", "fixed_damage": 50},
+    {
+        "title": "Test Attack",
+        "fixed_damage": 10,
+        "effects": [
+            {"kind": "discard_energy", "count": 2},
+            {"kind": "heal", "amount": 30},
+            {"kind": "apply_condition", "condition": "Asleep", "target": "self"},
+            {
+                "kind": "coin_flip",
+                "count": 2,
+                "damage_per_heads": 20,
+                "on_heads": [
+                    {"kind": "apply_condition", "condition": "Poison"},
+                    {"kind": "coin_flip", "damage_per_heads": 30},
+                ],
+            },
+            {"kind": "bench_damage", "amount": 40},
+        ],
+    },
+]
+
+
+def state(player: Player) -> tuple:
+    """The state an attack may change, on both sides."""
+    sides = []
+    for side in (player, player.opponent):
+        active = side.active_card
+        sides.append(
+            (
+                side.points,
+                active.hp,
+                int(active.conditions),
+                dict(active.energies),
+                [(card.name, card.hp) for card in side.bench],
+                [card.name for card in side.discard_pile],
+            )
+        )
+    return tuple(sides)
+
+
+class TestGeneratorAttack:
+    """
+    TestGeneratorAttack:
+        Verifies the generated attack module against the compiled attacks.
+
+        Test Methods:
+            - test_generated_module_is_current: The committed module matches the database
+            - test_generated_attacks_are_registered: The static functions are on Attack
+            - test_database_attacks_match_compiled: Static and compiled database attacks agree
+            - test_generated_effects_match_compiled: Every effect kind generates the same play
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self, create_deck):
+        # Disable GUI for testing
+        config.gui_enabled = False
+
+        self.player1 = Player("p1", create_deck(), is_bot=True)
+        self.player2 = Player("p2", create_deck(), is_bot=True)
+        self.player1.print_actions = False
+        self.player2.print_actions = False
+        self.match = Match(self.player1, self.player2)
+
+        self.player1.active_card = Card.create_card("Mewtwo EX")
+        self.player1.active_card.energies = {"psychic": 3, "grass": 1}
+        self.player1.active_card.hp = 100
+        self.player2.active_card = Card.create_card("Mewtwo EX")
+        self.player2.bench = [Card.create_card("Ralts"), Card.create_card("Kirlia")]
+
+    def assert_same_play(self, static, compiled) -> None:
+        for seed in range(8):
+            results = []
+            for attack in (static, compiled):
+                player = copy.deepcopy(self.player1)
+                random.seed(seed)
+                attack(player)
+                results.append(state(player))
+            assert results[0] == results[1]
+
+    def test_generated_module_is_current(self):
+        """Test that the committed module was generated from the current database."""
+        assert main(["--check"]) == 0
+
+    def test_generated_attacks_are_registered(self):
+        """Test that the attacks registered on Attack are the generated functions."""
+        for name, function in generated_attacks.ATTACKS.items():
+            attack = getattr(Attack, name)
+            assert attack is function
+            assert attack.__module__ == generated_attacks.__name__
+            assert pickle.loads(pickle.dumps(attack)) is attack
+
+    def test_database_attacks_match_compiled(self):
+        """Test that every generated database attack plays like its compiled closure."""
+        for attack_info in attack_records():
+            name = attack_info["title"].lower().replace(" ", "_")
+            self.assert_same_play(generated_attacks.ATTACKS[name], compile_attack(attack_info))
+
+    def test_generated_effects_match_compiled(self):
+        """Test the source generated for every effect kind, nested coin flips included."""
+        module = types.ModuleType("pokepocketsim.mechanics.generated_test")
+        module.__package__ = "pokepocketsim.mechanics"
+        exec(compile(generate_source(RECORDS), module.__name__, "exec"), module.__dict__)
+
+        for attack_info in RECORDS:
+            name = attack_info["title"].lower().replace(" ", "_")
+            self.assert_same_play(module.ATTACKS[name], compile_attack(attack_info))
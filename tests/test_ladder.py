@@ -0,0 +1,103 @@
+import json
+
+import pytest
+
+from pokepocketsim import Ladder
+from pokepocketsim.batch import BatchResult
+from pokepocketsim.ui.cli import main
+from pokepocketsim.utils import config
+
+
+def create_result(wins_a: int, wins_b: int) -> BatchResult:
+    result = BatchResult()
+    for _ in range(wins_a):
+        result.add(0, 0, (3, 0), 10)
+    for _ in range(wins_b):
+        result.add(1, 0, (0, 3), 10)
+    return result
+
+
+class TestLadder:
+    """
+    TestLadder:
+        Verifies the bot rating ladder.
+
+        Test Methods:
+            - test_record_updates_ratings: Wins move ratings apart and shrink the deviations
+            - test_pairings_prefer_uncertain_bots: A new bot is scheduled first
+            - test_run_and_resume: Matches are played, saved and loaded again
+            - test_ladder_cli: The command creates a ladder and prints its standings
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        config.gui_enabled = False
+
+    def test_record_updates_ratings(self):
+        ladder = Ladder()
+        ladder.add("strong", "planner")
+        ladder.add("weak", "random")
+        ladder.record("strong", "weak", create_result(15, 5))
+
+        strong, weak = ladder.entries["strong"], ladder.entries["weak"]
+        assert strong.rating > 1500 > weak.rating
+        assert strong.rating - 1500 == pytest.approx(1500 - weak.rating)
+        assert strong.deviation < 350 and weak.deviation < 350
+        assert (strong.games, strong.score, weak.score) == (20, 15, 5)
+        assert [entry.name for entry in ladder.standings()] == ["strong", "weak"]
+
+        with pytest.raises(ValueError):
+            ladder.add("weak", "random")
+
+    def test_pairings_prefer_uncertain_bots(self):
+        ladder = Ladder()
+        for name in ("a", "b", "c"):
+            ladder.add(name, "random")
+        for _ in range(5):
+            ladder.record("a", "b", create_result(10, 10))
+            ladder.record("b", "c", create_result(10, 10))
+            ladder.record("a", "c", create_result(10, 10))
+        ladder.add("new", "random")
+
+        pairings = ladder.pairings(2)
+        assert "new" in pairings[0]
+        assert len(set(pairings[0]) | set(pairings[1])) == 4
+        assert len(ladder.pairings(4)) == 4
+
+    def test_run_and_resume(self, tmp_path):
+        path = tmp_path / "ladder.json"
+        ladder = Ladder(path, games_per_match=6)
+        ladder.add("random", "random")
+        ladder.add("planner", "planner:think_ms=2")
+        ladder.run(rounds=2)
+        assert ladder.matches == 2
+        assert ladder.entries["random"].games == 12
+
+        loaded = Ladder.load(path)
+        assert loaded.to_dict() == ladder.to_dict()
+        loaded.run(rounds=1)
+        assert loaded.matches == 3
+
+    def test_ladder_cli(self, tmp_path, capsys):
+        path = str(tmp_path / "ladder.json")
+        code = main(
+            [
+                "ladder",
+                path,
+                "--add",
+                "a=random",
+                "--add",
+                "b=random",
+                "--rounds",
+                "1",
+                "--games",
+                "4",
+                "--json",
+            ]
+        )
+        assert code == 0
+        data = json.loads(capsys.readouterr().out)
+        assert {entry["name"] for entry in data["entries"]} == {"a", "b"}
+        assert data["matches"] == 1
+
+        assert main(["ladder", path, "--add", "broken"]) == 2
@@ -0,0 +1,94 @@
+import pytest
+
+from pokepocketsim import Card, Match, Player
+from pokepocketsim.engine import execute_action
+from pokepocketsim.mechanics.action import ActionType
+from pokepocketsim.search import DamageTable, Expectimax, find_lethal
+from pokepocketsim.utils import config
+
+
+class TestLethal:
+    """
+    TestLethal:
+        Verifies the damage table and the lethal check of the turn planners.
+
+        Test Methods:
+            - test_table_matches_engine_damage: Table damage is the damage the attack deals
+            - test_lethal_line_attaches_energy: The cheapest winning line attaches and attacks
+            - test_knockout_without_win_is_not_lethal: A knockout that does not win is no lethal
+            - test_planners_short_circuit: The planners return the winning line
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self, create_deck):
+        # Disable GUI for testing
+        config.gui_enabled = False
+
+        self.player1 = Player("p1", create_deck(), is_bot=True)
+        self.player2 = Player("p2", create_deck(), is_bot=True)
+        self.player1.print_actions = False
+        self.player2.print_actions = False
+        self.match = Match(self.player1, self.player2)
+        self.match.turn = 3
+
+        # Mewtwo EX one energy short of Psychic Sphere against a damaged Ralts
+        self.player1.hand = []
+        self.player1.active_card = Card.create_card("Mewtwo EX")
+        self.player1.active_card.energies = {"psychic": 1}
+        self.player1.current_energy = "psychic"
+        self.player1.points = 2
+        self.player2.active_card = Card.create_card("Ralts")
+        self.player2.active_card.hp = 40
+        self.player2.bench = [Card.create_card("Ralts")]
+
+    def test_table_matches_engine_damage(self):
+        """Test that the table holds the damage the attack deals when played."""
+        self.player1.active_card.energies = {"psychic": 2}
+        table = DamageTable(self.player1)
+        defender = self.player2.active_card
+        entry = next(e for e in table.against(defender) if e.attack == "Psychic Sphere")
+        assert entry.reachable and not entry.attach
+
+        hp = self.player2.active_card.hp
+        attack = next(
+            a for a in self.player1.gather_actions() if a.action_type == ActionType.ATTACK
+        )
+        execute_action(self.player1, attack, self.match)
+        assert hp - self.player2.active_card.hp == entry.damage == 50
+
+        # Psydrive needs four energies, one attachment does not pay for it
+        psydrive = [e for e in table.entries if e.attack == "Psydrive"]
+        assert psydrive and not any(e.reachable for e in psydrive)
+
+    def test_lethal_line_attaches_energy(self):
+        """Test that the winning line attaches the energy before the attack and wins."""
+        line = find_lethal(self.player1)
+        assert [a.action_type for a in line] == [ActionType.ADD_ENERGY, ActionType.ATTACK]
+
+        # The player itself is not changed, and replaying the line wins
+        assert self.player1.active_card.energies == {"psychic": 1}
+        for action in line:
+            execute_action(self.player1, action, self.match)
+        assert self.player1.handle_knockout_points()
+
+    def test_knockout_without_win_is_not_lethal(self):
+        """Test that a knockout only counts as lethal when it wins the game."""
+        self.player1.points = 0
+        table = DamageTable(self.player1)
+        assert table.knockouts()
+        assert not table.lethal()
+        assert find_lethal(self.player1) is None
+
+        # Without a bench the knocked out Ralts cannot be replaced
+        self.player2.bench = []
+        assert find_lethal(self.player1) is not None
+
+    def test_planners_short_circuit(self):
+        """Test that the planners return the cheapest winning line."""
+        expected = [a.name for a in find_lethal(self.player1)]
+        plan = self.match.get_best_actions_for_player(self.player1, setup_turn=False)
+        assert [a.name for a in plan] == expected
+        best = self.match.top_k(self.player1, 1, setup_turn=False, check_lethal=True)
+        assert best[0][0] == float("inf")
+        planner = Expectimax(depth=1)
+        assert [a.name for a in planner.plan(self.match, self.player1)] == expected
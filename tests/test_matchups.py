@@ -0,0 +1,76 @@
+import pytest
+
+from pokepocketsim import MatchupCache, matchup_matrix, play_matchup
+from pokepocketsim.utils import config
+
+
+class TestMatchups:
+    """
+    TestMatchups:
+        Verifies deck fingerprints and the cached matchup matrix.
+
+        Test Methods:
+            - test_fingerprint: Same cards in any order share a fingerprint, other decks do not
+            - test_cache_is_symmetric: A matchup stored once is found from both sides
+            - test_matrix_only_simulates_new_pairs: A rebuild reuses the cached matchups
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        config.gui_enabled = False
+
+    def test_fingerprint(self, create_deck):
+        deck = create_deck(["Ralts", "Kirlia", "Gardevoir", "Potion"])
+        shuffled = create_deck(["Potion", "Gardevoir", "Ralts", "Kirlia"])
+        assert deck.fingerprint() == shuffled.fingerprint()
+
+        assert deck.fingerprint() != create_deck(["Ralts", "Kirlia", "Gardevoir"]).fingerprint()
+        other_energy = create_deck(["Ralts", "Kirlia", "Gardevoir", "Potion"], ["grass"])
+        assert deck.fingerprint() != other_energy.fingerprint()
+        assert deck.fingerprint() != deck.fingerprint(version=0)
+
+    def test_cache_is_symmetric(self, tmp_path, create_deck):
+        deck_a = create_deck(["Ralts", "Kirlia", "Gardevoir", "Potion"])
+        deck_b = create_deck(["Mewtwo EX", "Potion"])
+        path = tmp_path / "matchups.sqlite"
+
+        with MatchupCache(path) as cache:
+            record, simulated = play_matchup(deck_a, deck_b, 20, cache=cache)
+            assert simulated
+            assert len(cache) == 1
+
+        with MatchupCache(path) as cache:
+            again, simulated = play_matchup(deck_a, deck_b, 20, cache=cache)
+            assert not simulated
+            assert again == record
+            reverse, simulated = play_matchup(deck_b, deck_a, 20, cache=cache)
+            assert not simulated
+            assert reverse == record.swapped()
+            assert reverse.win_rate == pytest.approx(1 - record.win_rate)
+
+            # Other settings are simulated again
+            _, simulated = play_matchup(deck_a, deck_b, 20, seed=1, cache=cache)
+            assert simulated
+            assert len(cache) == 2
+
+    def test_matrix_only_simulates_new_pairs(self, create_deck):
+        decks = {
+            "gardevoir": create_deck(["Ralts", "Kirlia", "Gardevoir", "Potion"]),
+            "mewtwo": create_deck(["Mewtwo EX", "Potion"]),
+            "both": create_deck(["Ralts", "Kirlia", "Gardevoir", "Mewtwo EX"]),
+        }
+        with MatchupCache() as cache:
+            matrix = matchup_matrix(decks, games=10, cache=cache)
+            assert (matrix.simulated, matrix.cached) == (3, 0)
+            for i in range(3):
+                assert matrix.win_rates[i][i] == 0.5
+                for j in range(3):
+                    if i != j:
+                        assert matrix.win_rates[i][j] == pytest.approx(1 - matrix.win_rates[j][i])
+
+            decks["both"] = create_deck(["Ralts", "Kirlia", "Gardevoir", "Mewtwo EX", "Potion"])
+            decks["new"] = create_deck(["Ralts", "Mewtwo EX"])
+            rebuilt = matchup_matrix(decks, games=10, cache=cache)
+            assert (rebuilt.simulated, rebuilt.cached) == (5, 1)
+            assert rebuilt.win_rates[0][1] == matrix.win_rates[0][1]
+            assert "gardevoir" in rebuilt.report()
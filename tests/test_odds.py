@@ -0,0 +1,89 @@
+from itertools import combinations, product
+
+import pytest
+
+from pokepocketsim import Deck
+from pokepocketsim.core.odds import OPENING_HAND, deck_odds
+
+NAMES = ["Ralts", "Ralts", "Kirlia", "Kirlia", "Gardevoir", "Mewtwo EX", "Potion", "Potion"]
+
+# The cards and energy types of the test deck
+CARDS = NAMES + ["Erika"] * 2
+ENERGY_TYPES = ["psychic", "psychic", "grass"]
+
+
+def exhaustive(deck: Deck, seen: int, condition) -> float:
+    """Share of all hands of the first seen cards meeting the condition."""
+    names = [card.name if hasattr(card, "name") else type(card).__name__ for card in deck.cards]
+    hands = list(combinations(range(len(names)), seen))
+    return sum(condition([names[i] for i in hand]) for hand in hands) / len(hands)
+
+
+class TestOdds:
+    """
+    TestOdds:
+        Verifies the exact draw probabilities against exhaustive enumeration.
+
+        Test Methods:
+            - test_card_probabilities: Single cards, groups and joint needs by turn
+            - test_first_drawn: The arrival turn distribution adds up
+            - test_energy_probabilities: Energy counts and costs with colorless
+            - test_cached_per_fingerprint: Reordered decks share one calculator
+    """
+
+    def test_card_probabilities(self, create_deck):
+        deck = create_deck(CARDS, ENERGY_TYPES)
+        odds = deck.odds()
+        assert odds.size == 10
+        assert odds.basics == ["Mewtwo EX", "Ralts"]
+
+        basic = exhaustive(deck, OPENING_HAND, lambda hand: "Ralts" in hand or "Mewtwo EX" in hand)
+        assert odds.basic_in_opening_hand() == pytest.approx(basic)
+
+        kirlia = exhaustive(deck, OPENING_HAND + 3, lambda hand: "Kirlia" in hand)
+        assert odds.probability("Kirlia", turn=3) == pytest.approx(kirlia)
+        two = exhaustive(deck, OPENING_HAND + 1, lambda hand: hand.count("Potion") >= 2)
+        assert odds.probability("Potion", turn=1, at_least=2) == pytest.approx(two)
+
+        line = exhaustive(
+            deck,
+            OPENING_HAND + 2,
+            lambda hand: "Ralts" in hand and "Kirlia" in hand and "Gardevoir" in hand,
+        )
+        needs = {"Ralts": 1, "Kirlia": 1, "Gardevoir": 1}
+        assert odds.probability_all(needs, turn=2) == pytest.approx(line)
+        assert odds.probability_all({"Gardevoir": 2}) == 0.0
+        assert odds.probability("Gardevoir", turn=20) == 1.0
+
+    def test_first_drawn(self, create_deck):
+        odds = create_deck(CARDS, ENERGY_TYPES).odds()
+        distribution = odds.first_drawn("Gardevoir", 5)
+        assert distribution[0] == pytest.approx(0.5)
+        assert sum(distribution) == pytest.approx(1.0)
+        assert all(p >= 0 for p in distribution)
+
+    def test_energy_probabilities(self, create_deck):
+        odds = create_deck(CARDS, ENERGY_TYPES).odds()
+        draws = list(product(["psychic", "psychic", "grass"], repeat=3))
+
+        exactly_two = sum(draw.count("psychic") == 2 for draw in draws) / len(draws)
+        assert odds.energy_probability("psychic", 2, 3, exactly=True) == pytest.approx(exactly_two)
+        at_least_two = sum(draw.count("psychic") >= 2 for draw in draws) / len(draws)
+        assert odds.energy_probability("psychic", 2, 3) == pytest.approx(at_least_two)
+
+        # Psychic, psychic and one colorless: any three draws with two psychic
+        cost = {"psychic": 2, "colorless": 1}
+        assert odds.energy_for_cost(cost, 3) == pytest.approx(at_least_two)
+        mixed = sum(
+            draw.count("psychic") >= 1 and draw.count("grass") >= 1 for draw in draws
+        ) / len(draws)
+        assert odds.energy_for_cost({"psychic": 1, "grass": 1}, 3) == pytest.approx(mixed)
+        assert odds.energy_for_cost({"fire": 1}, 3) == 0.0
+        assert odds.energy_for_cost({"colorless": 2}, 2) == pytest.approx(1.0)
+
+    def test_cached_per_fingerprint(self, create_deck):
+        deck = create_deck(CARDS, ENERGY_TYPES)
+        reordered = create_deck(CARDS, ENERGY_TYPES)
+        reordered.cards.reverse()
+        assert deck_odds(deck) is deck_odds(reordered)
+        assert deck.odds() is not Deck.from_names(NAMES, ["psychic"]).odds()
@@ -0,0 +1,86 @@
+from collections import Counter
+
+import pytest
+
+from pokepocketsim import Deck, DeckGenome, DeckOptimizer, MatchupCache
+from pokepocketsim.utils import config
+
+POOL = ["Mewtwo EX", "Ralts", "Kirlia", "Gardevoir", "Potion", "Erika", "Giovanni", "Sabrina"]
+
+
+def create_field():
+    return [
+        Deck.from_names(["Mewtwo EX", "Mewtwo EX", "Potion", "Potion"], ["psychic"]),
+        Deck.from_names(["Ralts", "Ralts", "Kirlia", "Gardevoir"], ["psychic"]),
+    ]
+
+
+class TestOptimizer:
+    """
+    TestOptimizer:
+        Verifies the genetic deck optimizer.
+
+        Test Methods:
+            - test_variation_keeps_decks_legal: Random decks, children and mutants are legal
+            - test_successive_halving: Only the best candidates play the most games
+            - test_run_reuses_cached_matchups: A second run with the same cache simulates nothing
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        config.gui_enabled = False
+
+    def create_optimizer(self, **kwargs) -> DeckOptimizer:
+        options = dict(deck_size=6, population_size=6, generations=3, min_games=10, max_games=40)
+        options.update(kwargs)
+        return DeckOptimizer(POOL, create_field(), energy_pool=["psychic", "grass"], **options)
+
+    def assert_legal(self, genome: DeckGenome, optimizer: DeckOptimizer):
+        assert len(genome.cards) == optimizer.deck_size
+        assert max(Counter(genome.cards).values()) <= optimizer.max_copies
+        assert any(name in optimizer.basics for name in genome.cards)
+        assert 1 <= len(genome.energy_types) <= optimizer.max_energy_types
+        assert set(genome.energy_types) <= set(optimizer.energy_pool)
+
+    def test_variation_keeps_decks_legal(self):
+        optimizer = self.create_optimizer(mutation_rate=0.5)
+        population = [optimizer.random_genome() for _ in range(20)]
+        for genome in population:
+            self.assert_legal(genome, optimizer)
+        for parent_a, parent_b in zip(population, population[1:]):
+            self.assert_legal(optimizer.crossover(parent_a, parent_b), optimizer)
+            self.assert_legal(optimizer.mutate(parent_a), optimizer)
+
+        deck = population[0].to_deck()
+        assert len(deck.cards) == 6
+        assert DeckOptimizer(["Ralts", "Kirlia"], create_field(), deck_size=4).energy_pool == [
+            "psychic"
+        ]
+        with pytest.raises(ValueError):
+            DeckOptimizer(["Kirlia", "Gardevoir"], create_field(), deck_size=4)
+
+    def test_successive_halving(self):
+        optimizer = self.create_optimizer()
+        population = [optimizer.random_genome() for _ in range(8)]
+        fitness, simulated, cached = optimizer.evaluate(population)
+
+        unique = set(population)
+        assert set(fitness) == unique
+        top = [genome for genome in unique if fitness[genome].games == 40]
+        assert 1 <= len(top) <= (len(unique) + 3) // 4
+        best = max(fitness, key=lambda genome: fitness[genome][:2])
+        assert fitness[best].games == 40
+        assert simulated + cached >= 2 * len(unique)
+
+    def test_run_reuses_cached_matchups(self):
+        cache = MatchupCache()
+        result = self.create_optimizer(cache=cache).run()
+        assert len(result.history) == 3
+        assert result.simulated > 0
+        assert 0.0 <= result.win_rate <= 1.0
+        assert result.history[0].cached == 0
+
+        again = self.create_optimizer(cache=cache).run()
+        assert again.simulated == 0
+        assert again.best == result.best
+        assert again.to_dict()["win_rate"] == result.win_rate
@@ -0,0 +1,48 @@
+import subprocess
+import sys
+
+import pytest
+
+import pokepocketsim
+from pokepocketsim.utils import config
+
+
+def run(code: str) -> None:
+    """Run the code in a fresh interpreter, so no test imported the package before."""
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+class TestPackage:
+    """
+    TestPackage:
+        Verifies the exports of the package.
+
+        Test Methods:
+            - test_lazy_exports: The simulation tools are loaded on first use
+            - test_submodules_keep_their_names: Submodules and exports do not shadow each other
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        # Disable GUI for testing
+        config.gui_enabled = False
+
+    def test_lazy_exports(self):
+        """Test that importing the package does not import the simulation tools."""
+        run(
+            "import sys, pokepocketsim; "
+            "assert 'pokepocketsim.batch' not in sys.modules; "
+            "pokepocketsim.Env; "
+            "assert 'pokepocketsim.env' in sys.modules"
+        )
+        assert set(pokepocketsim.__all__) <= set(dir(pokepocketsim))
+        with pytest.raises(AttributeError):
+            _ = pokepocketsim.play_everything
+
+    def test_submodules_keep_their_names(self):
+        """Test that importing a submodule leaves the exports of the package alone."""
+        run(
+            "import pokepocketsim.ladder, pokepocketsim.regression as regression; "
+            "from pokepocketsim import sprt; "
+            "assert regression.sprt is sprt and callable(sprt)"
+        )
@@ -0,0 +1,275 @@
+import copy
+import pickle
+import random
+import time
+from collections import Counter
+
+import pytest
+
+from pokepocketsim import Card, Deck, Item, Match, Player
+from pokepocketsim.core.match import MAX_TURNS, _search_subtree
+from pokepocketsim.engine import execute_action, get_available_actions, playout, sample_action
+from pokepocketsim.mechanics.action import Action, ActionNotFoundError, ActionType
+from pokepocketsim.search import MCTS, Expectimax, LeafBuffer, LinearEvaluator, determinize
+from pokepocketsim.utils import config
+
+
+class TestPlanner:
+    """
+    TestPlanner:
+        Verifies the turn planner used by players with evaluate_actions enabled.
+
+        Test Methods:
+            - test_anytime_planner_respects_budget: The anytime planner returns a legal plan in time
+            - test_planner_plays_full_match: A planning bot finishes complete matches
+            - test_deck_outcomes_are_distributions: Chance outcomes of a deck sum to one
+            - test_expectimax_plans_legal_turn: Expectimax returns a playable plan
+            - test_linear_evaluator_matches_evaluate_player: Batched scores match the scalar ones
+            - test_streaming_sequences_and_top_k: The generator and top_k agree with the full list
+            - test_root_parallel_search_matches_serial: Worker processes find the same sequences
+            - test_parallel_subtrees_share_deadline: Subtrees stop at the search's deadline
+            - test_stale_plan_is_replanned: A planned action no longer available plans again
+            - test_mcts_player_mode: MCTS keeps public information and plays full matches
+            - test_playout_is_silent_and_terminal: Playout mode plays to the end without output
+            - test_no_pokemon_loses_in_match_and_playout: Both apply the same rule
+            - test_match_and_playout_share_turn_limit: Both stop after MAX_TURNS turns
+            - test_sample_action_is_uniform: Sampled actions follow the uniform distribution
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self, create_deck):
+        # Disable GUI for testing
+        config.gui_enabled = False
+
+        self.player1 = Player("p1", create_deck(potions=2), is_bot=True)
+        self.player2 = Player("p2", create_deck(), is_bot=True)
+        self.player1.print_actions = False
+        self.player2.print_actions = False
+        self.match = Match(self.player1, self.player2)
+
+        # Put an active card and a bench card in play so the turn has some depth
+        actions = get_available_actions(self.player1)
+        set_active = next(a for a in actions if a.action_type == ActionType.SET_ACTIVE_CARD)
+        execute_action(self.player1, set_active, self.match)
+        self.player1.current_energy = "psychic"
+        self.match.turn = 3
+
+    def test_anytime_planner_respects_budget(self):
+        """Test that the anytime planner returns a legal first action within its budget."""
+        start = time.perf_counter()
+        plan = self.match.get_best_actions_for_player(self.player1, think_ms=20, setup_turn=False)
+        elapsed = time.perf_counter() - start
+
+        assert plan
+        assert elapsed < 0.5
+
+        # The first planned action must be playable from the current state
+        actions = get_available_actions(self.player1)
+        assert any(a.name == plan[0].name for a in actions)
+
+    def test_planner_plays_full_match(self, create_deck):
+        """Test that bots using the anytime planner finish complete matches."""
+        for _ in range(3):
+            bot1 = Player("Bot1", create_deck(potions=2), think_ms=5)
+            bot2 = Player("Bot2", create_deck(), is_bot=True)
+            bot1.print_actions = False
+            bot2.print_actions = False
+            match = Match(bot1, bot2)
+
+            match.play_one_match()
+
+            assert bot1.evaluate_actions
+            assert match.game_over
+
+    def test_deck_outcomes_are_distributions(self):
+        """Test that the draw and energy outcomes of a deck are probability distributions."""
+        deck = Deck(energy_types=["psychic", "psychic", "fire"])
+        deck.add(Card.create_card("Ralts"))
+        deck.add(Card.create_card("Ralts"))
+        deck.add(Item.Potion)
+
+        draws = deck.draw_outcomes()
+        assert sorted(p for _, p in draws) == pytest.approx([1 / 3, 2 / 3])
+        assert dict(deck.energy_outcomes()) == pytest.approx({"psychic": 2 / 3, "fire": 1 / 3})
+
+    def test_expectimax_plans_legal_turn(self):
+        """Test that the expectimax planner returns a plan starting with a playable action."""
+        planner = Expectimax(depth=2, sequence_depth=2, beam_width=2)
+        plan = planner.plan(self.match, self.player1)
+
+        assert plan
+        actions = get_available_actions(self.player1)
+        assert any(a.name == plan[0].name for a in actions)
+        assert len(planner.table) > 0
+
+    def test_linear_evaluator_matches_evaluate_player(self):
+        """Test that the default linear evaluator scores leaves like Player.evaluate_player."""
+        evaluator = LinearEvaluator()
+        buffer = LeafBuffer(evaluator, batch_size=2)
+
+        # Collect some leaves of the turn and compare both ways of scoring them
+        match_copy, player_copy = self.match._copy_for_simulation(self.player1, setup_turn=False)
+        expected = []
+        for sequence, _, leaf_player in Match._iter_sequences(match_copy, player_copy, [], 0, 3):
+            expected.append(Player.evaluate_player(leaf_player))
+            buffer.add(leaf_player, sequence)
+
+        scores = [score for score, _ in buffer.flush()]
+        assert scores == pytest.approx(expected)
+
+        # The turn planner accepts the evaluator in place of evaluate_player
+        plan = self.match.get_best_actions_for_player(
+            self.player1, setup_turn=False, evaluator=evaluator
+        )
+        assert plan
+
+        with pytest.raises(ValueError):
+            LinearEvaluator(weights=[1.0])
+
+    def test_streaming_sequences_and_top_k(self):
+        """Test that streamed sequences are unique and top_k keeps the best of them."""
+        all_sequences = self.match.simulate_turn_actions(self.player1, setup_turn=False)
+        names = [tuple(action.name for action in sequence) for _, sequence in all_sequences]
+        assert len(names) == len(set(names))
+
+        # The generator can be stopped after the first sequence
+        first = next(self.match.iter_turn_actions(self.player1, setup_turn=False))
+        assert first[1]
+
+        best = self.match.top_k(self.player1, 5, setup_turn=False)
+        expected = sorted((evaluation for evaluation, _ in all_sequences), reverse=True)[:5]
+        assert [evaluation for evaluation, _ in best] == expected
+
+    def test_root_parallel_search_matches_serial(self):
+        """Test that the match, its players and their actions pickle, and workers agree."""
+        actions = get_available_actions(self.player1)
+        match, player, restored_actions = pickle.loads(
+            pickle.dumps((self.match, self.player1, actions))
+        )
+        assert [a.name for a in restored_actions] == [a.name for a in actions]
+        execute_action(player, restored_actions[0], match)
+
+        serial = self.match.simulate_turn_actions(self.player1, setup_turn=False)
+        parallel = self.match.simulate_turn_actions(self.player1, setup_turn=False, workers=2)
+        assert sorted(e for e, _ in parallel) == sorted(e for e, _ in serial)
+
+        best = self.match.top_k(self.player1, 3, setup_turn=False, workers=2)
+        expected = sorted((evaluation for evaluation, _ in serial), reverse=True)[:3]
+        assert [evaluation for evaluation, _ in best] == expected
+
+    def test_parallel_subtrees_share_deadline(self):
+        """Test that a subtree started past the search's deadline only searches one action."""
+        match, player = self.match._copy_for_simulation(self.player1, setup_turn=False)
+        snapshot = pickle.dumps((match, player))
+        first_action = get_available_actions(player)[0].name
+
+        late = _search_subtree(snapshot, first_action, None, time.time() - 1, None)
+        assert [len(sequence) for _, sequence in late] == [1]
+        in_time = _search_subtree(snapshot, first_action, None, time.time() + 60, None)
+        assert max(len(sequence) for _, sequence in in_time) > 1
+
+    def test_stale_plan_is_replanned(self):
+        """Test that only a missing planned action makes the player plan its turn again."""
+        stale = Action("Nothing to see", lambda player: None, ActionType.FUNCTION)
+        with pytest.raises(ActionNotFoundError):
+            Action.find_action(get_available_actions(self.player1), stale)
+
+        self.player1.evaluate_actions = True
+        self.player1.think_ms = 20
+        before = self.match.serialize()
+        remaining = self.player1.process_best_actions(self.match, [stale])
+
+        # The first action of the new plan was played instead
+        assert self.match.serialize() != before
+        assert all(action is not stale for action in remaining)
+
+    def test_mcts_player_mode(self, create_deck):
+        """Test that determinization keeps public information and MCTS bots finish matches."""
+        opponent = self.player2
+        hand_size = len(opponent.hand)
+        unseen = sorted(str(card) for card in opponent.hand + opponent.deck.cards)
+        determinize(self.player1, random.Random(0))
+        assert len(opponent.hand) == hand_size
+        assert sorted(str(card) for card in opponent.hand + opponent.deck.cards) == unseen
+
+        plan = MCTS(iterations=30, seed=0).plan(self.match, self.player1)
+        assert plan
+        actions = get_available_actions(self.player1)
+        assert any(a.name == plan[0].name for a in actions)
+
+        for seed in range(2):
+            bot1 = Player(
+                "Bot1", create_deck(potions=2), planner=MCTS(iterations=20, seed=seed)
+            )
+            bot2 = Player("Bot2", create_deck(), planner=MCTS(think_ms=5, seed=seed))
+            bot1.print_actions = False
+            bot2.print_actions = False
+            match = Match(bot1, bot2)
+
+            match.play_one_match()
+
+            assert match.game_over
+
+    def test_playout_is_silent_and_terminal(self, capsys, create_deck):
+        """Test that a playout ends the match without printing and reports the result."""
+        match = Match(Player("a", create_deck(potions=2)), Player("b", create_deck()))
+        capsys.readouterr()
+
+        result = playout(match, rng=random.Random(0))
+
+        assert capsys.readouterr().out == ""
+        assert match.game_over
+        assert result.turns == match.turn
+        assert result.points == (match.starting_player.points, match.second_player.points)
+        assert result.winner in (0, 1, None)
+
+    def test_no_pokemon_loses_in_match_and_playout(self):
+        """Test that a player starting its turn without pokemon loses in both engines."""
+        # The second player's pokemon were all knocked out in the first player's turn
+        self.player2.active_card = None
+        self.player2.bench = []
+
+        match = copy.deepcopy(self.match)
+        random.seed(0)
+        assert match.start_turn()
+        assert match.winner is match.starting_player
+
+        played = copy.deepcopy(self.match)
+        random.seed(0)
+        result = playout(played, rng=random.Random(0))
+        assert result.winner == 0
+        assert result.turns == match.turn
+
+    def test_match_and_playout_share_turn_limit(self):
+        """Test that matches and playouts stop without a winner after the same turn."""
+        self.player2.active_card = Card.create_card("Mewtwo EX")
+        self.match.turn = MAX_TURNS - 1
+
+        match = copy.deepcopy(self.match)
+        assert match.start_turn()
+        assert match.winner is None
+        assert match.turn == MAX_TURNS
+
+        result = playout(copy.deepcopy(self.match), rng=random.Random(0))
+        assert result.winner is None
+        assert result.turns == MAX_TURNS
+
+    def test_sample_action_is_uniform(self):
+        """Test that sample_action draws the listed actions uniformly."""
+        self.player1.bench.append(Card.create_card("Ralts"))
+        actions = get_available_actions(self.player1)
+        expected = Counter(action.name for action in actions)
+        assert len(expected) >= 3
+
+        rng = random.Random(0)
+        n = 20000
+        counts = Counter(sample_action(self.player1, rng).name for _ in range(n))
+
+        assert set(counts) == set(expected)
+        # Every name must be within 5 standard deviations of its expected count
+        for name, multiplicity in expected.items():
+            p = multiplicity / len(actions)
+            assert abs(counts[name] - n * p) < 5 * (n * p * (1 - p)) ** 0.5
+
+        # The state is left untouched
+        assert [a.name for a in get_available_actions(self.player1)] == [a.name for a in actions]
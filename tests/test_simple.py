@@ -1,7 +1,9 @@
+import random
+
 import pytest
 
 from pokepocketsim import Card, Deck, Item, Match, Player
-from pokepocketsim.engine import execute_action, get_available_actions
+from pokepocketsim.engine import execute_action, get_available_actions, playout, sample_action
 from pokepocketsim.mechanics.action import ActionType
 from pokepocketsim.utils import config
 
@@ -30,6 +32,7 @@ class TestMatch:
             - test_get_available_actions: Verifies action discovery works correctly
             - test_execute_action: Tests action execution and state updates
             - test_action_types: Validates different action types are discovered
+            - test_full_bench_is_not_offered: No bench action is discovered on a full bench
             - test_basic_turn_flow: Simulates a basic turn using the engine
     """
 
@@ -111,6 +114,26 @@ class TestMatch:
         assert ActionType.END_TURN in action_types
         assert len(action_types) > 1  # Should have multiple action types
 
+    def test_full_bench_is_not_offered(self):
+        """Test that no bench action is offered on a full bench, so many basics play out."""
+        self.test_player1.active_card = Card.create_card("Ralts")
+        self.test_player1.bench = [Card.create_card("Ralts") for _ in range(3)]
+        self.test_player1.hand = [Card.create_card("Mewtwo EX")]
+
+        assert not any(
+            action.action_type == ActionType.ADD_CARD_TO_BENCH
+            for action in get_available_actions(self.test_player1)
+        )
+        for _ in range(50):
+            action = sample_action(self.test_player1)
+            assert action is None or action.action_type != ActionType.ADD_CARD_TO_BENCH
+
+        for seed in range(20):
+            deck1 = Deck.from_names(["Ralts"] * 6 + ["Mewtwo EX"] * 4, ["psychic"])
+            deck2 = Deck.from_names(["Ralts"] * 6 + ["Mewtwo EX"] * 4, ["psychic"])
+            match = Match(Player("a", deck1), Player("b", deck2))
+            assert playout(match, rng=random.Random(seed)).turns == match.turn
+
     def test_basic_turn_flow(self):
         """Test a basic turn flow using the engine."""
         # Turn 1: Set active card
@@ -228,8 +251,9 @@ class TestMatch:
                 assert match.game_over
                 assert match.turn > 0
 
-                # Verify one player won
-                assert (bot1.points >= 3) or (bot2.points >= 3)
+                # Verify one player won, with 3 points or as the opponent had no pokemon left
+                assert match.winner in (bot1, bot2)
+                assert match.winner.points >= 3 or not match.winner.opponent.active_card_and_bench
 
             except Exception as e:
                 pytest.fail(f"Game {game_num + 1} failed with error: {e}")
@@ -0,0 +1,77 @@
+import json
+
+import pytest
+
+from pokepocketsim import Bot, Deck, Player, parse_bot, sprt
+from pokepocketsim.regression import DEMO_DECK, elo_to_score, score_to_elo, sprt_bounds
+from pokepocketsim.search import MCTS
+from pokepocketsim.ui.cli import main
+from pokepocketsim.utils import config
+
+
+class TestSPRT:
+    """
+    TestSPRT:
+        Verifies the bot specifications and the SPRT regression harness.
+
+        Test Methods:
+            - test_parse_bot: Specifications round trip and configure the player
+            - test_elo_conversions: Scores and elo differences convert both ways
+            - test_sprt_accepts_stronger_bot: A planner beats random play
+            - test_sprt_cli: The command prints a JSON verdict and exits with its code
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        config.gui_enabled = False
+
+    def test_parse_bot(self):
+        bot = parse_bot("mcts:iterations=20,exploration=0.7,weights=25/0.1/5/0/0/0/0")
+        assert bot == Bot("mcts", {"iterations": 20, "exploration": 0.7}, (25.0, 0.1, 5.0, 0.0, 0.0, 0.0, 0.0))
+        assert parse_bot(str(bot)) == bot
+        assert parse_bot("random") == Bot()
+
+        player = Player("A", Deck.from_names(DEMO_DECK, ["psychic"]))
+        bot.configure(player)
+        assert player.evaluate_actions
+        assert isinstance(player.planner, MCTS)
+        assert player.planner.iterations == 20
+
+        with pytest.raises(ValueError):
+            parse_bot("alphazero")
+        with pytest.raises(ValueError):
+            parse_bot("planner:think_ms")
+        # Options of another kind, typos and values that are not numbers
+        for spec in ("planner:iterations=20", "mcts:iteration=20", "expectimax:depth=two"):
+            with pytest.raises(ValueError):
+                parse_bot(spec)
+
+    def test_elo_conversions(self):
+        assert elo_to_score(0) == 0.5
+        assert score_to_elo(elo_to_score(100)) == pytest.approx(100)
+        lower, upper = sprt_bounds(0.05, 0.05)
+        assert lower == pytest.approx(-upper)
+
+    def test_sprt_accepts_stronger_bot(self):
+        result = sprt(
+            parse_bot("random"),
+            parse_bot("planner:think_ms=5"),
+            elo1=50,
+            batch_size=20,
+            max_games=400,
+        )
+        assert result.verdict == "H1"
+        assert result.llr >= result.bounds[1]
+        assert result.result.games % 2 == 0
+        assert result.score > 0.5
+        verdict = result.to_dict()
+        assert verdict["pairs"] == result.result.games // 2
+        assert verdict["new_bot"] == "planner:think_ms=5"
+
+    def test_sprt_cli(self, capsys):
+        code = main(
+            ["sprt", "random", "random", "--elo1", "50", "--batch-size", "20", "--max-games", "40"]
+        )
+        verdict = json.loads(capsys.readouterr().out)
+        assert verdict["games"] <= 40
+        assert code == {"H1": 0, "H0": 1, "inconclusive": 2}[verdict["verdict"]]
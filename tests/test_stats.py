@@ -0,0 +1,104 @@
+import random
+import statistics
+
+import pytest
+
+from pokepocketsim import Match, Player
+from pokepocketsim.data_collector import DataCollector
+from pokepocketsim.stats import CardCounter, Histogram, RunningStats, WinRate, wilson_interval
+from pokepocketsim.utils import config
+
+
+class TestStats:
+    """
+    TestStats:
+        Verifies the online statistics used to aggregate simulation batches.
+
+        Test Methods:
+            - test_running_stats_match_batch_formulas: Welford agrees with the statistics module
+            - test_merged_stats_equal_combined: Merging partial statistics loses nothing
+            - test_wilson_interval: Known values and edge cases of the Wilson interval
+            - test_data_collector_statistics: The data collector counts actions per turn
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        # Disable GUI for testing
+        config.gui_enabled = False
+
+        rng = random.Random(0)
+        self.values = [rng.gauss(30, 8) for _ in range(1000)]
+
+    def test_running_stats_match_batch_formulas(self):
+        """Test that the running mean and variance equal the two-pass ones."""
+        stats = RunningStats()
+        for value in self.values:
+            stats.add(value)
+
+        assert stats.count == len(self.values)
+        assert stats.mean == pytest.approx(statistics.fmean(self.values))
+        assert stats.variance == pytest.approx(statistics.variance(self.values))
+        assert stats.minimum == min(self.values)
+        assert stats.maximum == max(self.values)
+
+    def test_merged_stats_equal_combined(self):
+        """Test that statistics merged from parts equal the statistics of the whole."""
+        whole, first, second = RunningStats(), RunningStats(), RunningStats()
+        whole_histogram = Histogram(0, 60, 12)
+        parts = [Histogram(0, 60, 12), Histogram(0, 60, 12)]
+        for i, value in enumerate(self.values):
+            whole.add(value)
+            (first if i < 300 else second).add(value)
+            whole_histogram.add(value)
+            parts[i % 2].add(value)
+
+        first.merge(second)
+        parts[0].merge(parts[1])
+        assert first.count == whole.count
+        assert first.mean == pytest.approx(whole.mean)
+        assert first.variance == pytest.approx(whole.variance)
+        assert parts[0].to_dict() == whole_histogram.to_dict()
+        assert parts[0].total == len(self.values)
+
+        with pytest.raises(ValueError):
+            parts[0].merge(Histogram(0, 60, 6))
+
+        counters = [CardCounter(), CardCounter()]
+        counters[0].add(["Ralts", "Kirlia"])
+        counters[1].add(["Ralts"])
+        counters[0].merge(counters[1])
+        assert counters[0].most_common(1) == [("Ralts", 2)]
+
+    def test_wilson_interval(self):
+        """Test the Wilson interval against known values and at the edges."""
+        low, high = wilson_interval(50, 100)
+        assert low == pytest.approx(0.4038, abs=1e-4)
+        assert high == pytest.approx(0.5962, abs=1e-4)
+
+        low, high = wilson_interval(0, 10)
+        assert low == 0.0
+        assert 0.0 < high < 0.35
+        assert wilson_interval(0, 0) == (0.0, 1.0)
+
+        win_rate = WinRate()
+        for won in (True, True, False, None):
+            win_rate.add(won)
+        assert win_rate.rate == pytest.approx(0.625)
+        assert win_rate.interval()[0] < 0.625 < win_rate.interval()[1]
+
+    def test_data_collector_statistics(self, tmp_path, create_deck):
+        """Test that the data collector keeps turn statistics, also without rows."""
+        collector = DataCollector(str(tmp_path / "games.csv"), keep_rows=False)
+        player1 = Player("p1", create_deck(potions=2))
+        player2 = Player("p2", create_deck(potions=2))
+        player1.print_actions = False
+        player2.print_actions = False
+        match = Match(player1, player2, data_collector=collector)
+
+        match.play_one_match()
+
+        assert collector.data == []
+        assert collector.actions_per_turn.count > 0
+        assert collector.actions_histogram.total == collector.actions_per_turn.count
+        assert [win_rate.games for win_rate in collector.win_rates.values()] == [1, 1]
+        assert sum(collector.action_counts.counts.values()) > 0